@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Copyright 2016-2018 Europa-Universität Flensburg,
+# Flensburg University of Applied Sciences,
+# Centre for Sustainable Energy Systems
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation; either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# File description
+"""
+This is the application file to export the specifications from the overlying
+grid for all chosen MV grids ahead of the eDisGo runs.
+
+The eTraGo results are imported once from **csv_import_eTraGo** and the
+specifications of all MV grids in ``grid_choice.csv`` in the eDisGo results folder
+(e.g. written by a run with **only_cluster** = ``true``) are written to a Parquet
+dataset partitioned by MV grid ID. In case **etrago_specs_path** in the eDisGo
+settings points to the exported dataset, the eDisGo runs read the specifications
+of their MV grid from there and do not need the eTraGo network.
+"""
+
+import argparse
+import logging
+import os
+
+import pandas as pd
+
+if "READTHEDOCS" not in os.environ:
+    from etrago import Etrago
+
+    from ego.tools.interface import (
+        ETraGoMinimalData,
+        export_etrago_specs,
+        get_csv_folder_hash,
+    )
+    from ego.tools.utilities import define_logging, get_scenario_setting
+
+__copyright__ = (
+    "Flensburg University of Applied Sciences, "
+    "Europa-Universität Flensburg, "
+    "Centre for Sustainable Energy Systems"
+)
+__license__ = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__author__ = "wolf_bunke, maltesc"
+
+logger = logging.getLogger("ego")
+
+
+def export_specs(jsonpath, directory=None):
+    """
+    Exports specifications from the overlying grid for all chosen MV grids.
+
+    Parameters
+    ----------
+    jsonpath : str
+        Path to the scenario settings.
+    directory : str or None
+        Directory to export the specifications to. If None, **etrago_specs_path**
+        from the eDisGo settings is used or, if that is not set either, the folder
+        ``etrago_specs`` in the eDisGo results folder. Default: None.
+
+    """
+    json_file = get_scenario_setting(jsonpath=jsonpath)
+    edisgo_args = json_file["eDisGo"]
+    if directory is None:
+        directory = edisgo_args.get("etrago_specs_path") or os.path.join(
+            edisgo_args["results"], "etrago_specs"
+        )
+
+    grid_choice = pd.read_csv(
+        os.path.join(edisgo_args["results"], "grid_choice.csv"), index_col=0
+    )
+    bus_ids = grid_choice["the_selected_network_id"].astype(int).tolist()
+
+    # load reduced eTraGo network from cache, if possible
+    csv_folder = json_file["eGo"]["csv_import_eTraGo"]
+    compact = edisgo_args.get("compact_etrago_data", False)
+    etrago_cache = edisgo_args.get("etrago_cache", None)
+    etrago_obj = None
+    if etrago_cache is not None:
+        source_hash = get_csv_folder_hash(csv_folder)
+        etrago_obj = ETraGoMinimalData.load(etrago_cache, source_hash, compact)
+    if etrago_obj is None:
+        logger.info("Import eTraGo network from csv files")
+        etrago_network = Etrago(csv_folder_name=csv_folder).disaggregated_network
+        etrago_obj = ETraGoMinimalData(etrago_network, compact=compact)
+        if etrago_cache is not None:
+            etrago_obj.save(etrago_cache, source_hash=source_hash)
+
+    logger.info(f"Export specifications of {len(bus_ids)} MV grids to {directory}")
+    export_etrago_specs(
+        bus_ids,
+        etrago_obj,
+        json_file["eTraGo"]["pf_post_lopf"],
+        edisgo_args["max_cos_phi_renewable"],
+        directory,
+    )
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Export specifications from the overlying grid for all chosen "
+        "MV grids."
+    )
+    parser.add_argument(
+        "--jsonpath",
+        default="scenario_setting.json",
+        help="Path to the scenario settings. Default: scenario_setting.json",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Directory to export the specifications to. Default: "
+        "etrago_specs_path from the eDisGo settings or etrago_specs in the "
+        "eDisGo results folder.",
+    )
+    args = parser.parse_args()
+
+    logger = define_logging(name="ego")
+    logger.info("Start export of specifications")
+
+    export_specs(args.jsonpath, directory=args.output)
@@ -76,10 +76,10 @@ def ego_testing(ego):
         logger.info("ego.edisgo.grid_choice failed testing")
     try:
         logger.info(
-            "ego.edisgo.successfull_grids: {} ".format(ego.edisgo.successfull_grids)
+            "ego.edisgo.successful_grids: {} ".format(ego.edisgo.successful_grids)
         )
     except:
-        logger.info("ego.edisgo.successfull_grids failed testing")
+        logger.info("ego.edisgo.successful_grids failed testing")
     # eGo
     logger.info("ego.total_investment_costs: {} ".format(ego.total_investment_costs))
     logger.info("ego.total_operation_costs: {} ".format(ego.total_operation_costs))
@@ -472,10 +472,62 @@ def etrago_grid_investment(network, json_file, session):
     pass
 
 
+def _get_grid_expansion_costs(edisgo_grid):
+    """Get grid expansion costs of an eDisGo grid.
+
+    Lazily imported eDisGo results provide their grid expansion costs without
+    importing the grid, see
+    :class:`ego.tools.edisgo_integration._LazyEDisGo`.
+
+    Parameters
+    ----------
+    edisgo_grid : :class:`edisgo.EDisGo` or str or Exception
+        eDisGo grid or its error in case the grid failed
+
+    Returns
+    -------
+    None or :pandas:`pandas.DataFrame<dataframe>`
+        Grid expansion costs or None in case no results are available
+    """
+    costs = getattr(edisgo_grid, "grid_expansion_costs", None)
+    if costs is None and hasattr(edisgo_grid, "results"):
+        costs = edisgo_grid.results.grid_expansion_costs
+    return costs
+
+
+def _get_grid_expansion_costs_from_summary(summary):
+    """Get grid expansion costs of all eDisGo grids from the summary of the runs.
+
+    Parameters
+    ----------
+    summary : :pandas:`pandas.DataFrame<dataframe>`
+        Summary of the eDisGo runs, see
+        :attr:`ego.tools.edisgo_integration.EDisGoNetworks.summary`
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<dataframe>`
+        Grid expansion costs of all successfully calculated grids with columns
+        'mv_grid_id', 'voltage_level' and 'total_costs'
+    """
+    columns = {
+        "grid_expansion_costs_mv": "mv",
+        "grid_expansion_costs_mvlv": "mv/lv",
+        "grid_expansion_costs_lv": "lv",
+    }
+    costs = summary.loc[summary["status"] == "success", list(columns)]
+    costs = costs.rename(columns=columns).rename_axis(
+        index="mv_grid_id", columns="voltage_level"
+    )
+    return costs.stack().rename("total_costs").reset_index()
+
+
 def edisgo_grid_investment(edisgo, json_file):
     """
     Function aggregates all costs, based on all calculated eDisGo
-    grids and their weightings
+    grids and their weightings. In case a summary of the eDisGo runs exists,
+    the grid expansion costs are taken from the summary, so that the grids do
+    not need to be imported.
     Parameters
     ----------
     edisgo : :class:`ego.tools.edisgo_integration.EDisGoNetworks`
@@ -490,69 +542,76 @@ def edisgo_grid_investment(edisgo, json_file):
     p = 0.05
     logger.info("For all components T={} and p={} is used".format(t, p))
 
-    costs = pd.DataFrame(columns=["voltage_level", "annuity_costs", "overnight_costs"])
+    # Weighting (absolute weighting of every grid)
+    weights = edisgo.grid_choice.set_index("the_selected_network_id")[
+        "no_of_points_per_cluster"
+    ]
 
-    # Loop through all calculated eDisGo grids
-    for key, value in edisgo.network.items():
-
-        if not hasattr(value, "network"):
-            logger.warning("No results available for grid {}".format(key))
-            continue
-
-        # eDisGo results (overnight costs) for this grid
-        costs_single = value.network.results.grid_expansion_costs
-        costs_single.rename(columns={"total_costs": "overnight_costs"}, inplace=True)
-
-        # continue if this grid was not reinforced
-        if costs_single["overnight_costs"].sum() == 0.0:
-            logger.info("No expansion costs for grid {}".format(key))
-            continue
-
-        # Overnight cost translated in annuity costs
-        costs_single["capital_cost"] = edisgo_convert_capital_costs(
-            costs_single["overnight_costs"], t=t, p=p, json_file=json_file
-        )
-
-        # Weighting (retrieves the singe (absolute) weighting for this grid)
-        choice = edisgo.grid_choice
-        weighting = choice.loc[choice["the_selected_network_id"] == key][
-            "no_of_points_per_cluster"
-        ].values[0]
-
-        costs_single[["capital_cost", "overnight_costs"]] = (
-            costs_single[["capital_cost", "overnight_costs"]] * weighting
-        )
-
-        # Append costs of this grid
-        costs = costs.append(
-            costs_single[["voltage_level", "capital_cost", "overnight_costs"]],
-            ignore_index=True,
-        )
+    # Collect eDisGo results (overnight costs) of all calculated eDisGo grids
+    summary = edisgo.summary
+    if summary is not None:
+        costs = _get_grid_expansion_costs_from_summary(summary)
+    else:
+        costs = {}
+        for key, value in edisgo.network.items():
+            costs_single = _get_grid_expansion_costs(value)
+            if costs_single is None:
+                logger.warning("No results available for grid {}".format(key))
+                continue
+            if not costs_single.empty:
+                costs[key] = costs_single
+        if len(costs) > 0:
+            costs = pd.concat(costs, names=["mv_grid_id", None]).reset_index(level=0)
+            costs = costs[["mv_grid_id", "voltage_level", "total_costs"]]
 
     if len(costs) == 0:
         logger.info("No expansion costs in any MV grid")
         return None
 
-    else:
-        aggr_costs = costs.groupby(["voltage_level"]).sum().reset_index()
+    # skip grids that were not reinforced
+    total_costs = costs.groupby("mv_grid_id")["total_costs"].sum()
+    not_reinforced = total_costs.index[total_costs == 0.0]
+    if len(not_reinforced) > 0:
+        logger.info("No expansion costs for grids {}".format(not_reinforced.tolist()))
+        if len(not_reinforced) == len(total_costs):
+            logger.info("No expansion costs in any MV grid")
+            return None
+        costs = costs[~costs["mv_grid_id"].isin(not_reinforced)]
+
+    costs = costs.rename(columns={"total_costs": "overnight_costs"})
+
+    # Overnight cost translated in annuity costs
+    costs["capital_cost"] = edisgo_convert_capital_costs(
+        costs["overnight_costs"], t=t, p=p, json_file=json_file
+    )
+    weighting = weights.reindex(costs["mv_grid_id"]).to_numpy()
+    costs[["capital_cost", "overnight_costs"]] = costs[
+        ["capital_cost", "overnight_costs"]
+    ].mul(weighting, axis=0)
+
+    aggr_costs = (
+        costs.groupby("voltage_level")[["capital_cost", "overnight_costs"]]
+        .sum()
+        .reset_index()
+    )
 
-        # In eDisGo all costs are in kEuro (eGo only takes Euro)
-        aggr_costs[["capital_cost", "overnight_costs"]] = (
-            aggr_costs[["capital_cost", "overnight_costs"]] * 1000
-        )
+    # In eDisGo all costs are in kEuro (eGo only takes Euro)
+    aggr_costs[["capital_cost", "overnight_costs"]] = (
+        aggr_costs[["capital_cost", "overnight_costs"]] * 1000
+    )
 
-        successfull_grids = edisgo.successfull_grids
-        if successfull_grids < 1:
-            logger.warning(
-                "Only {} % of the grids were calculated.\n".format(
-                    "{:,.2f}".format(successfull_grids * 100)
-                )
-                + "Costs are extrapolated..."
+    successful_grids = edisgo.successful_grids
+    if successful_grids < 1:
+        logger.warning(
+            "Only {} % of the grids were calculated.\n".format(
+                "{:,.2f}".format(successful_grids * 100)
             )
+            + "Costs are extrapolated..."
+        )
 
-            aggr_costs[["capital_cost", "overnight_costs"]] = (
-                aggr_costs[["capital_cost", "overnight_costs"]] / successfull_grids
-            )
+        aggr_costs[["capital_cost", "overnight_costs"]] = (
+            aggr_costs[["capital_cost", "overnight_costs"]] / successful_grids
+        )
 
     return aggr_costs
 
@@ -29,23 +29,32 @@ __copyright__ = (
 __license__ = "GNU Affero General Public License Version 3 (AGPL-3.0)"
 __author__ = "wolf_bunke, maltesc, mltja"
 
+import hashlib
 import json
 import logging
 import os
 import pickle
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import deepcopy
-from datetime import datetime
-from datetime import timedelta as td
-from time import localtime, sleep, strftime
-
-# Import
-from traceback import TracebackException
+from time import localtime, monotonic, strftime
+from zipfile import ZipFile
 
 import dill
 import multiprocess as mp2
+import numpy as np
 import pandas as pd
 
+from ego.tools.executors import (
+    DistributedExecutor,
+    LocalProcessExecutor,
+    LocalThreadExecutor,
+    parallelizer,
+)
+from ego.tools.profiling import PROFILE_FILE_NAME, profile_stage, write_profile_report
+
 if "READTHEDOCS" not in os.environ:
     from edisgo.edisgo import import_edisgo_from_files
     from edisgo.flex_opt.reinforce_grid import enhanced_reinforce_grid
@@ -65,7 +74,10 @@ if "READTHEDOCS" not in os.environ:
     from ego.tools.economics import edisgo_grid_investment
     from ego.tools.interface import (
         ETraGoMinimalData,
+        get_csv_folder_hash,
+        get_etrago_results_for_buses,
         get_etrago_results_per_bus,
+        import_etrago_specs,
         map_etrago_heat_bus_to_district_heating_id,
         rename_generator_carriers_edisgo,
     )
@@ -77,6 +89,30 @@ logger = logging.getLogger(__name__)
 pickle.DEFAULT_PROTOCOL = 4
 dill.settings["protocol"] = 4
 
+# tasks of an eDisGo run and the tasks whose results they need as inputs
+EDISGO_TASK_DEPENDENCIES = {
+    "1_setup_grid": [],
+    "2_specs_overlying_grid": ["1_setup_grid"],
+    "3_temporal_complexity_reduction": ["2_specs_overlying_grid"],
+    "4_optimisation": ["2_specs_overlying_grid", "3_temporal_complexity_reduction"],
+    "5_grid_reinforcement": ["4_optimisation"],
+}
+
+# columns of the summary of the eDisGo run of an MV grid, see
+# EDisGoNetworks.summary
+SUMMARY_COLUMNS = [
+    "mv_grid_id",
+    "status",
+    "runtime",
+    "grid_expansion_costs_mv",
+    "grid_expansion_costs_mvlv",
+    "grid_expansion_costs_lv",
+    "no_of_buses",
+    "no_of_lines",
+    "curtailment_overlying_grid",
+    "curtailment_optimisation",
+]
+
 
 class EDisGoNetworks:
     """
@@ -87,7 +123,9 @@ class EDisGoNetworks:
     json_file : :obj:dict
         Dictionary of the ``scenario_setting.json`` file
     etrago_network: :class:`etrago.tools.io.NetworkScenario`
-        eTraGo network object compiled by :meth:`etrago.appl.etrago`
+        eTraGo network object compiled by :meth:`etrago.appl.etrago` or reduced
+        eTraGo network :class:`~.tools.interface.ETraGoMinimalData` loaded from
+        the cache
 
     """
 
@@ -97,16 +135,31 @@ class EDisGoNetworks:
         self._json_file = json_file
         self._set_scenario_settings()
 
-        # Create reduced eTraGo network
-        self._etrago_network = ETraGoMinimalData(etrago_network)
+        # Create reduced eTraGo network, which is not needed in case specifications
+        # from the overlying grid were exported in advance
+        if self._etrago_specs_path is None:
+            self._etrago_network = self._get_etrago_minimal_data(etrago_network)
+        else:
+            logger.info(
+                f"Specifications from overlying grid are imported from "
+                f"{self._etrago_specs_path}."
+            )
+            self._etrago_network = None
         del etrago_network
 
+        # hash of the eTraGo results to check results of previous runs against
+        if self._resume:
+            self._etrago_hash = self._get_etrago_hash()
+
         # Program information
         self._run_finished = False
 
         # eDisGo Result grids
         self._edisgo_grids = {}
 
+        # Specifications from overlying grid computed in advance, keyed by MV grid ID
+        self._etrago_specs = {}
+
         if self._csv_import:
             self._load_edisgo_results()
             self._successful_grids = self._successful_grids()
@@ -175,6 +228,34 @@ class EDisGoNetworks:
         """
         return self._successful_grids
 
+    @property
+    def summary(self):
+        """
+        Summary of the eDisGo runs of all MV grids
+
+        The summary is read from the file ``summary.parquet`` in the results
+        directory, which is written at the end of the eDisGo runs. It allows to
+        evaluate the results of all MV grids without importing them.
+
+        Returns
+        -------
+        None or :pandas:`pandas.DataFrame<dataframe>`
+            Dataframe with MV grid ID as index and columns 'status' and
+            'runtime' in seconds of the eDisGo run, 'grid_expansion_costs_mv',
+            'grid_expansion_costs_mvlv' and 'grid_expansion_costs_lv' in kEUR,
+            'no_of_buses' and 'no_of_lines' of the grid,
+            'curtailment_overlying_grid', the curtailment required by the
+            overlying grid, and 'curtailment_optimisation', the additional
+            curtailment in the optimisation, in MWh. Columns of MV grids whose
+            run failed are NaN, except for 'status' and 'runtime'. None, if no
+            summary exists.
+
+        """
+        path = os.path.join(self._csv_import or self._results, "summary.parquet")
+        if not os.path.isfile(path):
+            return None
+        return pd.read_parquet(path)
+
     @property
     def grid_investment_costs(self):
         """
@@ -278,17 +359,14 @@ class EDisGoNetworks:
 
     def _init_status(self):
         """
-        Creates a status csv file where statuses of MV grid calculations are tracked.
+        Creates a status file where statuses of MV grid calculations are tracked.
 
         The file is saved to the directory 'status'. Filename indicates date and time
-        the file was created.
-
-        File contains the following information:
-
-        * 'MV grid id' (index)
-        * 'cluster_perc' - percentage of grids represented by this grid
-        * 'start_time' - start time of calculation
-        * 'end_time' - end time of calculation
+        the file was created. The file is an append-only log in JSON lines format,
+        to which all workers append events of the MV grids they calculate, see
+        :meth:`_status_update`. The status of all MV grids is built from the events
+        on demand, see :attr:`status`, and saved as csv file with the same name
+        after the calculation.
 
         """
         self._status_dir = os.path.join(self._json_file["eDisGo"]["results"], "status")
@@ -297,66 +375,213 @@ class EDisGoNetworks:
 
         self._status_file_name = "eGo_" + strftime("%Y-%m-%d_%H%M%S", localtime())
 
-        status = self._grid_choice.copy()
-        status = status.set_index("the_selected_network_id")
-        status.index.names = ["MV grid id"]
-
-        status["cluster_perc"] = (
-            status["no_of_points_per_cluster"]
-            / self._grid_choice["no_of_points_per_cluster"].sum()
+        self._status_file_path = os.path.join(
+            self._status_dir, self._status_file_name + ".jsonl"
         )
+        open(self._status_file_path, "a").close()
 
-        status["start_time"] = "Not started yet"
-        status["end_time"] = "Not finished yet"
+    def _status_update(
+        self,
+        mv_grid_id,
+        event,
+        stage="run",
+        duration=None,
+        outcome=None,
+        message=None,
+        show=False,
+    ):
+        """
+        Appends event of an MV grid calculation to the status file.
 
-        status.drop(
-            ["no_of_points_per_cluster", "represented_grids"], axis=1, inplace=True
-        )
+        Every event is appended as a single line in one write, so that events of
+        workers writing at the same time do not interfere and no event is lost.
 
-        self._status_file_path = os.path.join(
-            self._status_dir, self._status_file_name + ".csv"
-        )
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+        event : str
+            Can be either 'start' or 'end'.
+        stage : str
+            Stage the event belongs to. Can be either 'run' for the calculation of
+            the MV grid or the name of a task. Default: 'run'.
+        duration : float or None
+            Duration of the stage in seconds in case of event 'end', if known.
+            Default: None.
+        outcome : str or None
+            Outcome of the stage in case of event 'end', e.g. 'success', 'failed',
+            'skipped' or 'timeout'. Default: None.
+        message : str or None
+            Further information, e.g. the error of a failed stage. Default: None.
+        show : bool
+            If True, shows a logging message with the event. Default: False.
+
+        """
+        record = {
+            "mv_grid_id": int(mv_grid_id),
+            "stage": stage,
+            "event": event,
+            "time": strftime("%Y-%m-%d %H:%M:%S", localtime()),
+            "duration": duration,
+            "outcome": outcome,
+            "message": message,
+        }
+        line = (json.dumps(record) + "\n").encode()
+        fd = os.open(self._status_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        if show:
+            logger.info(
+                "eDisGo status: MV grid {}, {} {}{}".format(
+                    mv_grid_id,
+                    stage,
+                    event,
+                    "" if outcome is None else f" ({outcome})",
+                )
+            )
 
-        status.to_csv(self._status_file_path)
+    def _status_timeout(self, mv_grid_id):
+        """
+        Marks calculation of MV grid that timed out as ended with outcome 'timeout'.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+
+        """
+        self._status_update(mv_grid_id, "end", outcome="timeout", show=True)
+
+    @staticmethod
+    def _read_status_events(path):
+        """
+        Reads events from status file.
+
+        Parameters
+        ----------
+        path : str
+            Path to status file in JSON lines format.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<DataFrame>`
+            Events in the order they were appended, with columns 'mv_grid_id',
+            'stage', 'event', 'time', 'duration', 'outcome' and 'message'.
 
-    def _status_update(self, mv_grid_id, time, message=None, show=True):
         """
-        Updates status csv file where statuses of MV grid calculations are tracked.
+        columns = [
+            "mv_grid_id",
+            "stage",
+            "event",
+            "time",
+            "duration",
+            "outcome",
+            "message",
+        ]
+        with open(path) as f:
+            # last line may be incomplete in case a worker is just writing it
+            records = []
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        events = pd.DataFrame.from_records(records, columns=columns)
+        events["time"] = pd.to_datetime(events["time"], format="%Y-%m-%d %H:%M:%S")
+        return events
+
+    def _get_run_runtime(self, mv_grid_id):
+        """
+        Runtime of the last eDisGo run of an MV grid from the status file.
 
         Parameters
         ----------
         mv_grid_id : int
             MV grid ID of the ding0 grid.
-        time : str
-            Can be either 'start' to set information on when the calculation started
-            or 'end' to set information on when the calculation ended. In case a
-            message is provided through parameter `message`, the message instead of the
-            time is set.
-        message : str or None (optional)
-            Message to set for 'start_time' or 'end_time'. If None, the current time
-            is set. Default: None.
-        show : bool (optional)
-            If True, shows a logging message with the status information. Default: True.
+
+        Returns
+        -------
+        float or None
+            Seconds between the last start of the run and its subsequent end. None,
+            if the run was not started or has not ended yet.
 
         """
-        status = pd.read_csv(self._status_file_path, index_col=0)
+        events = self._read_status_events(self._status_file_path)
+        runs = events[(events.mv_grid_id == int(mv_grid_id)) & (events.stage == "run")]
+        starts = runs[runs.event == "start"]
+        if starts.empty:
+            return None
+        ends = runs.loc[starts.index[-1] :]
+        ends = ends[ends.event == "end"]
+        if ends.empty:
+            return None
+        return (ends.time.iloc[0] - starts.time.iloc[-1]).total_seconds()
 
-        status["start_time"] = status["start_time"].astype(str)
-        status["end_time"] = status["end_time"].astype(str)
+    @property
+    def status(self):
+        """
+        Status of the MV grid calculations, built from the events in the status file
 
-        if message:
-            now = message
-        else:
-            now = strftime("%Y-%m-%d_%H:%M", localtime())
+        Returns
+        -------
+        None or :pandas:`pandas.DataFrame<dataframe>`
+            Dataframe with 'MV grid id' as index and columns 'cluster_perc'
+            (percentage of grids represented by this grid), 'start_time' and
+            'end_time' of calculation, 'task' that is currently or was last run,
+            'outcome' of calculation and 'runtime' in seconds. None, if no status
+            file exists.
 
-        if time == "start":
-            status.at[mv_grid_id, "start_time"] = now
-        elif time == "end":
-            status.at[mv_grid_id, "end_time"] = now
-        if show:
-            logger.info("\n\neDisGo status: \n\n" + status.to_string() + "\n\n")
+        """
+        if getattr(self, "_status_file_path", None) is None:
+            return None
+        status = self._grid_choice.copy()
+        status = status.set_index("the_selected_network_id")
+        status.index.names = ["MV grid id"]
 
-        status.to_csv(self._status_file_path)
+        status["cluster_perc"] = (
+            status["no_of_points_per_cluster"]
+            / self._grid_choice["no_of_points_per_cluster"].sum()
+        )
+        status = status[["cluster_perc"]].copy()
+        status["start_time"] = "Not started yet"
+        status["end_time"] = "Not finished yet"
+        status["task"] = "Not started yet"
+        status["outcome"] = None
+        status["runtime"] = np.nan
+
+        events = self._read_status_events(self._status_file_path)
+        events = events[events.mv_grid_id.isin(status.index)]
+        if events.empty:
+            return status
+        tasks = (
+            events[(events.stage != "run") & (events.event == "start")]
+            .groupby("mv_grid_id")
+            .stage.last()
+        )
+        status.loc[tasks.index, "task"] = tasks
+        runs = events[events.stage == "run"]
+        starts = runs[runs.event == "start"].groupby("mv_grid_id").time.last()
+        status.loc[starts.index, "start_time"] = starts.dt.strftime("%Y-%m-%d_%H:%M")
+        ends = runs[runs.event == "end"].groupby("mv_grid_id").last()
+        if not ends.empty:
+            status.loc[ends.index, "outcome"] = ends.outcome
+            status.loc[ends.index, "end_time"] = ends.time.dt.strftime("%Y-%m-%d_%H:%M")
+            # grids that did not finish successfully are marked with their task
+            unsuccessful = ends.index[ends.outcome != "success"]
+            status.loc[unsuccessful, "end_time"] = [
+                "{} in task {}".format(outcome.capitalize(), task)
+                for outcome, task in zip(
+                    ends.loc[unsuccessful, "outcome"].astype(str),
+                    status.loc[unsuccessful, "task"],
+                )
+            ]
+            successful = ends[ends.outcome == "success"]
+            status.loc[successful.index, "runtime"] = (
+                successful.time - starts.reindex(successful.index)
+            ).dt.total_seconds()
+        return status
 
     def _update_edisgo_configs(self, edisgo_grid):
         """
@@ -470,6 +695,27 @@ class EDisGoNetworks:
         self._max_cos_phi_renewable = self._edisgo_args["max_cos_phi_renewable"]
         self._results = self._edisgo_args["results"]
         self._max_calc_time = self._edisgo_args["max_calc_time"]
+        self._max_calc_time_per_grid = self._edisgo_args.get(
+            "max_calc_time_per_grid", None
+        )
+        self._compact_etrago_data = self._edisgo_args.get("compact_etrago_data", False)
+        self._share_etrago_data = self._edisgo_args.get("share_etrago_data", False)
+        self._etrago_cache = self._edisgo_args.get("etrago_cache", None)
+        self._etrago_specs_path = self._edisgo_args.get("etrago_specs_path", None)
+        self._longest_job_first = self._edisgo_args.get("longest_job_first", True)
+        self._task_scheduling = self._edisgo_args.get("task_scheduling", False)
+        self._task_retries = self._edisgo_args.get("task_retries", 0)
+        self._task_max_workers = self._edisgo_args.get("task_max_workers", {})
+        self._resume = self._edisgo_args.get("resume", False)
+        self._async_checkpoints = self._edisgo_args.get("async_checkpoints", False)
+        self._executor = self._edisgo_args.get("executor", "process")
+        self._executor_address = self._edisgo_args.get(
+            "executor_address", "0.0.0.0:6000"
+        )
+        self._executor_authkey = self._edisgo_args.get("executor_authkey", None)
+        self._optimisation_workers = self._edisgo_args.get("optimisation_workers", 1)
+        self._profiling = self._edisgo_args.get("profiling", False)
+        self._lazy_results_import = self._edisgo_args.get("lazy_results_import", None)
 
         # Some basic checks
         if self._only_cluster:
@@ -481,25 +727,76 @@ class EDisGoNetworks:
         else:
             self._versioned = False
 
+    def _get_etrago_minimal_data(self, etrago_network):
+        """
+        Creates reduced eTraGo network or loads it from the cache.
+
+        In case a cache directory is given in the eDisGo settings and the eTraGo
+        network was imported from csv files, the reduced network is loaded from
+        the cache if the content of the csv folder did not change since the
+        cache was saved. Otherwise, it is created from the given network and
+        saved to the cache first. In case the reduced network was already loaded
+        from the cache by :class:`~.tools.io.eTraGoResults`, it is used as is.
+
+        Parameters
+        ----------
+        etrago_network : :pypsa:`PyPSA.Network<network>` or \
+            :class:`~.tools.interface.ETraGoMinimalData`
+
+        Returns
+        -------
+        :class:`~.tools.interface.ETraGoMinimalData`
+
+        """
+        if isinstance(etrago_network, ETraGoMinimalData):
+            return etrago_network
+        csv_folder = self._json_file["eGo"].get("csv_import_eTraGo")
+        if self._etrago_cache is None or not csv_folder:
+            return ETraGoMinimalData(etrago_network, compact=self._compact_etrago_data)
+
+        source_hash = get_csv_folder_hash(csv_folder)
+        etrago_minimal_data = ETraGoMinimalData.load(
+            self._etrago_cache,
+            source_hash=source_hash,
+            compact=self._compact_etrago_data,
+        )
+        if etrago_minimal_data is None:
+            ETraGoMinimalData(etrago_network, compact=self._compact_etrago_data).save(
+                self._etrago_cache, source_hash=source_hash
+            )
+            # load saved data in order to use the memory-mapped time series
+            etrago_minimal_data = ETraGoMinimalData.load(
+                self._etrago_cache,
+                source_hash=source_hash,
+                compact=self._compact_etrago_data,
+            )
+        logger.info(f"Reduced eTraGo network loaded from {self._etrago_cache}")
+        return etrago_minimal_data
+
     def _successful_grids(self):
         """
         Calculates the relative number of successfully calculated grids,
         including the cluster weightings
-        """
 
-        total, success, fail = 0, 0, 0
-        for key, value in self._edisgo_grids.items():
-
-            weight = self._grid_choice.loc[
-                self._grid_choice["the_selected_network_id"] == key
-            ]["no_of_points_per_cluster"].values[0]
-
-            total += weight
-            if hasattr(value, "network"):
-                success += weight
-            else:
-                fail += weight
-        return success / total
+        In case a summary of the eDisGo runs exists, the status of the grids is
+        taken from the summary, see :attr:`summary`.
+        """
+        weights = self._grid_choice.set_index("the_selected_network_id")[
+            "no_of_points_per_cluster"
+        ]
+        summary = self.summary
+        if summary is not None:
+            success = summary["status"].reindex(weights.index) == "success"
+            return weights[success.to_numpy()].sum() / weights.sum()
+
+        weights = weights.reindex(list(self._edisgo_grids))
+        # failed MV grids are marked by their error, whereas the results of
+        # successful MV grids are not imported to check them
+        success = [
+            not isinstance(value, (str, Exception))
+            for value in self._edisgo_grids.values()
+        ]
+        return weights[success].sum() / weights.sum()
 
     def _cluster_mv_grids(self):
         """
@@ -527,14 +824,13 @@ class EDisGoNetworks:
         for mv_grid in all_mv_grids:
 
             min_extended = 0.3
-            stor_p_nom = self._etrago_network.storage_units.loc[
-                (self._etrago_network.storage_units["bus"] == str(mv_grid))
-                & (
-                    self._etrago_network.storage_units["p_nom_extendable"]
-                    == True  # noqa: E712
-                )
-                & (self._etrago_network.storage_units["p_nom_opt"] > min_extended)
-                & (self._etrago_network.storage_units["max_hours"] <= 20.0)
+            storage_units = self._etrago_network.get_components(
+                "storage_units", "bus", str(mv_grid)
+            )
+            stor_p_nom = storage_units.loc[
+                (storage_units["p_nom_extendable"] == True)  # noqa: E712
+                & (storage_units["p_nom_opt"] > min_extended)
+                & (storage_units["max_hours"] <= 20.0)
             ]["p_nom_opt"]
 
             if len(stor_p_nom) == 1:
@@ -564,6 +860,102 @@ class EDisGoNetworks:
                 mv_grids.append(int(file))
         return mv_grids
 
+    def _estimate_mv_grid_costs(self, mv_grids):
+        """
+        Estimates calculation costs of the given MV grids.
+
+        The costs are estimated by the number of buses, lines, loads, generators and
+        storage units in the topology files of the grids in **grid_path**. In case
+        the runtime of a grid was recorded in status files of previous runs, the
+        runtime of the latest run is used instead. The estimates of the other grids
+        are then converted to runtimes using the median ratio of runtime to
+        estimate of the grids with both.
+
+        Parameters
+        ----------
+        mv_grids : list(int)
+            MV grid IDs.
+
+        Returns
+        -------
+        :pandas:`pandas.Series<Series>`
+            Estimated costs of the MV grids. Index contains the MV grid IDs.
+
+        """
+
+        def count_components(mv_grid_id):
+            grid_dir = os.path.join(self._grid_path, str(mv_grid_id))
+            if os.path.isdir(os.path.join(grid_dir, "topology")):
+                grid_dir = os.path.join(grid_dir, "topology")
+            count = 0
+            for component in [
+                "buses",
+                "lines",
+                "loads",
+                "generators",
+                "storage_units",
+            ]:
+                path = os.path.join(grid_dir, f"{component}.csv")
+                if os.path.isfile(path):
+                    with open(path) as f:
+                        # header line is not counted
+                        count += sum(1 for _ in f) - 1
+            return count if count > 0 else np.nan
+
+        estimates = pd.Series(
+            [count_components(mv_grid_id) for mv_grid_id in mv_grids],
+            index=mv_grids,
+            dtype=float,
+        )
+
+        # runtimes recorded in status files, later runs overwrite earlier ones
+        runtimes = pd.Series(np.nan, index=mv_grids)
+        status_dir = os.path.join(self._results, "status")
+        if os.path.isdir(status_dir):
+            files = sorted(os.listdir(status_dir))
+            for file in files:
+                name, extension = os.path.splitext(file)
+                if extension == ".jsonl":
+                    events = self._read_status_events(os.path.join(status_dir, file))
+                    runs = events[events.stage == "run"]
+                    starts = (
+                        runs[runs.event == "start"].groupby("mv_grid_id").time.last()
+                    )
+                    ends = runs[runs.event == "end"].groupby("mv_grid_id").last()
+                    ends = ends[ends.outcome == "success"]
+                    runtime = (
+                        ends.time - starts.reindex(ends.index)
+                    ).dt.total_seconds()
+                elif extension == ".csv" and name + ".jsonl" not in files:
+                    # status files of previous versions
+                    status = pd.read_csv(os.path.join(status_dir, file), index_col=0)
+                    runtime = (
+                        pd.to_datetime(
+                            status["end_time"], format="%Y-%m-%d_%H:%M", errors="coerce"
+                        )
+                        - pd.to_datetime(
+                            status["start_time"],
+                            format="%Y-%m-%d_%H:%M",
+                            errors="coerce",
+                        )
+                    ).dt.total_seconds()
+                else:
+                    continue
+                runtime = runtime[runtime.index.isin(mv_grids)].dropna()
+                runtimes[runtime.index] = runtime
+
+        if runtimes.notna().any():
+            seconds_per_component = (runtimes / estimates).median()
+            if not np.isnan(seconds_per_component):
+                estimates *= seconds_per_component
+            else:
+                # no grid has both, wherefore grids with unknown runtime are
+                # started first
+                estimates[:] = np.inf
+            estimates = runtimes.fillna(estimates)
+        # grids without any information are assumed to be of median costs
+        return estimates.fillna(estimates.median()).fillna(0)
+
     def _set_grid_choice(self):
         """
         Sets the grid choice based on the settings file
@@ -643,14 +1035,47 @@ class EDisGoNetworks:
                     "Number of workers limited to {} by user".format(self._max_workers)
                 )
 
-            self._edisgo_grids = set(mv_grids)
-            self._edisgo_grids = parallelizer(
-                mv_grids,
-                lambda *xs: xs[1].run_edisgo(xs[0]),
-                (self,),
-                self._max_calc_time,
-                workers=no_cpu,
-            )
+            if self._optimisation_workers > 1:
+                # every grid may optimise several time intervals at once
+                no_cpu = max(no_cpu // self._optimisation_workers, 1)
+                logger.info(
+                    "Number of workers reduced to {}, as every worker optimises up "
+                    "to {} time intervals in parallel".format(
+                        no_cpu, self._optimisation_workers
+                    )
+                )
+
+            if self._longest_job_first:
+                # grids that take longest are started first, so that no single
+                # grid is left running at the end while the other workers are idle
+                costs = self._estimate_mv_grid_costs(mv_grids)
+                mv_grids = costs.sort_values(
+                    ascending=False, kind="stable"
+                ).index.tolist()
+                logger.info(
+                    "MV grids are calculated in order of estimated costs: "
+                    "{}".format(mv_grids)
+                )
+
+            if self._share_etrago_data and self._etrago_network is not None:
+                # workers map the time series files instead of receiving copies
+                self._etrago_network.to_memmap(
+                    os.path.join(results_dir, "etrago_timeseries")
+                )
+
+            executor = self._get_executor(no_cpu)
+            if self._task_scheduling:
+                self._edisgo_grids = self._run_edisgo_tasks_parallel(mv_grids, executor)
+            else:
+                self._edisgo_grids = parallelizer(
+                    mv_grids,
+                    lambda *xs: xs[1].run_edisgo(xs[0]),
+                    (self,),
+                    self._max_calc_time,
+                    max_calc_time_per_grid=self._max_calc_time_per_grid,
+                    timeout_callback=self._status_timeout,
+                    executor=executor,
+                )
 
             for g in mv_grids:
                 if g not in self._edisgo_grids:
@@ -658,6 +1083,18 @@ class EDisGoNetworks:
 
         else:
             logger.info("Run eDisGo sequencial")
+            if (
+                "2_specs_overlying_grid" in self._json_file["eDisGo"]["tasks"]
+                and self._etrago_network is not None
+            ):
+                # specifications from overlying grid for all MV grids, which are
+                # computed at once on first access
+                self._etrago_specs = get_etrago_results_for_buses(
+                    self._grid_choice["the_selected_network_id"].astype(int).tolist(),
+                    self._etrago_network,
+                    self._pf_post_lopf,
+                    self._max_cos_phi_renewable,
+                )
             no_grids = len(self._grid_choice)
             count = 0
             for idx, row in self._grid_choice.iterrows():
@@ -674,12 +1111,131 @@ class EDisGoNetworks:
                     logger.exception("MV grid {} failed: \n".format(mv_grid_id))
                 count += 1
 
+        mv_grid_ids = self._grid_choice["the_selected_network_id"].tolist()
+        status = self.status
+        if status is not None:
+            logger.info("\n\neDisGo status: \n\n" + status.to_string() + "\n\n")
+            status.to_csv(os.path.splitext(self._status_file_path)[0] + ".csv")
+        self._save_summary_index(mv_grid_ids, status)
+        if self._profiling:
+            write_profile_report(self._results, mv_grid_ids)
+
         self._csv_import = self._json_file["eDisGo"]["results"]
         self._save_edisgo_results()
         self._load_edisgo_results()
         self._run_finished = True
 
-    def run_edisgo(self, mv_grid_id):
+    def _get_executor(self, workers):
+        """
+        Returns executor calculating the MV grids in parallel.
+
+        The executor is chosen by setting **executor** in the eDisGo settings:
+        ``"process"`` calculates the MV grids in processes and ``"thread"`` in
+        threads on this machine. ``"distributed"`` hands the MV grids to workers
+        connecting to **executor_address** with **executor_authkey**, which can run
+        on other machines, see :func:`~.executors.run_worker`. In that case the
+        eDisGo results directory needs to be on a filesystem shared by all
+        machines.
+
+        Parameters
+        ----------
+        workers : int
+            Maximum number of workers. For executor ``"distributed"``, the number of
+            workers is only given by the connected workers.
+
+        Returns
+        -------
+        :class:`~.executors.LocalProcessExecutor`, \
+        :class:`~.executors.LocalThreadExecutor` or \
+        :class:`~.executors.DistributedExecutor`
+
+        """
+        if self._executor == "process":
+            return LocalProcessExecutor(workers=workers)
+        elif self._executor == "thread":
+            return LocalThreadExecutor(workers=workers)
+        elif self._executor == "distributed":
+            host, port = self._executor_address.rsplit(":", 1)
+            logger.info(
+                "MV grids are calculated by workers connecting to {}".format(
+                    self._executor_address
+                )
+            )
+            return DistributedExecutor(
+                address=(host, int(port)), authkey=self._executor_authkey
+            )
+        else:
+            raise ValueError(
+                "Executor {} is not supported. Choose 'process', 'thread' or "
+                "'distributed'.".format(self._executor)
+            )
+
+    def _run_edisgo_tasks_parallel(self, mv_grids, executor):
+        """
+        Runs the tasks of all given MV grids in parallel.
+
+        Every task of every MV grid is calculated separately, as soon as the tasks
+        it depends on are finished, see :attr:`EDISGO_TASK_DEPENDENCIES`. This way,
+        tasks of different grids interleave, the number of workers can be limited
+        per task and a failed task can be retried without running the previous tasks
+        again. Results are handed from one task to the next through the results
+        directory of the MV grid. Only the time series set to zero at time steps
+        that did not converge in the overlying grid are not saved by the temporal
+        complexity reduction, wherefore the optimisation sets them to zero again,
+        see :meth:`_set_time_steps_not_converged_to_zero`.
+
+        Parameters
+        ----------
+        mv_grids : list(int)
+            MV grid IDs in the order in which they are started.
+        executor : :class:`~.executors.LocalProcessExecutor`, \
+        :class:`~.executors.LocalThreadExecutor` or \
+        :class:`~.executors.DistributedExecutor`
+            Executor calculating the tasks, see :meth:`_get_executor`.
+
+        Returns
+        -------
+        dict
+            Dictionary with MV grid ID as key and results directory of the MV grid
+            as value. For grids with a failed task, the exception is given instead.
+            Grids with a task that timed out are not contained.
+
+        """
+        tasks = self._json_file["eDisGo"]["tasks"]
+        keys = [(mv_grid_id, task) for mv_grid_id in mv_grids for task in tasks]
+        timed_out = set()
+
+        def timeout_callback(key):
+            timed_out.add(key[0])
+            self._status_timeout(key[0])
+
+        results = parallelizer(
+            keys,
+            lambda *xs: xs[1].run_edisgo(xs[0][0], tasks=[xs[0][1]]),
+            (self,),
+            self._max_calc_time,
+            max_calc_time_per_grid=self._max_calc_time_per_grid,
+            timeout_callback=timeout_callback,
+            dependencies={
+                (mv_grid_id, task): [
+                    (mv_grid_id, _) for _ in EDISGO_TASK_DEPENDENCIES[task]
+                ]
+                for mv_grid_id, task in keys
+            },
+            retries=self._task_retries,
+            task_groups={key: key[1] for key in keys},
+            group_limits=self._task_max_workers,
+            executor=executor,
+        )
+
+        # errors are given per task and need to be assigned to the MV grid
+        for key in [_ for _ in results if isinstance(_, tuple)]:
+            results[key[0]] = results.pop(key)
+        for mv_grid_id in timed_out:
+            results.pop(mv_grid_id, None)
+        return results
+
+    def run_edisgo(self, mv_grid_id, tasks=None):
         """
         Performs a single eDisGo run
 
@@ -687,18 +1243,26 @@ class EDisGoNetworks:
         ----------
         mv_grid_id : int
             MV grid ID of the ding0 grid
+        tasks : list(str) or None
+            Tasks to run. Results of previous tasks that are not run are imported
+            from the results directory of the MV grid. If None, all tasks given in
+            the eDisGo settings are run. Default: None.
 
         Returns
         -------
-        :class:`edisgo.EDisGo`
-            Returns the complete eDisGo container, also including results
+        dict
+            Dictionary with MV grid ID as key and results directory of the MV grid
+            as value
 
         """
-        self._status_update(mv_grid_id, "start", show=False)
-
         # ##################### general settings ####################
         config = self._json_file
-        scenario = config["eTraGo"]["scn_name"]
+        all_tasks = config["eDisGo"]["tasks"]
+        if tasks is None:
+            tasks = all_tasks
+        t_start = monotonic()
+        if tasks[0] == all_tasks[0]:
+            self._status_update(mv_grid_id, "start")
         engine = database.get_engine(config=config)
 
         # results directory
@@ -724,11 +1288,457 @@ class EDisGoNetworks:
         # to the same file
         logger = logging.getLogger("edisgo.external.ego._run_edisgo")
 
+        # results of one task are handed to the next task in memory, and in case
+        # of asynchronous checkpoints saved in the background meanwhile
         edisgo_grid = None
         time_intervals = None
+        if self._async_checkpoints:
+            checkpointer = ThreadPoolExecutor(max_workers=1)
+        else:
+            checkpointer = None
+        checkpoints = []
+        task_hashes = self._get_task_hashes(mv_grid_id) if self._resume else {}
+
+        def finish_checkpoints(wait):
+            """
+            Handles results saved in the background and marks their tasks as
+            finished. If `wait` is False, only results that are already saved are
+            handled.
+            """
+            while checkpoints and (wait or checkpoints[0][2].done()):
+                task, task_hash, checkpoint = checkpoints.pop(0)
+                # raises exception in case saving failed
+                checkpoint.result()
+                if self._resume:
+                    self._set_task_hash(mv_grid_id, task, task_hash)
+
+        task = None
+        try:
+            for task in tasks:
+                finish_checkpoints(wait=False)
+                task_hash = None
+                if self._resume:
+                    task_hash = self._get_task_hash(mv_grid_id, task, task_hashes)
+                    if self._task_is_done(mv_grid_id, task, task_hash):
+                        logger.info(
+                            f"MV grid {mv_grid_id}: Skip task '{task}', as its "
+                            f"results from a previous run are valid."
+                        )
+                        self._status_update(
+                            mv_grid_id, "end", stage=task, outcome="skipped"
+                        )
+                        # the next task imports the results from the results
+                        # directory, wherefore all results need to be saved
+                        finish_checkpoints(wait=True)
+                        edisgo_grid = None
+                        time_intervals = None
+                        continue
+                    # results are invalid until the task is finished
+                    self._set_task_hash(mv_grid_id, task, None)
+                    task_hashes[task] = task_hash
+                t_start_task = monotonic()
+                self._status_update(mv_grid_id, "start", stage=task)
+                edisgo_grid, time_intervals, checkpoint = self._run_edisgo_task(
+                    mv_grid_id,
+                    task,
+                    edisgo_grid,
+                    time_intervals,
+                    logger,
+                    engine,
+                    checkpointer=checkpointer,
+                )
+                self._status_update(
+                    mv_grid_id,
+                    "end",
+                    stage=task,
+                    duration=monotonic() - t_start_task,
+                    outcome="success",
+                )
+                if checkpoint is not None:
+                    checkpoints.append((task, task_hash, checkpoint))
+                elif self._resume:
+                    self._set_task_hash(mv_grid_id, task, task_hash)
+            finish_checkpoints(wait=True)
+        except Exception as e:
+            runtime = monotonic() - t_start if tasks[0] == all_tasks[0] else None
+            self._status_update(
+                mv_grid_id,
+                "end",
+                duration=runtime,
+                outcome="failed",
+                message=f"{task}: {e!r}",
+                show=True,
+            )
+            if runtime is None:
+                runtime = self._get_run_runtime(mv_grid_id)
+            self._save_summary(mv_grid_id, "failed", runtime)
+            raise
+        finally:
+            if checkpointer is not None:
+                checkpointer.shutdown()
+
+        if tasks[-1] == all_tasks[-1]:
+            runtime = monotonic() - t_start if tasks[0] == all_tasks[0] else None
+            self._status_update(
+                mv_grid_id,
+                "end",
+                duration=runtime,
+                outcome="success",
+                show=True,
+            )
+            if runtime is None:
+                # tasks were run in separate calls, wherefore the runtime is taken
+                # from the start and end of the run in the status file
+                runtime = self._get_run_runtime(mv_grid_id)
+            self._save_summary(mv_grid_id, "success", runtime, edisgo_grid)
+
+        return {mv_grid_id: results_dir}
+
+    def _save_summary(self, mv_grid_id, status, runtime, edisgo_grid=None):
+        """
+        Saves summary of the eDisGo run of an MV grid to its results directory.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+        status : str
+            Outcome of the eDisGo run, 'success' or 'failed'.
+        runtime : float or None
+            Runtime of the eDisGo run in seconds.
+        edisgo_grid : :class:`edisgo.EDisGo` or None
+            EDisGo object resulting from the last task. In case it is None, the
+            results of the grid are taken from the previous summary of the MV
+            grid, if the eDisGo run succeeded, e.g. because all tasks were skipped.
+            Default: None.
+
+        """
+        results_dir = os.path.join(self._results, str(mv_grid_id))
+        os.makedirs(results_dir, exist_ok=True)
+        path = os.path.join(results_dir, "summary.json")
+        summary = {"mv_grid_id": mv_grid_id, "status": status, "runtime": runtime}
+        if edisgo_grid is not None:
+            summary.update(_summarize_edisgo_grid(edisgo_grid))
+        elif status == "success" and os.path.isfile(path):
+            with open(path) as f:
+                previous_summary = json.load(f)
+            summary = dict(previous_summary, **summary)
+        # write to temporary file first, so that the file is never incomplete
+        with open(path + ".tmp", "w") as f:
+            json.dump(summary, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _save_summary_index(self, mv_grid_ids, status=None):
+        """
+        Gathers the summaries of the eDisGo runs of the MV grids in one file.
+
+        The summaries are saved to ``summary.parquet`` in the results directory,
+        see :attr:`summary`. MV grids that have no summary, e.g. because their
+        run timed out, are added with their outcome given in the status.
+
+        Parameters
+        ----------
+        mv_grid_ids : list(int)
+            MV grid IDs.
+        status : :pandas:`pandas.DataFrame<dataframe>` or None
+            Status of the eDisGo runs, see :attr:`status`. Default: None.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Summary of the eDisGo runs of the MV grids.
+
+        """
+        summaries = []
+        for mv_grid_id in mv_grid_ids:
+            path = os.path.join(self._results, str(mv_grid_id), "summary.json")
+            if os.path.isfile(path):
+                with open(path) as f:
+                    summaries.append(json.load(f))
+                continue
+            outcome = None
+            if status is not None and mv_grid_id in status.index:
+                outcome = status.at[mv_grid_id, "outcome"]
+            summaries.append({"mv_grid_id": mv_grid_id, "status": outcome})
+        summary = pd.DataFrame.from_records(summaries, columns=SUMMARY_COLUMNS)
+        summary = summary.set_index("mv_grid_id")
+        summary[SUMMARY_COLUMNS[2:]] = summary[SUMMARY_COLUMNS[2:]].astype(float)
+        summary.to_parquet(os.path.join(self._results, "summary.parquet"))
+        logger.info(
+            "Summary of {} MV grids saved to {}.".format(len(summary), self._results)
+        )
+        return summary
+
+    def _get_etrago_hash(self):
+        """
+        Returns hash of the eTraGo results the specifications from the overlying
+        grid are obtained from.
+
+        In case the specifications were exported in advance, the exported
+        specifications are hashed. Otherwise the csv files the eTraGo results are
+        imported from or, in case eTraGo is run, the eTraGo settings are hashed.
+
+        Returns
+        -------
+        str
+
+        """
+        csv_folder = self._json_file["eGo"].get("csv_import_eTraGo")
+        if self._etrago_specs_path is not None:
+            return get_csv_folder_hash(self._etrago_specs_path)
+        elif csv_folder:
+            return get_csv_folder_hash(csv_folder)
+        return hashlib.sha256(
+            json.dumps(self._json_file["eTraGo"], sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _get_task_outputs(self, task, mv_grid_id=None):
+        """
+        Returns files in the results directory of an MV grid written by a task.
+
+        The EDisGo object resulting from the task is always saved to the first
+        file.
+
+        Parameters
+        ----------
+        task : str
+            Task of the eDisGo run.
+        mv_grid_id : int or None
+            MV grid ID of the ding0 grid. If given, the OPF results of the time
+            intervals selected in the temporal complexity reduction are included in
+            the outputs of the optimisation. Default: None.
+
+        Returns
+        -------
+        list(str)
+
+        """
+        scenario = self._json_file["eTraGo"]["scn_name"]
+        suffix = "_lowflex" if scenario.endswith("_lowflex") else ""
+        outputs = {
+            "1_setup_grid": ["grid_data.zip"],
+            "2_specs_overlying_grid": [f"grid_data_overlying_grid{suffix}.zip"],
+            "3_temporal_complexity_reduction": ["selected_time_intervals.csv"],
+            "4_optimisation": [f"grid_data_optimisation{suffix}.zip"],
+            "5_grid_reinforcement": [f"grid_data_reinforcement_{scenario}.zip"],
+        }[task]
+        if task == "4_optimisation" and mv_grid_id is not None:
+            path = os.path.join(
+                self._results, str(mv_grid_id), "selected_time_intervals.csv"
+            )
+            if os.path.exists(path):
+                time_steps = pd.read_csv(path, index_col=0)["time_steps"]
+                outputs = outputs + [
+                    f"opf_results_{time_interval}{suffix}.zip"
+                    for time_interval in time_steps.dropna().index
+                ]
+        return outputs
+
+    def _get_task_hashes(self, mv_grid_id):
+        """
+        Returns hashes of the tasks of an MV grid that were finished.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+
+        Returns
+        -------
+        dict
+            Dictionary with task as key and hash of the task as value.
+
+        """
+        path = os.path.join(self._results, str(mv_grid_id), "task_hashes.json")
+        if not os.path.isfile(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _set_task_hash(self, mv_grid_id, task, task_hash):
+        """
+        Sets hash of a finished task of an MV grid.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+        task : str
+            Task of the eDisGo run.
+        task_hash : str or None
+            Hash of the task. If None, the hash of the task is removed.
+
+        """
+        task_hashes = self._get_task_hashes(mv_grid_id)
+        if task_hash is None:
+            task_hashes.pop(task, None)
+        else:
+            task_hashes[task] = task_hash
+        results_dir = os.path.join(self._results, str(mv_grid_id))
+        os.makedirs(results_dir, exist_ok=True)
+        path = os.path.join(results_dir, "task_hashes.json")
+        # write to temporary file first, so that the file is never incomplete
+        with open(path + ".tmp", "w") as f:
+            json.dump(task_hashes, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _get_task_hash(self, mv_grid_id, task, task_hashes=None):
+        """
+        Returns hash of the settings and inputs of a task of an MV grid.
+
+        The hash comprises the eDisGo settings that influence the results, the
+        scenario, the inputs of the task, i.e. the ding0 grid for task
+        '1_setup_grid' and the eTraGo results for task '2_specs_overlying_grid',
+        and the hashes of the tasks it depends on. Results of a task therefore also
+        become invalid in case a task it depends on is run again with different
+        settings or inputs.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+        task : str
+            Task of the eDisGo run.
+        task_hashes : dict or None
+            Hashes of the tasks of the MV grid, see :meth:`_get_task_hashes`. If
+            None, the hashes are read from the results directory. Default: None.
+
+        Returns
+        -------
+        str
+
+        """
+        # settings that only influence how the calculation is run
+        runtime_settings = [
+            "parallelization",
+            "max_calc_time",
+            "max_calc_time_per_grid",
+            "max_workers",
+            "tasks",
+            "results",
+            "only_cluster",
+            "longest_job_first",
+            "task_scheduling",
+            "task_retries",
+            "task_max_workers",
+            "resume",
+            "async_checkpoints",
+            "executor",
+            "executor_address",
+            "executor_authkey",
+            "optimisation_workers",
+            "profiling",
+            "lazy_results_import",
+            "compact_etrago_data",
+            "share_etrago_data",
+            "etrago_cache",
+            "etrago_specs_path",
+        ]
+        if task == "1_setup_grid":
+            inputs = get_csv_folder_hash(os.path.join(self._grid_path, str(mv_grid_id)))
+        elif task == "2_specs_overlying_grid":
+            inputs = self._etrago_hash
+        else:
+            inputs = None
+        if task_hashes is None:
+            task_hashes = self._get_task_hashes(mv_grid_id)
+        description = {
+            "task": task,
+            "settings": {
+                key: value
+                for key, value in self._json_file["eDisGo"].items()
+                if key not in runtime_settings
+            },
+            "scenario": self._json_file["eTraGo"]["scn_name"],
+            "pf_post_lopf": self._json_file["eTraGo"].get("pf_post_lopf"),
+            "inputs": inputs,
+            "dependencies": {
+                dependency: task_hashes.get(dependency)
+                for dependency in EDISGO_TASK_DEPENDENCIES[task]
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(description, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _task_is_done(self, mv_grid_id, task, task_hash):
+        """
+        Checks whether results of a task of an MV grid from a previous run are valid.
+
+        Results are valid in case the task was finished with the same hash and all
+        files written by the task exist.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+        task : str
+            Task of the eDisGo run.
+        task_hash : str
+            Current hash of the task, see :meth:`_get_task_hash`.
+
+        Returns
+        -------
+        bool
+
+        """
+        results_dir = os.path.join(self._results, str(mv_grid_id))
+        return self._get_task_hashes(mv_grid_id).get(task) == task_hash and all(
+            os.path.exists(os.path.join(results_dir, output))
+            for output in self._get_task_outputs(task, mv_grid_id)
+        )
+
+    def _run_edisgo_task(
+        self,
+        mv_grid_id,
+        task,
+        edisgo_grid,
+        time_intervals,
+        logger,
+        engine,
+        checkpointer=None,
+    ):
+        """
+        Runs a single task of an eDisGo run and saves its results.
+
+        The inputs of every task are the results of the tasks it depends on, see
+        :attr:`EDISGO_TASK_DEPENDENCIES`. In case they are not given, they are
+        imported from the results directory of the MV grid.
+
+        Parameters
+        ----------
+        mv_grid_id : int
+            MV grid ID of the ding0 grid.
+        task : str
+            Task to run.
+        edisgo_grid : :class:`edisgo.EDisGo` or None
+            EDisGo object resulting from the previous task or None, in case it
+            needs to be imported.
+        time_intervals : :pandas:`pandas.DataFrame<DataFrame>` or None
+            Time intervals selected in the temporal complexity reduction or None, in
+            case they need to be imported.
+        logger : logger handler
+        engine : :sqlalchemy:`sqlalchemy.Engine<sqlalchemy.engine.Engine>`
+            Database engine.
+        checkpointer : :class:`concurrent.futures.ThreadPoolExecutor` or None
+            Executor to save the results of the task in the background. If None,
+            results are saved before the task returns. Default: None.
+
+        Returns
+        -------
+        tuple(:class:`edisgo.EDisGo`, :pandas:`pandas.DataFrame<DataFrame>`, \
+        :class:`concurrent.futures.Future`)
+            EDisGo object and time intervals to hand to the next task, and future
+            of the results being saved in the background or None.
+
+        """
+        config = self._json_file
+        scenario = config["eTraGo"]["scn_name"]
+        results_dir = os.path.join(self._results, str(mv_grid_id))
+        checkpoint = None
 
         # ################### task: setup grid ##################
-        if "1_setup_grid" in config["eDisGo"]["tasks"]:
+        if task == "1_setup_grid":
             # data is always imported for the full flex scenario, wherefore in case
             # a low-flex scenario is given, the lowflex-extension is dropped for the
             # data import
@@ -736,10 +1746,13 @@ class EDisGoNetworks:
                 scn = scenario.split("_")[0]
             else:
                 scn = scenario
-            edisgo_grid = self._run_edisgo_task_setup_grid(
-                mv_grid_id, scn, logger, config, engine
-            )
-            edisgo_grid.save(
+            with self._profile(results_dir, task):
+                edisgo_grid = self._run_edisgo_task_setup_grid(
+                    mv_grid_id, scn, logger, config, engine
+                )
+            checkpoint = self._save_edisgo_grid(
+                edisgo_grid,
+                checkpointer,
                 directory=os.path.join(results_dir, "grid_data"),
                 save_topology=True,
                 save_timeseries=True,
@@ -753,32 +1766,36 @@ class EDisGoNetworks:
                 archive_type="zip",
                 parameters={"grid_expansion_results": ["equipment_changes"]},
             )
-            if "2_specs_overlying_grid" not in config["eDisGo"]["tasks"]:
-                return {edisgo_grid.topology.id: results_dir}
 
         # ################### task: specs overlying grid ##################
-        if "2_specs_overlying_grid" in config["eDisGo"]["tasks"]:
+        elif task == "2_specs_overlying_grid":
             if edisgo_grid is None:
                 grid_path = os.path.join(results_dir, "grid_data.zip")
-                edisgo_grid = import_edisgo_from_files(
-                    edisgo_path=grid_path,
-                    import_topology=True,
-                    import_timeseries=True,
-                    import_results=True,
-                    import_electromobility=True,
-                    import_heat_pump=True,
-                    import_dsm=True,
-                    import_overlying_grid=False,
-                    from_zip_archive=True,
-                )
+                with self._profile(
+                    results_dir, f"import {os.path.basename(grid_path)}"
+                ):
+                    edisgo_grid = import_edisgo_from_files(
+                        edisgo_path=grid_path,
+                        import_topology=True,
+                        import_timeseries=True,
+                        import_results=True,
+                        import_electromobility=True,
+                        import_heat_pump=True,
+                        import_dsm=True,
+                        import_overlying_grid=False,
+                        from_zip_archive=True,
+                    )
                 edisgo_grid.legacy_grids = False
-            edisgo_grid = self._run_edisgo_task_specs_overlying_grid(
-                edisgo_grid, scenario, logger, config, engine
-            )
+            with self._profile(results_dir, task):
+                edisgo_grid = self._run_edisgo_task_specs_overlying_grid(
+                    edisgo_grid, scenario, logger, config, engine
+                )
             zip_name = "grid_data_overlying_grid"
             if scenario in ["eGon2035_lowflex", "eGon100RE_lowflex"]:
                 zip_name += "_lowflex"
-            edisgo_grid.save(
+            checkpoint = self._save_edisgo_grid(
+                edisgo_grid,
+                checkpointer,
                 directory=os.path.join(results_dir, zip_name),
                 save_topology=True,
                 save_timeseries=True,
@@ -795,54 +1812,67 @@ class EDisGoNetworks:
 
         # ################### task: temporal complexity reduction ##################
         # task temporal complexity reduction is optional
-        if "3_temporal_complexity_reduction" in config["eDisGo"]["tasks"]:
+        elif task == "3_temporal_complexity_reduction":
             if edisgo_grid is None:
                 if scenario in ["eGon2035", "eGon100RE"]:
                     zip_name = "grid_data_overlying_grid.zip"
-                else:
-                    zip_name = "grid_data_overlying_grid_lowflex.zip"
-                grid_path = os.path.join(results_dir, zip_name)
-                edisgo_grid = import_edisgo_from_files(
-                    edisgo_path=grid_path,
-                    import_topology=True,
-                    import_timeseries=True,
-                    import_results=True,
-                    import_electromobility=True,
-                    import_heat_pump=True,
-                    import_dsm=True,
-                    import_overlying_grid=True,
-                    from_zip_archive=True,
-                )
+                else:
+                    zip_name = "grid_data_overlying_grid_lowflex.zip"
+                grid_path = os.path.join(results_dir, zip_name)
+                with self._profile(
+                    results_dir, f"import {os.path.basename(grid_path)}"
+                ):
+                    edisgo_grid = import_edisgo_from_files(
+                        edisgo_path=grid_path,
+                        import_topology=True,
+                        import_timeseries=True,
+                        import_results=True,
+                        import_electromobility=True,
+                        import_heat_pump=True,
+                        import_dsm=True,
+                        import_overlying_grid=True,
+                        from_zip_archive=True,
+                    )
                 edisgo_grid.legacy_grids = False
-            time_intervals = self._run_edisgo_task_temporal_complexity_reduction(
-                edisgo_grid, logger, config
+            with self._profile(results_dir, task):
+                time_steps = list(
+                    self._run_edisgo_task_temporal_complexity_reduction(
+                        edisgo_grid, logger, config
+                    )
+                )
+            time_intervals = pd.DataFrame(
+                {"time_steps": time_steps},
+                index=["time_interval_1", "time_interval_2"],
             )
 
-        # determine whether work flow ends here or continues, and if it continues
-        # whether time intervals need to be loaded
-        if "4_optimisation" not in config["eDisGo"]["tasks"]:
-            return {edisgo_grid.topology.id: results_dir}
-
         # ########################## task: optimisation ##########################
-        if "4_optimisation" in config["eDisGo"]["tasks"]:
+        elif task == "4_optimisation":
+            # time series at non-converged time steps are set to zero in the
+            # temporal complexity reduction, which is only handed over in memory
+            set_not_converged_to_zero = edisgo_grid is None or time_intervals is None
             if edisgo_grid is None:
                 if scenario in ["eGon2035", "eGon100RE"]:
                     zip_name = "grid_data_overlying_grid.zip"
                 else:
                     zip_name = "grid_data_overlying_grid_lowflex.zip"
                 grid_path = os.path.join(results_dir, zip_name)
-                edisgo_grid = import_edisgo_from_files(
-                    edisgo_path=grid_path,
-                    import_topology=True,
-                    import_timeseries=True,
-                    import_results=True,
-                    import_electromobility=True,
-                    import_heat_pump=True,
-                    import_dsm=True,
-                    import_overlying_grid=True,
-                    from_zip_archive=True,
-                )
+                with self._profile(
+                    results_dir, f"import {os.path.basename(grid_path)}"
+                ):
+                    edisgo_grid = import_edisgo_from_files(
+                        edisgo_path=grid_path,
+                        import_topology=True,
+                        import_timeseries=True,
+                        import_results=True,
+                        import_electromobility=True,
+                        import_heat_pump=True,
+                        import_dsm=True,
+                        import_overlying_grid=True,
+                        from_zip_archive=True,
+                    )
                 edisgo_grid.legacy_grids = False
+            if set_not_converged_to_zero:
+                self._set_time_steps_not_converged_to_zero(edisgo_grid, logger, config)
             if time_intervals is None:
                 # load time intervals
                 time_intervals = pd.read_csv(
@@ -857,13 +1887,16 @@ class EDisGoNetworks:
                             periods=int(time_steps.split("=")[-2].split(",")[0]),
                             freq="H",
                         )
-            edisgo_grid = self._run_edisgo_task_optimisation(
-                edisgo_grid, scenario, logger, time_intervals, results_dir
-            )
+            with self._profile(results_dir, task):
+                edisgo_grid = self._run_edisgo_task_optimisation(
+                    edisgo_grid, scenario, logger, time_intervals, results_dir
+                )
             zip_name = "grid_data_optimisation"
             if scenario in ["eGon2035_lowflex", "eGon100RE_lowflex"]:
                 zip_name += "_lowflex"
-            edisgo_grid.save(
+            checkpoint = self._save_edisgo_grid(
+                edisgo_grid,
+                checkpointer,
                 directory=os.path.join(results_dir, zip_name),
                 save_topology=True,
                 save_timeseries=True,
@@ -872,37 +1905,47 @@ class EDisGoNetworks:
                 save_electromobility=False,
                 save_dsm=False,
                 save_heatpump=False,
-                save_overlying_grid=False,
+                # overlying grid is needed for the summary of the run
+                save_overlying_grid=True,
                 reduce_memory=True,
                 archive=True,
                 archive_type="zip",
                 parameters={"grid_expansion_results": ["equipment_changes"]},
             )
-            if "5_grid_reinforcement" not in config["eDisGo"]["tasks"]:
-                return {edisgo_grid.topology.id: results_dir}
 
         # ########################## reinforcement ##########################
-        if "5_grid_reinforcement" in config["eDisGo"]["tasks"]:
+        elif task == "5_grid_reinforcement":
             if edisgo_grid is None:
                 if scenario in ["eGon2035", "eGon100RE"]:
                     zip_name = "grid_data_optimisation.zip"
                 else:
                     zip_name = "grid_data_optimisation_lowflex.zip"
                 grid_path = os.path.join(results_dir, zip_name)
-                edisgo_grid = import_edisgo_from_files(
-                    edisgo_path=grid_path,
-                    import_topology=True,
-                    import_timeseries=True,
-                    import_results=True,
-                    import_electromobility=False,
-                    import_heat_pump=False,
-                    import_dsm=False,
-                    import_overlying_grid=False,
-                    from_zip_archive=True,
-                )
+                with self._profile(
+                    results_dir, f"import {os.path.basename(grid_path)}"
+                ):
+                    edisgo_grid = import_edisgo_from_files(
+                        edisgo_path=grid_path,
+                        import_topology=True,
+                        import_timeseries=True,
+                        import_results=True,
+                        import_electromobility=False,
+                        import_heat_pump=False,
+                        import_dsm=False,
+                        # OPF results and overlying grid are needed for the
+                        # summary of the run, see _summarize_edisgo_grid
+                        import_opf_results=True,
+                        import_overlying_grid=True,
+                        from_zip_archive=True,
+                    )
                 edisgo_grid.legacy_grids = False
-            edisgo_grid = self._run_edisgo_task_grid_reinforcement(edisgo_grid, logger)
-            edisgo_grid.save(
+            with self._profile(results_dir, task):
+                edisgo_grid = self._run_edisgo_task_grid_reinforcement(
+                    edisgo_grid, logger
+                )
+            checkpoint = self._save_edisgo_grid(
+                edisgo_grid,
+                checkpointer,
                 directory=os.path.join(
                     results_dir, f"grid_data_reinforcement_{scenario}"
                 ),
@@ -918,9 +1961,70 @@ class EDisGoNetworks:
                 archive_type="zip",
             )
 
-        self._status_update(mv_grid_id, "end")
+        else:
+            raise ValueError(f"Unknown eDisGo task {task}.")
+
+        return edisgo_grid, time_intervals, checkpoint
+
+    def _save_edisgo_grid(self, edisgo_grid, checkpointer, **kwargs):
+        """
+        Saves EDisGo object, in the background in case an executor is given.
+
+        Parameters
+        ----------
+        edisgo_grid : :class:`edisgo.EDisGo`
+            EDisGo object to save.
+        checkpointer : :class:`concurrent.futures.ThreadPoolExecutor` or None
+            Executor to save the EDisGo object in the background. If None, the
+            object is saved right away.
+        kwargs :
+            Parameters of :meth:`edisgo.EDisGo.save`.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future` or None
+            Future of the EDisGo object being saved in the background or None.
+
+        """
+        directory = kwargs["directory"]
+
+        def save(edisgo_obj):
+            with self._profile(
+                os.path.dirname(directory), f"save {os.path.basename(directory)}"
+            ):
+                edisgo_obj.save(**kwargs)
+
+        if checkpointer is None:
+            save(edisgo_grid)
+            return None
+        # the next task changes the EDisGo object while it is saved, wherefore a
+        # copy is saved
+        return checkpointer.submit(save, deepcopy(edisgo_grid))
+
+    def _profile(self, results_dir, stage):
+        """
+        Returns context manager profiling a stage of an eDisGo run.
+
+        In case profiling is switched on, the profile of the stage is appended to
+        the profile file in the results directory of the MV grid, see
+        :func:`ego.tools.profiling.profile_stage`. Otherwise, the stage is not
+        profiled.
+
+        Parameters
+        ----------
+        results_dir : str
+            Results directory of the MV grid.
+        stage : str
+            Name of stage.
+
+        Returns
+        -------
+        context manager
 
-        return {edisgo_grid.topology.id: results_dir}
+        """
+        if not self._profiling:
+            return nullcontext()
+        return profile_stage(os.path.join(results_dir, PROFILE_FILE_NAME), stage)
 
     def _run_edisgo_task_setup_grid(self, mv_grid_id, scenario, logger, config, engine):
         """
@@ -971,7 +2075,10 @@ class EDisGoNetworks:
             logger.error(msg)
             raise Exception(msg)
 
-        edisgo_grid = import_edisgo_from_files(edisgo_path=grid_path)
+        with self._profile(
+            os.path.join(self._results, str(mv_grid_id)), "import ding0 grid"
+        ):
+            edisgo_grid = import_edisgo_from_files(edisgo_path=grid_path)
         edisgo_grid.legacy_grids = False
         # overwrite configs
         edisgo_grid._config = Config()
@@ -1063,12 +2170,19 @@ class EDisGoNetworks:
         logger.info("Start task 'specs_overlying_grid'.")
 
         logger.info("Get specifications from eTraGo.")
-        specs = get_etrago_results_per_bus(
-            edisgo_grid.topology.id,
-            self._etrago_network,
-            self._pf_post_lopf,
-            self._max_cos_phi_renewable,
-        )
+        # use specifications computed in advance, if available
+        specs = self._etrago_specs.pop(edisgo_grid.topology.id, None)
+        if specs is None and self._etrago_specs_path is not None:
+            specs = import_etrago_specs(
+                edisgo_grid.topology.id, self._etrago_specs_path
+            )
+        elif specs is None:
+            specs = get_etrago_results_per_bus(
+                edisgo_grid.topology.id,
+                self._etrago_network,
+                self._pf_post_lopf,
+                self._max_cos_phi_renewable,
+            )
         snapshots = specs["timeindex"]
 
         # get time steps that don't converge in overlying grid
@@ -1358,11 +2472,14 @@ class EDisGoNetworks:
 
         return edisgo_grid
 
-    def _run_edisgo_task_temporal_complexity_reduction(
-        self, edisgo_grid, logger, config
-    ):
+    def _set_time_steps_not_converged_to_zero(self, edisgo_grid, logger, config):
         """
-        Runs the temporal complexity reduction to select most critical time periods.
+        Sets time series data at time steps that did not converge in the overlying
+        grid to zero.
+
+        The EDisGo object is changed in place. As the changed time series are not
+        saved by the temporal complexity reduction, this is done again in case the
+        optimisation imports its input from the results directory.
 
         Parameters
         ----------
@@ -1371,16 +2488,13 @@ class EDisGoNetworks:
         logger : logger handler
         config : dict
             Dictionary with configuration data.
-        engine : :sqlalchemy:`sqlalchemy.Engine<sqlalchemy.engine.Engine>`
-            Database engine.
 
         Returns
         -------
-        :class:`edisgo.EDisGo`
+        list
+            Time steps that did not converge in the overlying grid.
 
         """
-        logger.info("Start task 'temporal complexity reduction'.")
-
         # get non-converging time steps
         try:
             convergence = pd.read_csv(
@@ -1423,6 +2537,35 @@ class EDisGoNetworks:
                         ts.loc[ts_not_converged, :] = 0
                     setattr(edisgo_grid.overlying_grid, attr, ts)
 
+        return ts_not_converged
+
+    def _run_edisgo_task_temporal_complexity_reduction(
+        self, edisgo_grid, logger, config
+    ):
+        """
+        Runs the temporal complexity reduction to select most critical time periods.
+
+        Parameters
+        ----------
+        edisgo_grid : :class:`edisgo.EDisGo`
+            EDisGo object.
+        logger : logger handler
+        config : dict
+            Dictionary with configuration data.
+        engine : :sqlalchemy:`sqlalchemy.Engine<sqlalchemy.engine.Engine>`
+            Database engine.
+
+        Returns
+        -------
+        :class:`edisgo.EDisGo`
+
+        """
+        logger.info("Start task 'temporal complexity reduction'.")
+
+        ts_not_converged = self._set_time_steps_not_converged_to_zero(
+            edisgo_grid, logger, config
+        )
+
         # distribute overlying grid data
         logger.info("Distribute overlying grid data.")
         edisgo_grid = distribute_overlying_grid_requirements(edisgo_grid)
@@ -1617,49 +2760,209 @@ class EDisGoNetworks:
         # storage units) have a time series
         edisgo_grid.apply_heat_pump_operating_strategy()
 
+        intervals = [
+            (ti, time_intervals.at[ti, "time_steps"])
+            for ti in time_intervals.index
+            if time_intervals.at[ti, "time_steps"] is not None
+        ]
         timeindex = pd.Index([])
-        for ti in time_intervals.index:
-            time_steps = time_intervals.at[ti, "time_steps"]
-            if time_steps is None:
-                continue
-            else:
-                timeindex = timeindex.append(pd.Index(time_steps))
-                # copy edisgo object
-                edisgo_copy = deepcopy(edisgo_grid)
-                # temporal complexity reduction
-                reduce_timeseries_data_to_given_timeindex(edisgo_copy, time_steps)
-
-                # spatial complexity reduction
-                edisgo_copy.spatial_complexity_reduction(
-                    mode="kmeansdijkstra",
-                    cluster_area="feeder",
-                    reduction_factor=reduction_factor,
-                    reduction_factor_not_focused=False,
+        for ti, time_steps in intervals:
+            timeindex = timeindex.append(pd.Index(time_steps))
+
+        def optimise_time_interval(interval):
+            return self._run_edisgo_task_optimisation_interval(
+                edisgo_grid,
+                scenario,
+                logger,
+                interval[0],
+                interval[1],
+                results_dir,
+                reduction_factor,
+            )
+
+        # time intervals are independent of each other and are optimised in
+        # threads, as the optimisation itself runs in a separate julia process
+        workers = min(self._optimisation_workers, self._max_workers, len(intervals))
+        if workers > 1:
+            logger.info(
+                "Optimise {} time intervals with {} workers.".format(
+                    len(intervals), workers
+                )
+            )
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                edisgo_copies = list(pool.map(optimise_time_interval, intervals))
+        else:
+            edisgo_copies = [optimise_time_interval(_) for _ in intervals]
+
+        if edisgo_copies:
+            # write flexibility dispatch results of all time intervals to spatially
+            # unreduced edisgo object at once
+            for attr in [
+                "loads_active_power",
+                "loads_reactive_power",
+                "generators_active_power",
+                "generators_reactive_power",
+            ]:
+                setattr(
+                    edisgo_grid.timeseries,
+                    "_" + attr,
+                    _write_back_time_series(
+                        getattr(edisgo_grid.timeseries, "_" + attr),
+                        [
+                            getattr(edisgo_copy.timeseries, attr)
+                            for edisgo_copy in edisgo_copies
+                        ],
+                    ),
+                )
+            for attr in ["storage_units_active_power", "storage_units_reactive_power"]:
+                try:
+                    storage_units_ts = getattr(edisgo_grid.timeseries, "_" + attr)
+                except AttributeError:
+                    storage_units_ts = pd.DataFrame(
+                        index=edisgo_grid.timeseries.timeindex
+                    )
+                setattr(
+                    edisgo_grid.timeseries,
+                    "_" + attr,
+                    _write_back_time_series(
+                        storage_units_ts,
+                        [
+                            getattr(edisgo_copy.timeseries, attr)
+                            for edisgo_copy in edisgo_copies
+                        ],
+                        align_columns=False,
+                    ),
                 )
 
-                # OPF
-                # flexibilities in full flex: DSM, decentral and central PtH units,
-                # curtailment, EVs, storage units
-                # flexibilities in low flex: curtailment, storage units
-                psa_net = edisgo_copy.to_pypsa()
-                if scenario in ["eGon2035", "eGon100RE"]:
-                    flexible_loads = edisgo_copy.dsm.p_max.columns
-                    # flexible_hps = (
-                    #     edisgo_copy.heat_pump.thermal_storage_units_df.index.values
-                    # )
-                    flexible_cps = psa_net.loads.loc[
-                        psa_net.loads.index.str.contains("home")
-                        | (psa_net.loads.index.str.contains("work"))
-                    ].index.values
-                else:
-                    flexible_loads = []
-                    # flexible_hps = []
-                    flexible_cps = []
-                flexible_hps = edisgo_copy.heat_pump.heat_demand_df.columns.values
-                flexible_storage_units = (
-                    edisgo_copy.topology.storage_units_df.index.values
+            # write OPF results back
+            edisgo_grid.opf_results.overlying_grid = pd.concat(
+                [edisgo_grid.opf_results.overlying_grid]
+                + [
+                    edisgo_copy.opf_results.overlying_grid
+                    for edisgo_copy in edisgo_copies
+                ]
+            )
+            edisgo_grid.opf_results.battery_storage_t.p = pd.concat(
+                [edisgo_grid.opf_results.battery_storage_t.p]
+                + [
+                    edisgo_copy.opf_results.battery_storage_t.p
+                    for edisgo_copy in edisgo_copies
+                ]
+            )
+            edisgo_grid.opf_results.battery_storage_t.e = pd.concat(
+                [edisgo_grid.opf_results.battery_storage_t.e]
+                + [
+                    edisgo_copy.opf_results.battery_storage_t.e
+                    for edisgo_copy in edisgo_copies
+                ]
+            )
+            # grid slacks, e.g. curtailment needed in the grid
+            grid_slacks_t = edisgo_grid.opf_results.grid_slacks_t
+            for attr in grid_slacks_t._attributes():
+                setattr(
+                    grid_slacks_t,
+                    attr,
+                    pd.concat(
+                        [getattr(grid_slacks_t, attr)]
+                        + [
+                            getattr(edisgo_copy.opf_results.grid_slacks_t, attr)
+                            for edisgo_copy in edisgo_copies
+                        ]
+                    ),
                 )
 
+        edisgo_grid.timeseries.timeindex = timeindex
+        return edisgo_grid
+
+    def _run_edisgo_task_optimisation_interval(
+        self,
+        edisgo_grid,
+        scenario,
+        logger,
+        time_interval,
+        time_steps,
+        results_dir,
+        reduction_factor,
+    ):
+        """
+        Runs the dispatch optimisation for a single time interval.
+
+        The optimisation is conducted on a temporally and spatially reduced copy of
+        the EDisGo object, so that the given EDisGo object is not changed.
+
+        Parameters
+        ----------
+        edisgo_grid : :class:`edisgo.EDisGo`
+            EDisGo object.
+        scenario : str
+            Name of scenario to define flexible components, see
+            :meth:`_run_edisgo_task_optimisation`.
+        logger : logger handler
+        time_interval : str
+            Name of time interval, used in the names of the OPF solution file and
+            the OPF results archive.
+        time_steps : :pandas:`pandas.DatetimeIndex<DatetimeIndex>`
+            Time steps of time interval.
+        results_dir : str
+            Directory where to store OPF results.
+        reduction_factor : float
+            Reduction factor to use in spatial complexity reduction.
+
+        Returns
+        -------
+        :class:`edisgo.EDisGo`
+            Reduced copy of EDisGo object with OPF results.
+
+        """
+        logger.info("Start optimisation of {}.".format(time_interval))
+        # copy edisgo object, only including time series of given time steps
+        edisgo_copy = _reduced_deepcopy(edisgo_grid, time_steps)
+        # temporal complexity reduction of remaining data
+        reduce_timeseries_data_to_given_timeindex(edisgo_copy, time_steps)
+
+        # spatial complexity reduction
+        edisgo_copy.spatial_complexity_reduction(
+            mode="kmeansdijkstra",
+            cluster_area="feeder",
+            reduction_factor=reduction_factor,
+            reduction_factor_not_focused=False,
+        )
+
+        # OPF
+        # flexibilities in full flex: DSM, decentral and central PtH units,
+        # curtailment, EVs, storage units
+        # flexibilities in low flex: curtailment, storage units
+        psa_net = edisgo_copy.to_pypsa()
+        if scenario in ["eGon2035", "eGon100RE"]:
+            flexible_loads = edisgo_copy.dsm.p_max.columns
+            # flexible_hps = (
+            #     edisgo_copy.heat_pump.thermal_storage_units_df.index.values
+            # )
+            flexible_cps = psa_net.loads.loc[
+                psa_net.loads.index.str.contains("home")
+                | (psa_net.loads.index.str.contains("work"))
+            ].index.values
+        else:
+            flexible_loads = []
+            # flexible_hps = []
+            flexible_cps = []
+        flexible_hps = edisgo_copy.heat_pump.heat_demand_df.columns.values
+        flexible_storage_units = edisgo_copy.topology.storage_units_df.index.values
+
+        # eDisGo names the OPF solution file after the grid ID and the number of
+        # time steps, wherefore the name of the time interval is added, so that
+        # time intervals optimised at the same time do not overwrite each other's
+        # solution file
+        to_powermodels = edisgo_copy.to_powermodels
+
+        def to_powermodels_time_interval(*args, **kwargs):
+            pm, hv_flex_dict = to_powermodels(*args, **kwargs)
+            pm["name"] = "{}_{}".format(pm["name"], time_interval)
+            return pm, hv_flex_dict
+
+        edisgo_copy.to_powermodels = to_powermodels_time_interval
+        try:
+            with self._profile(results_dir, f"pm_optimize {time_interval}"):
                 edisgo_copy.pm_optimize(
                     flexible_cps=flexible_cps,
                     flexible_hps=flexible_hps,
@@ -1670,80 +2973,26 @@ class EDisGoNetworks:
                     silence_moi=False,
                     method="soc",
                 )
-
-                # save OPF results
-                zip_name = f"opf_results_{ti}"
-                if scenario in ["eGon2035_lowflex", "eGon100RE_lowflex"]:
-                    zip_name += "_lowflex"
-                edisgo_copy.save(
-                    directory=os.path.join(results_dir, zip_name),
-                    save_topology=True,
-                    save_timeseries=False,
-                    save_results=False,
-                    save_opf_results=True,
-                    reduce_memory=True,
-                    archive=True,
-                    archive_type="zip",
-                )
-
-                # write flexibility dispatch results to spatially unreduced edisgo
-                # object
-                edisgo_grid.timeseries._loads_active_power.loc[
-                    time_steps, :
-                ] = edisgo_copy.timeseries.loads_active_power
-                edisgo_grid.timeseries._loads_reactive_power.loc[
-                    time_steps, :
-                ] = edisgo_copy.timeseries.loads_reactive_power
-                edisgo_grid.timeseries._generators_active_power.loc[
-                    time_steps, :
-                ] = edisgo_copy.timeseries.generators_active_power
-                edisgo_grid.timeseries._generators_reactive_power.loc[
-                    time_steps, :
-                ] = edisgo_copy.timeseries.generators_reactive_power
-
-                try:
-                    edisgo_grid.timeseries._storage_units_active_power
-                except AttributeError:
-                    edisgo_grid.timeseries.storage_units_active_power = pd.DataFrame(
-                        index=edisgo_grid.timeseries.timeindex
-                    )
-                edisgo_grid.timeseries._storage_units_active_power.loc[
-                    time_steps,
-                    edisgo_copy.timeseries.storage_units_active_power.columns,
-                ] = edisgo_copy.timeseries.storage_units_active_power
-                try:
-                    edisgo_grid.timeseries._storage_units_reactive_power
-                except AttributeError:
-                    edisgo_grid.timeseries.storage_units_reactive_power = pd.DataFrame(
-                        index=edisgo_grid.timeseries.timeindex
-                    )
-                edisgo_grid.timeseries._storage_units_reactive_power.loc[
-                    time_steps,
-                    edisgo_copy.timeseries.storage_units_reactive_power.columns,
-                ] = edisgo_copy.timeseries.storage_units_reactive_power
-
-                # write OPF results back
-                edisgo_grid.opf_results.overlying_grid = pd.concat(
-                    [
-                        edisgo_grid.opf_results.overlying_grid,
-                        edisgo_copy.opf_results.overlying_grid,
-                    ]
-                )
-                edisgo_grid.opf_results.battery_storage_t.p = pd.concat(
-                    [
-                        edisgo_grid.opf_results.battery_storage_t.p,
-                        edisgo_copy.opf_results.battery_storage_t.p,
-                    ]
-                )
-                edisgo_grid.opf_results.battery_storage_t.e = pd.concat(
-                    [
-                        edisgo_grid.opf_results.battery_storage_t.e,
-                        edisgo_copy.opf_results.battery_storage_t.e,
-                    ]
-                )
-
-        edisgo_grid.timeseries.timeindex = timeindex
-        return edisgo_grid
+        finally:
+            del edisgo_copy.to_powermodels
+
+        # save OPF results
+        zip_name = f"opf_results_{time_interval}"
+        if scenario in ["eGon2035_lowflex", "eGon100RE_lowflex"]:
+            zip_name += "_lowflex"
+        self._save_edisgo_grid(
+            edisgo_copy,
+            None,
+            directory=os.path.join(results_dir, zip_name),
+            save_topology=True,
+            save_timeseries=False,
+            save_results=False,
+            save_opf_results=True,
+            reduce_memory=True,
+            archive=True,
+            archive_type="zip",
+        )
+        return edisgo_copy
 
     def _run_edisgo_task_grid_reinforcement(self, edisgo_grid, logger):
         """
@@ -1788,6 +3037,16 @@ class EDisGoNetworks:
         """
         Loads eDisGo data for all specified grids
 
+        The results of every MV grid are imported from the archive saved by the
+        last task of the eDisGo run. In case **lazy_results_import** is set, every
+        MV grid is represented by a :class:`_LazyEDisGo` proxy, which only imports
+        the EDisGo object on first attribute access, and provides its grid
+        expansion costs without importing the grid. In case it is not set, the
+        proxies are also used if a summary of the eDisGo runs exists, see
+        :attr:`summary`, as the status and grid expansion costs of the grids are
+        then taken from the summary. Otherwise, the archives are imported
+        concurrently in up to **max_workers** threads.
+
         Returns
         --------
         dict[]
@@ -1803,12 +3062,18 @@ class EDisGoNetworks:
             lambda x: eval(x["represented_grids"]), axis=1
         )
 
-        for idx, row in self._grid_choice.iterrows():
-            mv_grid_id = int(row["the_selected_network_id"])
-
-            try:
-                edisgo_grid = import_edisgo_from_files(
-                    edisgo_path=os.path.join(self._csv_import, str(mv_grid_id)),
+        archive_name = [
+            output
+            for task in self._json_file["eDisGo"]["tasks"]
+            for output in self._get_task_outputs(task)
+            if output.endswith(".zip")
+        ][-1]
+        proxies = {}
+        for mv_grid_id in self._grid_choice["the_selected_network_id"].astype(int):
+            path = os.path.join(self._csv_import, str(mv_grid_id), archive_name)
+            if os.path.isfile(path):
+                proxies[mv_grid_id] = _LazyEDisGo(
+                    path,
                     import_topology=True,
                     import_timeseries=False,
                     import_results=True,
@@ -1820,14 +3085,31 @@ class EDisGoNetworks:
                         "grid_expansion_results": ["grid_expansion_costs"],
                     },
                 )
+                self._edisgo_grids[mv_grid_id] = proxies[mv_grid_id]
+            else:
+                self._edisgo_grids[mv_grid_id] = "This grid failed to reimport"
+                logger.warning("MV grid {} could not be loaded".format(mv_grid_id))
 
-                self._edisgo_grids[mv_grid_id] = edisgo_grid
+        lazy_results_import = self._lazy_results_import
+        if lazy_results_import is None:
+            lazy_results_import = self.summary is not None
+        if lazy_results_import or not proxies:
+            return
 
+        def load(mv_grid_id):
+            try:
+                edisgo_grid = proxies[mv_grid_id].load()
                 logger.info("Imported MV grid {}".format(mv_grid_id))
-            except:  # noqa: E722
-                self._edisgo_grids[mv_grid_id] = "This grid failed to reimport"
-
+                return edisgo_grid
+            except Exception:
                 logger.warning("MV grid {} could not be loaded".format(mv_grid_id))
+                return "This grid failed to reimport"
+
+        with ThreadPoolExecutor(
+            max_workers=max(min(self._max_workers, len(proxies)), 1)
+        ) as pool:
+            for mv_grid_id, edisgo_grid in zip(proxies, pool.map(load, proxies)):
+                self._edisgo_grids[mv_grid_id] = edisgo_grid
 
 
 class _ETraGoData:
@@ -1962,173 +3244,251 @@ class _ETraGoData:
         )
 
 
-def parallelizer(
-    ding0_id_list,
-    func,
-    func_arguments,
-    max_calc_time,
-    workers=mp2.cpu_count(),
-    worker_lifetime=1,
-):
+class _LazyEDisGo:
     """
-    Use python multiprocessing toolbox for parallelization
+    Proxy of an EDisGo object saved to a zip archive.
 
-    Several grids are analyzed in parallel based on your custom function that
-    defines the specific application of eDisGo.
+    The EDisGo object is imported on first access of one of its attributes, after
+    which the proxy behaves like the EDisGo object. The grid expansion costs are
+    read from the archive without importing the EDisGo object.
 
     Parameters
     ----------
-    ding0_id_list : list of int
-        List of ding0 grid data IDs (also known as HV/MV substation IDs)
-    func : any function
-        Your custom function that shall be parallelized
-    func_arguments : tuple
-        Arguments to custom function ``func``
-    workers: int
-        Number of parallel process
-    worker_lifetime : int
-        Bunch of grids sequentially analyzed by a worker
-
-    Notes
-    -----
-    Please note, the following requirements for the custom function which is to
-    be executed in parallel
-
-    #. It must return an instance of the type :class:`~.edisgo.EDisGo`.
-    #. The first positional argument is the MV grid district id (as int). It is
-       prepended to the tuple of arguments ``func_arguments``
+    path : str
+        Path to zip archive the EDisGo object was saved to.
+    kwargs :
+        Parameters of :func:`edisgo.edisgo.import_edisgo_from_files`.
 
-
-    Returns
-    -------
-    containers : dict of :class:`~.edisgo.EDisGo`
-        Dict of EDisGo instances keyed by its ID
     """
 
-    def collect_pool_results(result):
+    def __init__(self, path, **kwargs):
+        self._path = path
+        self._import_kwargs = kwargs
+        self._edisgo_obj = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
         """
-        Store results from parallelized calculation in structured manner
+        Path to zip archive of the EDisGo object.
+
+        Returns
+        -------
+        str
 
-        Parameters
-        ----------
-        result: :class:`~.edisgo.EDisGo`
         """
-        results.update(result)
+        return self._path
 
-    def error_callback(key):
+    @property
+    def loaded(self):
+        """
+        Whether the EDisGo object was imported already.
 
-        #        message='Failed'
-        #        func_arguments[0]._status_update(key, 'end', message)
-        return lambda o: results.update({key: o})
+        Returns
+        -------
+        bool
 
-    results = {}
-    max_calc_time_seconds = max_calc_time * 3600
+        """
+        return self._edisgo_obj is not None
 
-    def initializer():
-        import pickle
+    @property
+    def grid_expansion_costs(self):
+        """
+        Grid expansion costs of the EDisGo object.
 
-        pickle.DEFAULT_PROTOCOL = 4
-        import dill
+        In case the EDisGo object was not imported yet, the costs are read from
+        the archive without importing the EDisGo object.
 
-        dill.settings["protocol"] = 4
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<DataFrame>`
+            See :attr:`edisgo.network.results.Results.grid_expansion_costs`. Empty
+            in case the archive contains no grid expansion costs.
 
-    pool = mp2.Pool(workers, initializer=initializer, maxtasksperchild=worker_lifetime)
+        """
+        if self._edisgo_obj is not None:
+            return self._edisgo_obj.results.grid_expansion_costs
+        with ZipFile(self._path) as archive:
+            try:
+                f = archive.open(
+                    "results/grid_expansion_results/grid_expansion_costs.csv"
+                )
+            except KeyError:
+                return pd.DataFrame()
+            with f:
+                return pd.read_csv(f, index_col=0)
 
-    result_objects = {}
-    for ding0_id in ding0_id_list:
-        edisgo_args = (ding0_id, *func_arguments)
+    def load(self):
+        """
+        Imports the EDisGo object, in case it was not imported yet.
 
-        result_objects[ding0_id] = pool.apply_async(
-            func=func,
-            args=edisgo_args,
-            callback=collect_pool_results,
-            error_callback=error_callback(ding0_id),
-        )
+        Returns
+        -------
+        :class:`edisgo.EDisGo`
 
-    errors = {}
-    successes = {}
-    start = datetime.now()
-    end = (start + td(hours=max_calc_time)).isoformat(" ")
-    logger.info("Jobs started. They will time out at {}.".format(end[: end.index(".")]))
-    current = datetime.now()
-    time_spent = 0
-    while result_objects and ((current - start).seconds <= max_calc_time_seconds):
-        done = []
-        tick = (current - start).seconds * 100 / max_calc_time_seconds
-        if tick - time_spent >= 1 or tick > 100:
-            hours_to_go = (current - start).seconds / 3600
-            logger.info(
-                "{:.2f}% ({:.2f}/{}h) spent".format(tick, hours_to_go, max_calc_time)
-            )
-            logger.info("Jobs time out in {:.2f}h.".format(max_calc_time - hours_to_go))
-            time_spent = tick
-        for grid_id, result in result_objects.items():
-            if result.ready():
-                logger.info(
-                    "MV grid {} ready. Trying to `get` the result.".format(grid_id)
+        """
+        with self._lock:
+            if self._edisgo_obj is None:
+                self._edisgo_obj = import_edisgo_from_files(
+                    edisgo_path=self._path, **self._import_kwargs
                 )
-                done.append(grid_id)
-                if not result.successful():
-                    try:
-                        # We already know that this was not successful, so the
-                        # `get` is only here to re-raise the exception that
-                        # occurred.
-                        result.get()
-                    except Exception as e:
-                        logger.warning(
-                            "MV grid {} failed due to {e!r}: '{e}'.".format(
-                                grid_id, e=e
-                            )
-                        )
-                        errors[grid_id] = e
-                else:
-                    logger.info("MV grid {} calculated successfully.".format(grid_id))
-                    successes[grid_id] = result.get()
-                logger.info("Done `get`ting the result for MV grid {}.".format(grid_id))
-        for grid_id in done:
-            del result_objects[grid_id]
-        sleep(1)
-        current = datetime.now()
-
-    # Now we know that we either reached the timeout, (x)or that all
-    # calculations are done. We just have collect what exactly is the case.
-    # This is done by `get`ting the results with a timeout of 0. If any of them
-    # are not yet done, a `TimeoutError` will be triggered, which we can
-    # collect like all other errors.
-    if not result_objects:
-        logger.info("All MV grids stopped before the timeout.")
-    else:
-        logger.warning("Some MV grid simulations timed out.")
-        pool.terminate()
-
-    end = datetime.now()
-    delta = end - start
-    logger.info("Execution finished after {:.2f} hours".format(delta.seconds / 3600))
-
-    done = []
-    for grid_id, result in result_objects.items():
-        done.append(grid_id)
-        try:
-            successes[grid_id] = result.get(timeout=0)
-            logger.info("MV grid {} calculated successfully.".format(grid_id))
-        except Exception as e:
-            logger.warning(
-                "MV grid {} failed due to {e!r}: '{e}'.".format(grid_id, e=e)
+                self._edisgo_obj.legacy_grids = False
+        return self._edisgo_obj
+
+    def __getattr__(self, name):
+        # only called for attributes not defined by the proxy, private attributes
+        # are excluded to not import the EDisGo object on copying or pickling
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _summarize_edisgo_grid(edisgo_grid):
+    """
+    Returns summary of the results of an EDisGo object.
+
+    Parameters
+    ----------
+    edisgo_grid : :class:`edisgo.EDisGo`
+
+    Returns
+    -------
+    dict
+        Grid expansion costs per voltage level in kEUR, number of buses and lines
+        and curtailment totals in MWh, see :attr:`EDisGoNetworks.summary`.
+
+    """
+    summary = {}
+    costs = edisgo_grid.results.grid_expansion_costs
+    for voltage_level in ["mv", "mv/lv", "lv"]:
+        column = "grid_expansion_costs_" + voltage_level.replace("/", "")
+        if costs.empty:
+            summary[column] = 0.0
+        else:
+            summary[column] = float(
+                costs.loc[costs.voltage_level == voltage_level, "total_costs"].sum()
             )
-            errors[grid_id] = e
-    for grid_id in done:
-        del result_objects[grid_id]
-
-    if errors:
-        logger.info("MV grid calculation error details:")
-        for grid_id, error in errors.items():
-            logger.info("  {}".format(grid_id))
-            strings = TracebackException.from_exception(error).format()
-            lines = [line for string in strings for line in string.split("\n")]
-            for line in lines:
-                logger.info("    " + line)
-
-    pool.close()
-    pool.join()
-
-    return results
+    summary["no_of_buses"] = len(edisgo_grid.topology.buses_df)
+    summary["no_of_lines"] = len(edisgo_grid.topology.lines_df)
+    summary["curtailment_overlying_grid"] = float(
+        edisgo_grid.overlying_grid.renewables_curtailment.sum()
+    )
+    grid_slacks = edisgo_grid.opf_results.grid_slacks_t
+    summary["curtailment_optimisation"] = float(
+        grid_slacks.gen_d_crt.sum().sum() + grid_slacks.gen_nd_crt.sum().sum()
+    )
+    return summary
+
+
+def _reduced_deepcopy(edisgo_grid, time_steps):
+    """
+    Returns deep copy of EDisGo object with time series reduced to given time steps.
+
+    Instead of copying the time series of the whole year and reducing them
+    afterwards, all time series containing the given time steps, e.g. in the time
+    series, flexibility and overlying grid data, are sliced first and the slices
+    are used in the copy. Memory needed for the time series of the copy therefore
+    only grows with the number of given time steps. All other data, e.g. the
+    topology, is deep copied.
+
+    Parameters
+    ----------
+    edisgo_grid : :class:`edisgo.EDisGo`
+        EDisGo object.
+    time_steps : :pandas:`pandas.DatetimeIndex<DatetimeIndex>`
+        Time steps to keep.
+
+    Returns
+    -------
+    :class:`edisgo.EDisGo`
+
+    """
+    time_steps = pd.DatetimeIndex(time_steps)
+    # deepcopy uses the objects in memo instead of copying the original objects
+    memo = {}
+    visited = set()
+
+    def slice_time_series(obj):
+        if id(obj) in visited:
+            return
+        visited.add(id(obj))
+        if isinstance(obj, (pd.DataFrame, pd.Series)):
+            if (
+                isinstance(obj.index, pd.DatetimeIndex)
+                and len(obj.index) > len(time_steps)
+                and time_steps.isin(obj.index).all()
+            ):
+                memo[id(obj)] = obj.loc[time_steps].copy()
+            return
+        if isinstance(obj, dict):
+            values = list(obj.values())
+        elif (
+            isinstance(obj, (pd.Index, np.ndarray))
+            or callable(obj)
+            or not hasattr(obj, "__dict__")
+        ):
+            return
+        else:
+            values = list(vars(obj).values())
+        for value in values:
+            slice_time_series(value)
+
+    slice_time_series(edisgo_grid)
+    return deepcopy(edisgo_grid, memo)
+
+
+def _write_back_time_series(df, interval_dfs, align_columns=True):
+    """
+    Writes time series of several time intervals to time series of whole year.
+
+    The values are collected in one array aligned on the index of `df` and the
+    time series are built from it at once, instead of assigning every time
+    interval with ``.loc``.
+
+    Parameters
+    ----------
+    df : :pandas:`pandas.DataFrame<DataFrame>`
+        Time series of whole year.
+    interval_dfs : list(:pandas:`pandas.DataFrame<DataFrame>`)
+        Time series of time intervals. Time steps need to be contained in the
+        index of `df`.
+    align_columns : bool
+        If True, all columns of `df` are overwritten in the time steps of a time
+        interval, with NaN for columns missing in the time interval, and columns
+        not in `df` are ignored, as with ``df.loc[time_steps, :] = interval_df``.
+        If False, only the columns of the time interval are overwritten and
+        columns not in `df` are added, as with
+        ``df.loc[time_steps, interval_df.columns] = interval_df``. Default: True.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<DataFrame>`
+
+    """
+    columns = df.columns
+    if not align_columns:
+        for interval_df in interval_dfs:
+            columns = columns.append(interval_df.columns.difference(columns))
+    values = np.full((len(df.index), len(columns)), np.nan)
+    values[:, : len(df.columns)] = df.to_numpy(dtype=float)
+    for interval_df in interval_dfs:
+        rows = df.index.get_indexer(interval_df.index)
+        if (rows < 0).any():
+            raise ValueError("Time steps of time interval are missing in index.")
+        cols = columns.get_indexer(interval_df.columns)
+        interval_values = interval_df.to_numpy(dtype=float)
+        if align_columns:
+            values[rows, :] = np.nan
+            interval_values = interval_values[:, cols >= 0]
+            cols = cols[cols >= 0]
+        values[np.ix_(rows, cols)] = interval_values
+    return pd.DataFrame(values, index=df.index, columns=columns)
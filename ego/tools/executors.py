@@ -0,0 +1,825 @@
+# -*- coding: utf-8 -*-
+# Copyright 2016-2018 Europa-Universität Flensburg,
+# Flensburg University of Applied Sciences,
+# Centre for Sustainable Energy Systems
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation; either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# File description
+"""
+This file is part of the eGo toolbox.
+It contains the executors that calculate MV grids in parallel, either in
+processes or threads on the local machine or on workers distributed over several
+machines, and the scheduler handing the MV grids to them.
+
+Workers of the :class:`DistributedExecutor` are started on every node with
+
+.. code-block:: bash
+
+    python -m ego.tools.executors --address <host>:<port> --authkey <key>
+
+Results of the MV grids are not sent back to the scheduler but written to the
+results directory of every MV grid, which therefore needs to be on a filesystem
+shared by all nodes.
+"""
+
+import argparse
+import logging
+import pickle
+import threading
+
+from datetime import datetime
+from datetime import timedelta as td
+from time import monotonic, sleep
+from traceback import TracebackException
+
+import dill
+import multiprocess as mp2
+import multiprocess.connection
+
+__copyright__ = (
+    "Flensburg University of Applied Sciences, "
+    "Europa-Universität Flensburg, "
+    "Centre for Sustainable Energy Systems"
+)
+__license__ = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__author__ = "wolf_bunke, maltesc, mltja"
+
+logger = logging.getLogger(__name__)
+
+
+class LocalProcessExecutor:
+    """
+    Executor calculating MV grids in worker processes on the local machine.
+
+    Every worker is started in a separate process, so that workers of MV grids
+    that time out can be stopped.
+
+    Parameters
+    ----------
+    workers : int
+        Maximum number of workers. Default: Number of CPUs.
+    worker_lifetime : int or None
+        Bunch of grids sequentially analyzed by a worker. If None, workers are only
+        replaced in case a grid timed out. Default: 1.
+
+    Attributes
+    ----------
+    wakeup : multiprocess.connection.Connection or None
+        Connection that becomes readable when new workers are available. None, as
+        workers are started on demand.
+
+    """
+
+    wakeup = None
+
+    def __init__(self, workers=mp2.cpu_count(), worker_lifetime=1):
+        self.workers = workers
+        self.worker_lifetime = worker_lifetime
+        self._func = None
+        self._func_arguments = None
+
+    def start(self, func, func_arguments):
+        """
+        Prepares the executor for calculating MV grids with the given function.
+
+        Parameters
+        ----------
+        func : any function
+            Function called with MV grid ID as first argument.
+        func_arguments : tuple
+            Further arguments to function ``func``.
+
+        """
+        self._func = func
+        self._func_arguments = func_arguments
+
+    def get_worker(self, no_workers):
+        """
+        Returns new worker, or None if no further worker is available.
+
+        Parameters
+        ----------
+        no_workers : int
+            Number of workers currently in use.
+
+        """
+        if no_workers >= self.workers:
+            return None
+        return _ProcessWorker(self._func, self._func_arguments, self.worker_lifetime)
+
+    def shutdown(self):
+        """
+        Releases all resources of the executor.
+
+        """
+        self._func = None
+        self._func_arguments = None
+
+
+class LocalThreadExecutor(LocalProcessExecutor):
+    """
+    Executor calculating MV grids in worker threads of the current process.
+
+    Threads avoid the start up of processes and copying of the function arguments
+    to them. However, as a thread can not be stopped, a worker calculating an MV
+    grid that times out keeps running in the background until the grid is done
+    and its result is discarded.
+
+    Parameters
+    ----------
+    workers : int
+        Maximum number of workers. Default: Number of CPUs.
+    worker_lifetime : int or None
+        Bunch of grids sequentially analyzed by a worker. If None, workers are only
+        replaced in case a grid timed out. Default: 1.
+
+    """
+
+    def get_worker(self, no_workers):
+        if no_workers >= self.workers:
+            return None
+        return _ThreadWorker(self._func, self._func_arguments, self.worker_lifetime)
+
+
+class DistributedExecutor:
+    """
+    Executor calculating MV grids on workers connecting over the network.
+
+    The executor listens on the given address and every worker connecting to it
+    with the right authentication key is handed MV grids, see :func:`run_worker`.
+    Workers can join at any time. The function and its arguments are sent once to
+    every worker, after which only MV grid IDs and results are exchanged.
+
+    Parameters
+    ----------
+    address : tuple(str, int)
+        Host and port to listen on. Default: ("0.0.0.0", 6000).
+    authkey : bytes or str
+        Authentication key the workers need to connect.
+    workers : int or None
+        Maximum number of workers used at the same time. If None, all connected
+        workers are used. Default: None.
+
+    Attributes
+    ----------
+    wakeup : multiprocess.connection.Connection or None
+        Connection that becomes readable when a new worker connected. None, if the
+        executor is not started.
+
+    """
+
+    def __init__(self, address=("0.0.0.0", 6000), authkey=None, workers=None):
+        if authkey is None:
+            raise ValueError("An authentication key is required for the workers.")
+        self.address = tuple(address)
+        self.authkey = authkey.encode() if isinstance(authkey, str) else authkey
+        self.workers = workers
+        self.wakeup = None
+        self._listener = None
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def start(self, func, func_arguments):
+        # func and arguments are pickled once and sent to every worker
+        payload = dill.dumps((func, func_arguments))
+        self._listener = listener = multiprocess.connection.Listener(
+            self.address, authkey=self.authkey
+        )
+        self.wakeup, wakeup_sender = mp2.Pipe(duplex=False)
+        logger.info(
+            "Waiting for workers to connect to {}:{}.".format(*self._listener.address)
+        )
+
+        def accept_workers():
+            while True:
+                try:
+                    connection = listener.accept()
+                except multiprocess.AuthenticationError:
+                    logger.warning("Worker failed to authenticate.")
+                    continue
+                except OSError:
+                    # listener was closed
+                    break
+                try:
+                    connection.send_bytes(payload)
+                except OSError:
+                    connection.close()
+                    continue
+                with self._lock:
+                    self._connections.append(connection)
+                try:
+                    wakeup_sender.send(None)
+                except OSError:
+                    # executor was shut down
+                    break
+            wakeup_sender.close()
+
+        threading.Thread(target=accept_workers, daemon=True).start()
+
+    def get_worker(self, no_workers):
+        if self.workers is not None and no_workers >= self.workers:
+            return None
+        with self._lock:
+            if not self._connections:
+                return None
+            connection = self._connections.pop(0)
+        logger.info("Worker connected.")
+        return _RemoteWorker(connection)
+
+    def shutdown(self):
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            self.wakeup.close()
+            self.wakeup = None
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            _RemoteWorker(connection).stop()
+
+
+class _ProcessWorker:
+    """
+    Worker calculating MV grids in a separate process.
+
+    Every worker gets its own connection, so that a worker can be stopped without
+    affecting the communication with the other workers.
+
+    """
+
+    def __init__(self, func, func_arguments, lifetime):
+        self.lifetime = lifetime
+        self.connection, worker_connection = mp2.Pipe()
+        self._process = mp2.Process(
+            target=_parallelizer_worker,
+            args=(worker_connection, func, func_arguments, lifetime),
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+    def __repr__(self):
+        return "process {}".format(self._process.pid)
+
+    @property
+    def exitcode(self):
+        return self._process.exitcode
+
+    def stop(self, terminate=False):
+        if terminate:
+            self._process.terminate()
+        elif self._process.is_alive():
+            # idle worker waits for the next grid
+            try:
+                self.connection.send(None)
+            except (BrokenPipeError, EOFError):
+                pass
+        self._process.join()
+        self.connection.close()
+
+
+class _ThreadWorker:
+    """
+    Worker calculating MV grids in a separate thread.
+
+    """
+
+    exitcode = None
+
+    def __init__(self, func, func_arguments, lifetime):
+        self.lifetime = lifetime
+        self.connection, worker_connection = mp2.Pipe()
+
+        def run():
+            try:
+                _parallelizer_worker(worker_connection, func, func_arguments, lifetime)
+            except OSError:
+                # connection was closed after the grid timed out
+                worker_connection.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+
+    def __repr__(self):
+        return "thread {}".format(self._thread.name)
+
+    def stop(self, terminate=False):
+        if not terminate:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+            self._thread.join()
+        # a terminated thread is left to finish its grid in the background
+        self.connection.close()
+
+
+class _RemoteWorker:
+    """
+    Worker connected over the network, see :func:`run_worker`.
+
+    Remote workers calculate every MV grid in a new process, wherefore they have
+    no limited lifetime. Closing the connection stops the calculation.
+
+    """
+
+    lifetime = None
+    exitcode = None
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __repr__(self):
+        return "remote worker"
+
+    def stop(self, terminate=False):
+        if not terminate:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+        self.connection.close()
+
+
+def parallelizer(
+    ding0_id_list,
+    func,
+    func_arguments,
+    max_calc_time,
+    workers=mp2.cpu_count(),
+    worker_lifetime=1,
+    max_calc_time_per_grid=None,
+    timeout_callback=None,
+    dependencies=None,
+    retries=0,
+    task_groups=None,
+    group_limits=None,
+    executor=None,
+):
+    """
+    Use python multiprocessing toolbox for parallelization
+
+    Several grids are analyzed in parallel based on your custom function that
+    defines the specific application of eDisGo. Results and errors are collected
+    the moment a grid finishes.
+
+    Instead of whole grids, single tasks of grids can be parallelized by giving
+    the dependencies between the tasks, see parameter `dependencies`.
+
+    Parameters
+    ----------
+    ding0_id_list : list of int
+        List of ding0 grid data IDs (also known as HV/MV substation IDs). Grids are
+        started in the given order. Any other hashable keys, e.g. tuples of grid ID
+        and task, can be used as well.
+    func : any function
+        Your custom function that shall be parallelized
+    func_arguments : tuple
+        Arguments to custom function ``func``
+    max_calc_time : float
+        Maximum calculation time in hours for all grids. Grids that are not done
+        by then are stopped.
+    workers: int
+        Number of parallel process. Only used if no `executor` is given.
+    worker_lifetime : int or None
+        Bunch of grids sequentially analyzed by a worker. If None, workers are only
+        replaced in case a grid timed out. Only used if no `executor` is given.
+    max_calc_time_per_grid : float or None
+        Maximum calculation time in hours for a single grid. A grid exceeding it is
+        stopped and its worker replaced, while all other grids keep running. If
+        None, only ``max_calc_time`` applies. Default: None.
+    timeout_callback : function or None
+        Function called with the MV grid ID of every grid that was stopped because
+        it timed out. Default: None.
+    dependencies : dict or None
+        Dictionary with keys from `ding0_id_list` as keys and list of keys that need
+        to be finished successfully before as values. Keys depending on a key that
+        failed or timed out are not started. If None, there are no dependencies.
+        Default: None.
+    retries : int
+        Number of times a failed key is started again. Keys that timed out are not
+        started again. Default: 0.
+    task_groups : dict or None
+        Dictionary with keys from `ding0_id_list` as keys and name of group as
+        values. Used to limit the number of keys of a group that are calculated at
+        the same time, see parameter `group_limits`. Default: None.
+    group_limits : dict or None
+        Dictionary with name of group as keys and maximum number of keys of that
+        group calculated at the same time as values. Default: None.
+    executor : :class:`LocalProcessExecutor`, :class:`LocalThreadExecutor`, \
+    :class:`DistributedExecutor` or None
+        Executor providing the workers. If None, a :class:`LocalProcessExecutor`
+        with `workers` and `worker_lifetime` is used. Default: None.
+
+    Notes
+    -----
+    Please note, the following requirements for the custom function which is to
+    be executed in parallel
+
+    #. It must return an instance of the type :class:`~.edisgo.EDisGo`.
+    #. The first positional argument is the MV grid district id (as int). It is
+       prepended to the tuple of arguments ``func_arguments``
+
+
+    Returns
+    -------
+    containers : dict of :class:`~.edisgo.EDisGo`
+        Dict of EDisGo instances keyed by its ID. For grids that failed, the
+        exception is given instead. Grids that timed out are not contained.
+    """
+
+    def stop_worker(worker, terminate=False):
+        worker_states.pop(worker)
+        worker.stop(terminate=terminate)
+
+    def next_key():
+        """
+        Returns position of first queued key whose dependencies are finished and
+        whose group limit is not reached, or None if there is no such key.
+        """
+        running_groups = [
+            task_groups.get(state["key"])
+            for state in worker_states.values()
+            if state["key"] is not None
+        ]
+        for i, key in enumerate(queued):
+            if not all(dependency in finished for dependency in dependencies[key]):
+                continue
+            group = task_groups.get(key)
+            if group in group_limits and (
+                running_groups.count(group) >= group_limits[group]
+            ):
+                continue
+            return i
+        return None
+
+    def skip_dependents(key):
+        for dependent in [_ for _ in queued if key in dependencies[_]]:
+            queued.remove(dependent)
+            logger.warning(
+                "{} is not calculated, as {} did not finish.".format(dependent, key)
+            )
+            errors[dependent] = RuntimeError(
+                "{} is not calculated, as {} did not finish.".format(dependent, key)
+            )
+            skip_dependents(dependent)
+
+    def grid_timed_out(key, message):
+        logger.warning(message)
+        errors[key] = mp2.TimeoutError(message)
+        skip_dependents(key)
+        if timeout_callback is not None:
+            timeout_callback(key)
+
+    if executor is None:
+        executor = LocalProcessExecutor(
+            workers=workers, worker_lifetime=worker_lifetime
+        )
+
+    results = {}
+    errors = {}
+    worker_states = {}
+    queued = list(ding0_id_list)
+    # dependencies on keys that are not calculated are ignored
+    dependencies = {
+        key: [_ for _ in (dependencies or {}).get(key, []) if _ in queued]
+        for key in queued
+    }
+    task_groups = task_groups or {}
+    group_limits = group_limits or {}
+    attempts = {key: 0 for key in queued}
+    finished = set()
+    no_grids = len(queued)
+    no_grids_done = 0
+
+    start = datetime.now()
+    deadline = monotonic() + max_calc_time * 3600
+    end = (start + td(hours=max_calc_time)).isoformat(" ")
+    logger.info("Jobs started. They will time out at {}.".format(end[: end.index(".")]))
+    if max_calc_time_per_grid is not None:
+        logger.info(
+            "Single MV grids time out after {}h.".format(max_calc_time_per_grid)
+        )
+
+    executor.start(func, func_arguments)
+    try:
+        while True:
+            # hand out keys to idle workers and start new workers if needed
+            while True:
+                idle = [
+                    worker
+                    for worker, state in worker_states.items()
+                    if state["key"] is None
+                ]
+                i = next_key()
+                if i is None:
+                    break
+                worker = idle[0] if idle else executor.get_worker(len(worker_states))
+                if worker is None:
+                    break
+                if worker not in worker_states:
+                    worker_states[worker] = {"key": None, "tasks": 0}
+                key = queued.pop(i)
+                state = worker_states[worker]
+                state["key"] = key
+                state["grid_deadline"] = (
+                    None
+                    if max_calc_time_per_grid is None
+                    else monotonic() + max_calc_time_per_grid * 3600
+                )
+                attempts[key] += 1
+                worker.connection.send(key)
+            busy = [
+                worker
+                for worker, state in worker_states.items()
+                if state["key"] is not None
+            ]
+            if not busy and (not queued or executor.wakeup is None):
+                break
+
+            # wait until the next grid finishes or times out, or a new worker
+            # becomes available
+            next_deadline = min(
+                [deadline]
+                + [
+                    worker_states[worker]["grid_deadline"]
+                    for worker in busy
+                    if worker_states[worker]["grid_deadline"] is not None
+                ]
+            )
+            connections = {worker.connection: worker for worker in busy}
+            if executor.wakeup is not None:
+                connections[executor.wakeup] = None
+            for connection in multiprocess.connection.wait(
+                list(connections), timeout=max(next_deadline - monotonic(), 0)
+            ):
+                worker = connections[connection]
+                if worker is None:
+                    # new worker is picked up when handing out the next keys
+                    connection.recv()
+                    continue
+                state = worker_states[worker]
+                died = False
+                try:
+                    key, result, error = connection.recv()
+                except (EOFError, OSError):
+                    died = True
+                    key, result = state["key"], None
+                    error = RuntimeError(
+                        "Worker calculating MV grid {} died with exit code {}.".format(
+                            key, worker.exitcode
+                        )
+                    )
+                state["key"] = None
+                state["tasks"] += 1
+                if error is None:
+                    logger.info("MV grid {} calculated successfully.".format(key))
+                    results.update(result)
+                    finished.add(key)
+                    no_grids_done += 1
+                elif attempts[key] <= retries:
+                    logger.warning(
+                        "MV grid {} failed due to {e!r}: '{e}'. Retry {} of {}.".format(
+                            key, attempts[key], retries, e=error
+                        )
+                    )
+                    queued.insert(0, key)
+                else:
+                    logger.warning(
+                        "MV grid {} failed due to {e!r}: '{e}'.".format(key, e=error)
+                    )
+                    errors[key] = error
+                    results[key] = error
+                    skip_dependents(key)
+                    no_grids_done += 1
+                logger.info(
+                    "{} of {} MV grids done, {:.2f}h until timeout.".format(
+                        no_grids_done, no_grids, max(deadline - monotonic(), 0) / 3600
+                    )
+                )
+                if died or (
+                    worker.lifetime is not None and state["tasks"] >= worker.lifetime
+                ):
+                    stop_worker(worker, terminate=died)
+
+            # stop grids that exceeded their own time budget
+            now = monotonic()
+            for worker, state in list(worker_states.items()):
+                if (
+                    state["key"] is not None
+                    and state["grid_deadline"] is not None
+                    and now >= state["grid_deadline"]
+                ):
+                    stop_worker(worker, terminate=True)
+                    no_grids_done += 1
+                    grid_timed_out(
+                        state["key"],
+                        "MV grid {} timed out after {}h.".format(
+                            state["key"], max_calc_time_per_grid
+                        ),
+                    )
+            if now >= deadline:
+                break
+
+        # Now we know that we either reached the timeout, (x)or that all
+        # calculations are done. Grids that are still running or were not started
+        # yet are collected as timed out.
+        running = [
+            state["key"] for state in worker_states.values() if state["key"] is not None
+        ]
+        if not running and not queued:
+            logger.info("All MV grids stopped before the timeout.")
+        else:
+            logger.warning("Some MV grid simulations timed out.")
+        for worker in list(worker_states):
+            stop_worker(worker, terminate=worker_states[worker]["key"] is not None)
+    finally:
+        executor.shutdown()
+    for key in running:
+        grid_timed_out(
+            key, "MV grid {} timed out after {}h.".format(key, max_calc_time)
+        )
+    for key in queued:
+        errors[key] = mp2.TimeoutError(
+            "MV grid {} was not started before the timeout.".format(key)
+        )
+
+    end = datetime.now()
+    delta = end - start
+    logger.info(
+        "Execution finished after {:.2f} hours".format(delta.total_seconds() / 3600)
+    )
+
+    if errors:
+        logger.info("MV grid calculation error details:")
+        for key, error in errors.items():
+            logger.info("  {}".format(key))
+            strings = TracebackException.from_exception(error).format()
+            lines = [line for string in strings for line in string.split("\n")]
+            for line in lines:
+                logger.info("    " + line)
+
+    return results
+
+
+def _parallelizer_worker(connection, func, func_arguments, worker_lifetime):
+    """
+    Calculates MV grids received through the connection in a worker process.
+
+    The result or the error of every grid is sent back through the connection. The
+    worker stops after ``worker_lifetime`` grids or when it receives None.
+
+    """
+    pickle.DEFAULT_PROTOCOL = 4
+    dill.settings["protocol"] = 4
+
+    tasks = 0
+    while worker_lifetime is None or tasks < worker_lifetime:
+        ding0_id = connection.recv()
+        if ding0_id is None:
+            break
+        try:
+            connection.send((ding0_id, func(ding0_id, *func_arguments), None))
+        except Exception as e:
+            try:
+                connection.send((ding0_id, None, e))
+            except Exception:
+                # exception can not be pickled
+                connection.send((ding0_id, None, RuntimeError(repr(e))))
+        tasks += 1
+    connection.close()
+
+
+def run_worker(address, authkey, workers=1, connect_timeout=60):
+    """
+    Runs workers calculating MV grids for a :class:`DistributedExecutor`.
+
+    Every worker connects to the executor and calculates the MV grids it receives
+    one after another, each in a new process. When the executor stops a grid, e.g.
+    because it timed out, the process is terminated and the worker connects again.
+    Workers stop when the executor has no MV grids left or can not be reached for
+    `connect_timeout` seconds.
+
+    Parameters
+    ----------
+    address : tuple(str, int)
+        Host and port of the executor.
+    authkey : bytes or str
+        Authentication key of the executor.
+    workers : int
+        Number of workers, i.e. MV grids calculated at the same time on this
+        machine. Default: 1.
+    connect_timeout : float
+        Time in seconds to try to connect to the executor. Default: 60.
+
+    """
+    address = tuple(address)
+    authkey = authkey.encode() if isinstance(authkey, str) else authkey
+
+    def connect():
+        deadline = monotonic() + connect_timeout
+        while True:
+            try:
+                return multiprocess.connection.Client(address, authkey=authkey)
+            except OSError:
+                if monotonic() >= deadline:
+                    return None
+                sleep(0.5)
+
+    def run():
+        while True:
+            connection = connect()
+            if connection is None:
+                return
+            try:
+                func, func_arguments = dill.loads(connection.recv_bytes())
+                while True:
+                    key = connection.recv()
+                    if key is None:
+                        return
+                    worker = _ProcessWorker(func, func_arguments, 1)
+                    worker.connection.send(key)
+                    ready = multiprocess.connection.wait(
+                        [worker.connection, connection]
+                    )
+                    if connection in ready:
+                        # executor stopped the grid by closing the connection
+                        worker.stop(terminate=True)
+                        break
+                    try:
+                        result = worker.connection.recv()
+                    except EOFError:
+                        result = (
+                            key,
+                            None,
+                            RuntimeError(
+                                "Worker calculating MV grid {} died with exit "
+                                "code {}.".format(key, worker.exitcode)
+                            ),
+                        )
+                    worker.stop()
+                    connection.send(result)
+            except (EOFError, OSError):
+                pass
+            finally:
+                connection.close()
+
+    threads = [threading.Thread(target=run) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Run workers calculating MV grids for an eGo run on another "
+        "machine."
+    )
+    parser.add_argument(
+        "--address",
+        required=True,
+        help="Address of the eGo run as <host>:<port>, see executor_address in the "
+        "eDisGo settings.",
+    )
+    parser.add_argument(
+        "--authkey",
+        required=True,
+        help="Authentication key, see executor_authkey in the eDisGo settings.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=mp2.cpu_count(),
+        help="Number of MV grids calculated at the same time. Default: Number of "
+        "CPUs.",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=60,
+        help="Time in seconds to wait for the eGo run. Default: 60.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    host, port = args.address.rsplit(":", 1)
+    run_worker(
+        (host, int(port)),
+        args.authkey,
+        workers=args.workers,
+        connect_timeout=args.connect_timeout,
+    )
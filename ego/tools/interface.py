@@ -25,11 +25,16 @@ __copyright__ = "Europa-Universität Flensburg, " "Centre for Sustainable Energy
 __license__ = "GNU Affero General Public License Version 3 (AGPL-3.0)"
 __author__ = "wolf_bunke,maltesc,mltja"
 
+import hashlib
+import json
 import logging
 import math
 import os
 import time
 
+from collections.abc import Mapping, MutableMapping
+
+import numpy as np
 import pandas as pd
 
 if "READTHEDOCS" not in os.environ:
@@ -39,6 +44,200 @@ if "READTHEDOCS" not in os.environ:
 
 logger = logging.getLogger(__name__)
 
+# Mapping of carrier names in eTraGo ("etrago") and generator types in eDisGo
+# ("edisgo") to the common carrier names used in the interface. Generator types
+# in "edisgo_chp" are only mapped in case the generator has a thermal capacity.
+CARRIER_MAPPING = {
+    "etrago": {
+        "central_gas_CHP": "gas_CHP",
+        "industrial_gas_CHP": "gas_CHP",
+        "central_biomass_CHP": "biomass_CHP",
+        "industrial_biomass_CHP": "biomass_CHP",
+        "reservoir": "run_of_river",
+        "solar_rooftop": "solar",
+        "wind_onshore": "wind",
+    },
+    "edisgo": {
+        "water": "run_of_river",
+        "conventional": "others",
+    },
+    "edisgo_chp": {
+        "gas": "gas_CHP",
+        "gas extended": "gas_CHP",
+        "oil": "gas_CHP",
+        "others": "gas_CHP",
+        "biomass": "biomass_CHP",
+    },
+}
+
+
+class CompactTimeseries(Mapping):
+    """
+    Container for component time series stored as compact blocks.
+
+    Each time series attribute (e.g. "p" or "q") is kept as one contiguous
+    array with one row per component, together with the column names giving
+    the offset of each component in the array. Accessing an attribute returns a
+    :pandas:`pandas.DataFrame<dataframe>` view on the array, so that the
+    container can be used like the dictionary of dataframes it replaces.
+
+    The blocks can be moved to memory-mapped files using :meth:`to_memmap` in
+    order to share them between processes.
+
+    Parameters
+    ----------
+    timeseries_dict : dict(str, :pandas:`pandas.DataFrame<dataframe>`)
+        Time series dataframes keyed by attribute, with time steps as index and
+        components as columns.
+    dtype : :numpy:`numpy.dtype<dtype>`
+        Data type the time series are stored as. Default: float32.
+
+    """
+
+    def __init__(self, timeseries_dict, dtype=np.float32):
+        self._index = {}
+        self._columns = {}
+        self._blocks = {}
+        self._files = {}
+        for attribute, df in timeseries_dict.items():
+            self._index[attribute] = df.index
+            # column names give the offset of each component in the block
+            self._columns[attribute] = df.columns
+            # pandas stores 2D blocks with one row per column, wherefore this
+            # layout allows to create dataframes without copying the data
+            self._blocks[attribute] = np.ascontiguousarray(df.to_numpy(dtype=dtype).T)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # memory-mapped blocks are not pickled but mapped again when unpickling
+        if self._files:
+            state["_blocks"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._files:
+            self._load_memmaps()
+
+    def __getitem__(self, attribute):
+        return pd.DataFrame(
+            self._blocks[attribute].T,
+            index=self._index[attribute],
+            columns=self._columns[attribute],
+            copy=False,
+        )
+
+    def __iter__(self):
+        return iter(self._blocks)
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def to_memmap(self, directory, prefix):
+        """
+        Moves the blocks to memory-mapped .npy files.
+
+        Afterwards, pickling the object only serializes the file paths besides
+        index and columns, and unpickled copies, e.g. in worker processes, map
+        the files instead of holding own copies of the time series. The files
+        are mapped copy-on-write, wherefore changes to the time series are not
+        written to the files and stay local to the process. In case the blocks
+        are already memory-mapped, they are not saved again.
+
+        Parameters
+        ----------
+        directory : str
+            Directory the files are saved to. It is created in case it does not
+            yet exist.
+        prefix : str
+            Prefix of the file names, e.g. the component type. The files are
+            named "<prefix>_<attribute>.npy".
+
+        """
+        if self._files:
+            return
+        files = self.save(directory, prefix)["files"]
+        self._files = {
+            attribute: os.path.join(os.path.abspath(directory), file_name)
+            for attribute, file_name in files.items()
+        }
+        self._load_memmaps()
+
+    def save(self, directory, prefix):
+        """
+        Saves the blocks to .npy files.
+
+        Parameters
+        ----------
+        directory : str
+            Directory the files are saved to. It is created in case it does not
+            yet exist.
+        prefix : str
+            Prefix of the file names, e.g. the component type. The files are
+            named "<prefix>_<attribute>.npy".
+
+        Returns
+        -------
+        dict
+            Index, columns and file names of the blocks keyed by attribute
+            needed to map the files again using :meth:`load`.
+
+        """
+        os.makedirs(directory, exist_ok=True)
+        files = {}
+        for attribute, block in self._blocks.items():
+            files[attribute] = f"{prefix}_{attribute}.npy"
+            np.save(os.path.join(directory, files[attribute]), block)
+        return {"index": self._index, "columns": self._columns, "files": files}
+
+    @classmethod
+    def load(cls, directory, description):
+        """
+        Maps blocks saved with :meth:`save`.
+
+        Parameters
+        ----------
+        directory : str
+            Directory the files were saved to.
+        description : dict
+            Index, columns and file names of the blocks as returned by
+            :meth:`save`.
+
+        Returns
+        -------
+        :class:`CompactTimeseries`
+            Time series with memory-mapped blocks.
+
+        """
+        timeseries = cls({})
+        timeseries._index = dict(description["index"])
+        timeseries._columns = dict(description["columns"])
+        timeseries._files = {
+            attribute: os.path.join(os.path.abspath(directory), file_name)
+            for attribute, file_name in description["files"].items()
+        }
+        timeseries._load_memmaps()
+        return timeseries
+
+    def _load_memmaps(self):
+        self._blocks = {
+            attribute: np.load(path, mmap_mode="c")
+            for attribute, path in self._files.items()
+        }
+
+    @property
+    def nbytes(self):
+        """
+        Memory consumed by the time series values.
+
+        Returns
+        -------
+        int
+            Number of bytes of all blocks.
+
+        """
+        return sum(block.nbytes for block in self._blocks.values())
+
 
 class ETraGoMinimalData:
     """
@@ -49,10 +248,16 @@ class ETraGoMinimalData:
     Parameters
     ----------
     etrago_network : :pypsa:`PyPSA.Network<network>`
+    compact : bool
+        If True, component time series are stored as float32 blocks in
+        :class:`CompactTimeseries` instead of float64 dataframes, which halves
+        their memory consumption and the costs of copying the object to
+        worker processes. Time series are then returned as float32 dataframes.
+        Default: False.
 
     """
 
-    def __init__(self, etrago_network):
+    def __init__(self, etrago_network, compact=False):
         def set_filtered_attribute(etrago_network_obj, component):
 
             # filter components
@@ -103,12 +308,17 @@ class ETraGoMinimalData:
                 attribute: component_timeseries_dict[attribute]
                 for attribute in attribute_to_save
             }
+            if compact:
+                new_component_timeseries_dict = CompactTimeseries(
+                    new_component_timeseries_dict
+                )
 
             setattr(self, component + "_t", new_component_timeseries_dict)
 
         t_start = time.perf_counter()
 
         self.snapshots = etrago_network.snapshots
+        self.compact = compact
 
         components = ["storage_units", "stores", "generators", "links", "loads"]
         for selected_component in components:
@@ -116,6 +326,425 @@ class ETraGoMinimalData:
 
         logger.info(f"Data selection time {time.perf_counter() - t_start}")
 
+        self._build_component_indexes()
+
+    def _build_component_indexes(self):
+        t_start = time.perf_counter()
+
+        # build row positions per bus and carrier to allow look-ups without scanning
+        # the full component dataframes
+        columns_to_index = {
+            "storage_units": ["bus", "carrier"],
+            "stores": ["bus", "carrier"],
+            "generators": ["bus", "carrier"],
+            "links": ["bus0", "bus1", "carrier"],
+            "loads": ["bus"],
+        }
+        self._component_indexes = {
+            component: {
+                column: getattr(self, component).groupby(column).indices
+                for column in columns
+            }
+            for component, columns in columns_to_index.items()
+        }
+        self._build_heat_bus_topology()
+
+        logger.info(f"Index creation time {time.perf_counter() - t_start}")
+
+    def _build_heat_bus_topology(self):
+        """
+        Determines the components connected to the heat buses PtH units feed into.
+
+        For every heat bus, the row positions of the links to heat stores, the
+        heat stores behind these links, other links feeding into the heat bus and
+        generators at the heat bus are stored, so that they can be retrieved using
+        :meth:`get_heat_bus_components` without further look-ups.
+
+        """
+
+        def positions(component, column, value):
+            return self._component_indexes[component][column].get(
+                value, np.array([], dtype=np.intp)
+            )
+
+        heat_buses = self.get_components(
+            "links",
+            "carrier",
+            ["central_heat_pump", "central_resistive_heater", "rural_heat_pump"],
+        )["bus1"].unique()
+
+        links_bus1 = self.links["bus1"].values
+        is_heat_store = (
+            self.stores["carrier"]
+            .isin(["central_heat_store", "rural_heat_store"])
+            .values
+        )
+        is_heat_feedin_link = (
+            self.links["carrier"]
+            .isin(
+                [
+                    "central_gas_boiler",
+                    "central_gas_CHP_heat",
+                    "central_heat_pump",
+                    "central_resistive_heater",
+                ]
+            )
+            .values
+        )
+        is_heat_feedin_gen = (self.generators["carrier"] != "load shedding").values
+
+        self._heat_bus_topology = {
+            "store_links": {},
+            "stores": {},
+            "feedin_links": {},
+            "feedin_generators": {},
+        }
+        for heat_bus in heat_buses:
+            store_links = positions("links", "bus0", heat_bus)
+            stores = [
+                positions("stores", "bus", store_bus)
+                for store_bus in pd.unique(links_bus1[store_links])
+            ]
+            stores = np.unique(np.concatenate([np.array([], dtype=np.intp)] + stores))
+            feedin_links = positions("links", "bus1", heat_bus)
+            feedin_generators = positions("generators", "bus", heat_bus)
+
+            self._heat_bus_topology["store_links"][heat_bus] = store_links
+            self._heat_bus_topology["stores"][heat_bus] = stores[is_heat_store[stores]]
+            self._heat_bus_topology["feedin_links"][heat_bus] = feedin_links[
+                is_heat_feedin_link[feedin_links]
+            ]
+            self._heat_bus_topology["feedin_generators"][heat_bus] = feedin_generators[
+                is_heat_feedin_gen[feedin_generators]
+            ]
+
+    def get_heat_bus_components(self, heat_buses, relation):
+        """
+        Gets components connected to the given heat buses.
+
+        Only heat buses PtH units feed into are considered.
+
+        Parameters
+        ----------
+        heat_buses : str or list-like
+            Heat bus name(s).
+        relation : str
+            Components to return. Possible options are:
+
+            * 'store_links'
+                Links from the heat bus to the heat store buses.
+            * 'stores'
+                Central and rural heat stores connected to the heat bus via a
+                store link.
+            * 'feedin_links'
+                Gas boilers, gas CHP plants, heat pumps and resistive heaters
+                feeding into the heat bus.
+            * 'feedin_generators'
+                Generators at the heat bus except load shedding.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Connected components in the order they appear in the component
+            dataframe.
+
+        """
+        component = {
+            "store_links": "links",
+            "stores": "stores",
+            "feedin_links": "links",
+            "feedin_generators": "generators",
+        }[relation]
+        if isinstance(heat_buses, str) or not pd.api.types.is_list_like(heat_buses):
+            heat_buses = [heat_buses]
+        positions = [
+            self._heat_bus_topology[relation][heat_bus]
+            for heat_bus in heat_buses
+            if heat_bus in self._heat_bus_topology[relation]
+        ]
+        df = getattr(self, component)
+        if len(positions) == 0:
+            return df.iloc[[]]
+        return df.iloc[np.unique(np.concatenate(positions))]
+
+    def to_memmap(self, directory):
+        """
+        Moves the component time series to memory-mapped .npy files.
+
+        Afterwards, pickling the object, e.g. to pass it to worker processes,
+        only serializes the component dataframes and the paths of the time
+        series files. The time series are mapped by all processes instead of
+        being copied to each of them. Time series not yet stored in
+        :class:`CompactTimeseries` are converted keeping their float64 data type.
+
+        Parameters
+        ----------
+        directory : str
+            Directory the time series files are saved to.
+
+        """
+        t_start = time.perf_counter()
+
+        components = ["storage_units", "stores", "generators", "links", "loads"]
+        for component in components:
+            timeseries = getattr(self, component + "_t")
+            if not isinstance(timeseries, CompactTimeseries):
+                timeseries = CompactTimeseries(timeseries, dtype=np.float64)
+                setattr(self, component + "_t", timeseries)
+            timeseries.to_memmap(directory, component)
+
+        logger.info(f"Memory mapping time {time.perf_counter() - t_start}")
+
+    def save(self, directory, source_hash=None):
+        """
+        Saves the object to a cache directory.
+
+        The component time series are saved as .npy files, the component
+        dataframes and snapshots are pickled. A manifest file containing the
+        given hash of the source data is written last, so that the cache is only
+        considered valid by :meth:`load` once it was completely written.
+
+        Parameters
+        ----------
+        directory : str
+            Cache directory. It is created in case it does not yet exist.
+        source_hash : str or None
+            Hash of the data the object was created from, e.g. determined using
+            :func:`get_csv_folder_hash`. Default: None.
+
+        """
+        t_start = time.perf_counter()
+
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, "manifest.json")
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        components = ["storage_units", "stores", "generators", "links", "loads"]
+        data = {"snapshots": self.snapshots, "components": {}, "timeseries": {}}
+        for component in components:
+            timeseries = getattr(self, component + "_t")
+            if not isinstance(timeseries, CompactTimeseries):
+                timeseries = CompactTimeseries(timeseries, dtype=np.float64)
+            data["components"][component] = getattr(self, component)
+            data["timeseries"][component] = timeseries.save(directory, component)
+        pd.to_pickle(data, os.path.join(directory, "data.pkl"))
+
+        manifest = {
+            "source_hash": source_hash,
+            "compact": self.compact,
+            "pandas_version": pd.__version__,
+        }
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=4)
+
+        logger.info(f"Cache saving time {time.perf_counter() - t_start}")
+
+    @classmethod
+    def load(cls, directory, source_hash=None, compact=False):
+        """
+        Loads object saved with :meth:`save`.
+
+        The component time series are memory-mapped, wherefore loading only
+        takes as long as reading the component dataframes.
+
+        Parameters
+        ----------
+        directory : str
+            Cache directory.
+        source_hash : str or None
+            Hash of the data the object should be created from. If it does not
+            match the hash the cache was saved with, the cache is outdated.
+            Default: None.
+        compact : bool
+            Whether time series should be stored as float32. If this does not
+            match the setting the cache was saved with, the cache is not used.
+            Default: False.
+
+        Returns
+        -------
+        :class:`ETraGoMinimalData` or None
+            Loaded object or None in case there is no valid cache in the given
+            directory.
+
+        """
+        manifest_path = os.path.join(directory, "manifest.json")
+        if not os.path.exists(manifest_path):
+            logger.info(f"No eTraGo cache found in {directory}.")
+            return None
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if (
+            manifest["source_hash"] != source_hash
+            or manifest["compact"] != compact
+            or manifest["pandas_version"] != pd.__version__
+        ):
+            logger.info(f"eTraGo cache in {directory} is outdated.")
+            return None
+
+        t_start = time.perf_counter()
+
+        data = pd.read_pickle(os.path.join(directory, "data.pkl"))
+        etrago_obj = cls.__new__(cls)
+        etrago_obj.snapshots = data["snapshots"]
+        etrago_obj.compact = compact
+        for component, df in data["components"].items():
+            setattr(etrago_obj, component, df)
+            setattr(
+                etrago_obj,
+                component + "_t",
+                CompactTimeseries.load(directory, data["timeseries"][component]),
+            )
+
+        logger.info(f"Cache loading time {time.perf_counter() - t_start}")
+
+        etrago_obj._build_component_indexes()
+        return etrago_obj
+
+    def get_components(self, component, columns, values):
+        """
+        Gets all components whose value in any of the given columns matches any of
+        the given values.
+
+        The look-up uses the row positions per bus and carrier determined when
+        creating the object, wherefore its costs only depend on the number of
+        matching components.
+
+        Parameters
+        ----------
+        component : str
+            Component type, e.g. "generators" or "links".
+        columns : str or list(str)
+            Indexed column(s) to filter by. Possible options are "bus" and
+            "carrier" ("bus" only for loads) and in case of links "bus0", "bus1"
+            and "carrier".
+        values : str or list-like
+            Value(s) to look up, e.g. bus names as str.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Matching components in the order they appear in the component
+            dataframe.
+
+        """
+        if isinstance(columns, str):
+            columns = [columns]
+        if isinstance(values, str) or not pd.api.types.is_list_like(values):
+            values = [values]
+        positions = [
+            self._component_indexes[component][column][value]
+            for column in columns
+            for value in values
+            if value in self._component_indexes[component][column]
+        ]
+        df = getattr(self, component)
+        if len(positions) == 0:
+            return df.iloc[[]]
+        return df.iloc[np.unique(np.concatenate(positions))]
+
+
+def get_csv_folder_hash(csv_folder):
+    """
+    Determines hash of a folder, e.g. with eTraGo results.
+
+    Only the metadata of the files is hashed, so that the folder does not need to
+    be read. A file is therefore considered changed if its size or modification
+    time changed.
+
+    Parameters
+    ----------
+    csv_folder : str
+        Path to the folder. All files in the folder and its subfolders are
+        considered.
+
+    Returns
+    -------
+    str
+        SHA-256 hash of the relative paths, sizes and modification times of all
+        files.
+
+    """
+    hash_obj = hashlib.sha256()
+    for root, _, files in sorted(os.walk(csv_folder)):
+        for file_name in sorted(files):
+            path = os.path.join(root, file_name)
+            stat = os.stat(path)
+            hash_obj.update(
+                "{}\0{}\0{}\n".format(
+                    os.path.relpath(path, csv_folder), stat.st_size, stat.st_mtime_ns
+                ).encode()
+            )
+    return hash_obj.hexdigest()
+
+
+class LazySpecs(MutableMapping):
+    """
+    Dictionary of interface specifications computed on first access.
+
+    Specifications are registered together with the function computing them
+    using :meth:`add_evaluator`. The function is called on first access of any
+    of its keys and is expected to set all of them, so that the values are
+    memoized and each function is called at most once. Otherwise, the object
+    behaves like a dictionary, so that specifications that are never accessed
+    are never computed.
+
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._evaluators = {}
+
+    def add_evaluator(self, evaluator, keys):
+        """
+        Registers function computing the given specifications.
+
+        Parameters
+        ----------
+        evaluator : callable
+            Function without arguments that sets all given keys.
+        keys : list(str)
+            Keys set by the function.
+
+        """
+        for key in keys:
+            self._evaluators[key] = evaluator
+
+    def __getitem__(self, key):
+        if key not in self._data and key in self._evaluators:
+            evaluator = self._evaluators[key]
+            evaluator()
+            self._evaluators = {
+                k: func for k, func in self._evaluators.items() if func is not evaluator
+            }
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._evaluators.pop(key, None)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._data.pop(key, None)
+        self._evaluators.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._data or key in self._evaluators
+
+    def __iter__(self):
+        return iter(list(self._data) + list(self._evaluators))
+
+    def __len__(self):
+        return len(self._data) + len(self._evaluators)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+    def __getstate__(self):
+        # evaluators are not picklable, wherefore all specifications are computed
+        return {"_data": dict(self.items()), "_evaluators": {}}
+
 
 def get_etrago_results_per_bus(bus_id, etrago_obj, pf_post_lopf, max_cos_phi_ren):
     """
@@ -136,8 +765,9 @@ def get_etrago_results_per_bus(bus_id, etrago_obj, pf_post_lopf, max_cos_phi_ren
 
     Returns
     -------
-    dict(str: :pandas:`pandas.DataFrame<dataframe>`)
-        Dataframes used as eDisGo inputs.
+    :class:`LazySpecs`
+        Dataframes used as eDisGo inputs. Specifications are computed on first
+        access, wherefore only the ones needed are computed.
 
         * 'timeindex'
             Timeindex of the etrago-object.
@@ -301,57 +931,255 @@ def get_etrago_results_per_bus(bus_id, etrago_obj, pf_post_lopf, max_cos_phi_ren
 
     """
 
-    def dispatchable_gens():
-        dispatchable_gens_df_p = pd.DataFrame(index=timeseries_index)
-        dispatchable_gens_df_q = pd.DataFrame(index=timeseries_index)
+    return get_etrago_results_for_buses(
+        [bus_id], etrago_obj, pf_post_lopf, max_cos_phi_ren
+    )[bus_id]
+
+
+def _sum_columns_by_group(timeseries_df, groups, sort=False):
+    """
+    Sums up time series columns that share the same group key.
+
+    Parameters
+    ----------
+    timeseries_df : :pandas:`pandas.DataFrame<dataframe>`
+        Time series with component names in columns.
+    groups : list(:numpy:`numpy.ndarray<ndarray>`)
+        Group keys, e.g. bus and carrier, per column of `timeseries_df`.
+    sort : bool
+        If True, groups are sorted by their keys. Otherwise, groups are kept in
+        order of their first appearance. Default: False.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<dataframe>`
+        Aggregated time series with group keys in columns.
+
+    """
+    return timeseries_df.T.groupby(groups, sort=sort).sum().T
+
+
+def _split_columns_by_bus(timeseries_df):
+    """
+    Splits aggregated time series with (bus, carrier) columns into one dataframe
+    per bus.
+
+    Returns
+    -------
+    dict(str: :pandas:`pandas.DataFrame<dataframe>`)
+        Time series per bus with carrier in columns.
+
+    """
+    bus_level = timeseries_df.columns.get_level_values(0)
+    positions = pd.Series(np.arange(len(bus_level))).groupby(bus_level.values).indices
+    timeseries_per_bus = {}
+    for bus, bus_positions in positions.items():
+        df = timeseries_df.iloc[:, bus_positions]
+        df.columns = pd.Index(df.columns.get_level_values(1))
+        timeseries_per_bus[bus] = df
+    return timeseries_per_bus
+
+
+def _get_central_heat_store_and_feedin_specs(
+    etrago_obj, central_heat_df, timeseries_index
+):
+    """
+    Gets central thermal storage units and other feed-in into the heat buses the
+    given central PtH units feed into.
+
+    Parameters
+    ----------
+    etrago_obj : :class:`ETraGoMinimalData`
+    central_heat_df : :pandas:`pandas.DataFrame<dataframe>`
+        Central PtH links at one HV bus.
+    timeseries_index : :pandas:`pandas.DatetimeIndex<DatetimeIndex>`
+
+    Returns
+    -------
+    tuple
+        Thermal storage capacity, efficiency and SoC as well as other feed-in into
+        district heating, see 'thermal_storage_central_capacity',
+        'thermal_storage_central_efficiency', 'thermal_storage_central_soc' and
+        'feedin_district_heating' in :func:`get_etrago_results_per_bus`.
 
-        dispatchable_gens_carriers = [
-            _
-            for _ in generators_df["carrier"].unique()
-            if "solar" not in _ and "wind" not in _
+    """
+    # Stores
+    central_heat_buses = central_heat_df["bus1"].unique()
+    # find all heat stores connected to heat buses
+    central_heat_store_links_df = etrago_obj.get_heat_bus_components(
+        central_heat_buses, "store_links"
+    )
+    if central_heat_store_links_df.empty:
+        central_heat_store_capacity = pd.Series()
+        central_heat_store_efficiency = 0
+        soc_ts = pd.DataFrame()
+    else:
+        central_heat_store_df = etrago_obj.get_heat_bus_components(
+            central_heat_buses, "stores"
+        )
+        central_heat_store_df = central_heat_store_df.loc[
+            central_heat_store_df["carrier"] == "central_heat_store"
+        ].reset_index(names="store_name")
+        central_heat_store_merge_links_df = pd.merge(
+            central_heat_store_links_df,
+            central_heat_store_df,
+            left_on="bus1",
+            right_on="bus",
+        )
+        # capacity
+        central_heat_store_capacity = central_heat_store_merge_links_df.set_index(
+            "bus0"
+        ).e_nom_opt
+        # efficiency
+        central_heat_store_efficiency = central_heat_store_links_df.efficiency.values[0]
+        # SoC
+        soc_ts = etrago_obj.stores_t["e"][
+            central_heat_store_df.store_name.values
+        ].rename(columns=central_heat_store_merge_links_df.set_index("store_name").bus0)
+        soc_ts = soc_ts / central_heat_store_capacity
+
+    # Other feed-in
+    dh_feedin_df = pd.DataFrame()
+    for heat_bus in central_heat_buses:
+        # get feed-in from generators
+        heat_gens = etrago_obj.get_heat_bus_components(heat_bus, "feedin_generators")
+        if not heat_gens.empty:
+            feedin_df_gens = etrago_obj.generators_t["p"][heat_gens.index].sum(axis=1)
+        else:
+            feedin_df_gens = pd.Series(0.0, index=timeseries_index)
+        # get feed-in from links
+        # get all links feeding into heat bus (except heat store)
+        heat_links_all = etrago_obj.get_heat_bus_components(heat_bus, "feedin_links")
+        # filter out PtH units that are already considered in PtH dispatch
+        # above
+        heat_links = heat_links_all.drop(index=central_heat_df.index, errors="ignore")
+        if not heat_links.empty:
+            feedin_df_links = abs(
+                etrago_obj.links_t["p1"][heat_links.index].sum(axis=1)
+            )
+        else:
+            feedin_df_links = pd.Series(0.0, index=timeseries_index)
+        dh_feedin_df[heat_bus] = feedin_df_gens + feedin_df_links
+
+    return (
+        central_heat_store_capacity,
+        central_heat_store_efficiency,
+        soc_ts,
+        dh_feedin_df,
+    )
+
+
+def _get_rural_heat_store_specs(etrago_obj, rural_heat_df, timeseries_index):
+    """
+    Gets the thermal storage unit at the heat bus the given rural PtH units feed
+    into.
+
+    Parameters
+    ----------
+    etrago_obj : :class:`ETraGoMinimalData`
+    rural_heat_df : :pandas:`pandas.DataFrame<dataframe>`
+        Rural PtH links at one HV bus.
+    timeseries_index : :pandas:`pandas.DatetimeIndex<DatetimeIndex>`
+
+    Returns
+    -------
+    tuple
+        Thermal storage capacity, efficiency and SoC, see
+        'thermal_storage_rural_capacity', 'thermal_storage_rural_efficiency' and
+        'thermal_storage_rural_soc' in :func:`get_etrago_results_per_bus`.
+
+    """
+    # capacity
+    rural_heat_bus = rural_heat_df["bus1"].values[0]
+    rural_heat_store_link_df = etrago_obj.get_heat_bus_components(
+        rural_heat_bus, "store_links"
+    )
+    if rural_heat_store_link_df.empty:
+        rural_heat_store_capacity = 0
+        heat_store_efficiency = 0
+        soc_ts = pd.Series(0.0, index=timeseries_index)
+    else:
+        rural_heat_store_df = etrago_obj.get_heat_bus_components(
+            rural_heat_bus, "stores"
+        )
+        rural_heat_store_df = rural_heat_store_df.loc[
+            (rural_heat_store_df["bus"] == rural_heat_store_link_df.bus1.values[0])
+            & (rural_heat_store_df["carrier"] == "rural_heat_store")
         ]
-        # Filter generators_df for selected carriers.
+        rural_heat_store_capacity = rural_heat_store_df.e_nom_opt.values[0]
+        # efficiency
+        heat_store_efficiency = rural_heat_store_link_df.efficiency.values[0]
+        # SoC
+        if rural_heat_store_capacity > 0:
+            soc_ts = etrago_obj.stores_t["e"][rural_heat_store_df.index[0]]
+            soc_ts = soc_ts / rural_heat_store_capacity
+        else:
+            soc_ts = pd.Series(0.0, index=timeseries_index)
+    return rural_heat_store_capacity, heat_store_efficiency, soc_ts
+
+
+def get_etrago_results_for_buses(bus_ids, etrago_obj, pf_post_lopf, max_cos_phi_ren):
+    """
+    Gets the eTraGo interface values for several buses at once.
+
+    In contrast to calling :func:`get_etrago_results_per_bus` for each bus, the
+    components of all buses are selected once using the indexes of
+    :class:`ETraGoMinimalData` and the time series are aggregated in one grouped
+    operation per component type. As in :func:`get_etrago_results_per_bus`,
+    specifications are computed on first access, in which case the respective
+    specifications of all given buses are computed at once.
+
+    Parameters
+    ----------
+    bus_ids : list(int)
+        IDs of the corresponding HV buses.
+    etrago_obj : :class:`ETraGoMinimalData`
+        Minimal eTraGo network.
+    pf_post_lopf : bool
+        Variable if pf after lopf was run.
+    max_cos_phi_ren : float or None
+        If not None, the maximum reactive power is set by the given power factor
+        according to the dispatched active power.
+
+    Returns
+    -------
+    dict(int: :class:`LazySpecs`)
+        Dictionary with bus ID as key and results as returned by
+        :func:`get_etrago_results_per_bus` as values.
+
+    """
+
+    def zero_series():
+        return pd.Series(0.0, index=timeseries_index)
+
+    def dispatchable_gens():
         dispatchable_gens_df = generators_df[
-            generators_df["carrier"].isin(dispatchable_gens_carriers)
+            ~generators_df["carrier"].str.contains("solar|wind")
         ]
         # Rename carriers to match with carrier names in eDisGo
-        gens = dispatchable_gens_df[
-            dispatchable_gens_df.carrier.isin(["central_gas_CHP", "industrial_gas_CHP"])
-        ]
-        dispatchable_gens_df.loc[gens.index, "carrier"] = "gas_CHP"
-        gens = dispatchable_gens_df[
-            dispatchable_gens_df.carrier.isin(
-                ["central_biomass_CHP", "industrial_biomass_CHP"]
-            )
-        ]
-        dispatchable_gens_df.loc[gens.index, "carrier"] = "biomass_CHP"
-        gens = dispatchable_gens_df[dispatchable_gens_df.carrier.isin(["reservoir"])]
-        dispatchable_gens_df.loc[gens.index, "carrier"] = "run_of_river"
-        for carrier in dispatchable_gens_df.carrier.unique():
-            p_nom = dispatchable_gens_df.loc[
-                dispatchable_gens_df["carrier"] == carrier, "p_nom"
-            ].sum()
-            columns_to_aggregate = dispatchable_gens_df[
-                dispatchable_gens_df["carrier"] == carrier
-            ].index
-            dispatchable_gens_df_p[carrier] = (
-                etrago_obj.generators_t["p"][columns_to_aggregate].sum(axis="columns")
-                / p_nom
+        carriers = rename_etrago_carriers(dispatchable_gens_df["carrier"])
+        groups = [dispatchable_gens_df["bus"].values, carriers.values]
+        p_nom = dispatchable_gens_df["p_nom"].groupby(groups, sort=False).sum()
+
+        if not dispatchable_gens_df.empty:
+            gens_p = _split_columns_by_bus(
+                _sum_columns_by_group(
+                    etrago_obj.generators_t["p"][dispatchable_gens_df.index], groups
+                ).div(p_nom, axis="columns")
             )
             if pf_post_lopf:
-                dispatchable_gens_df_q[carrier] = (
-                    etrago_obj.generators_t["q"][columns_to_aggregate].sum(
-                        axis="columns"
-                    )
-                    / p_nom
-                )
-            else:
-                dispatchable_gens_df_q[carrier] = pd.Series(
-                    data=0, index=timeseries_index, dtype=float
+                gens_q = _split_columns_by_bus(
+                    _sum_columns_by_group(
+                        etrago_obj.generators_t["q"][dispatchable_gens_df.index],
+                        groups,
+                    ).div(p_nom, axis="columns")
                 )
+        else:
+            gens_p = {}
 
         # Add CHP to conventional generators (only needed in case pf_post_lopf is False,
         # otherwise it is already included above)
+        chp_p = {}
         if pf_post_lopf is False:
             chp_df = links_df[
                 links_df["carrier"].isin(
@@ -363,432 +1191,603 @@ def get_etrago_results_per_bus(bus_id, etrago_obj, pf_post_lopf, max_cos_phi_ren
                     ]
                 )
             ]
+            # CHP plants are assigned to every given bus they are connected to
+            chp_df = chp_df.assign(position=np.arange(len(chp_df)))
+            chp_df = (
+                pd.concat(
+                    [
+                        chp_df[chp_df["bus0"].isin(bus_names)].assign(
+                            bus=chp_df["bus0"]
+                        ),
+                        chp_df[chp_df["bus1"].isin(bus_names)].assign(
+                            bus=chp_df["bus1"]
+                        ),
+                    ]
+                )
+                .reset_index(names="link_name")
+                .drop_duplicates(subset=["link_name", "bus"])
+                .sort_values("position", kind="stable")
+            )
             if not chp_df.empty:
                 # Rename CHP carrier to match with carrier names in eDisGo
-                gens_gas_chp = chp_df[
-                    chp_df.carrier.isin(["central_gas_CHP", "industrial_gas_CHP"])
-                ]
-                chp_df.loc[gens_gas_chp.index, "carrier"] = "gas_CHP"
-                gens_biomass_chp = chp_df[
-                    chp_df.carrier.isin(
-                        ["central_biomass_CHP", "industrial_biomass_CHP"]
-                    )
-                ]
-                chp_df.loc[gens_biomass_chp.index, "carrier"] = "biomass_CHP"
-
-                for carrier in chp_df.carrier.unique():
-                    p_nom = chp_df.loc[chp_df["carrier"] == carrier, "p_nom"].sum()
-                    columns_to_aggregate = chp_df[chp_df["carrier"] == carrier].index
-                    dispatchable_gens_df_p[carrier] = abs(
-                        etrago_obj.links_t["p1"][columns_to_aggregate].sum(
-                            axis="columns"
-                        )
-                        / p_nom
-                    )
-                    dispatchable_gens_df_q[carrier] = pd.Series(
-                        data=0, index=timeseries_index, dtype=float
+                carriers = rename_etrago_carriers(chp_df["carrier"])
+                groups = [chp_df["bus"].values, carriers.values]
+                p_nom_chp = chp_df["p_nom"].groupby(groups, sort=False).sum()
+                chp_p = _split_columns_by_bus(
+                    abs(
+                        _sum_columns_by_group(
+                            etrago_obj.links_t["p1"][chp_df["link_name"].values],
+                            groups,
+                        ).div(p_nom_chp, axis="columns")
                     )
+                )
 
-        if (dispatchable_gens_df_p < -1e-3).any().any():
-            logger.warning("Dispatchable generator feed-in values smaller -1 kW.")
-        results["dispatchable_generators_active_power"] = dispatchable_gens_df_p
-        results["dispatchable_generators_reactive_power"] = dispatchable_gens_df_q
+        for bus, bus_id in bus_names.items():
+            if bus in gens_p:
+                dispatchable_gens_df_p = gens_p[bus]
+                if pf_post_lopf:
+                    dispatchable_gens_df_q = gens_q[bus]
+                else:
+                    dispatchable_gens_df_q = pd.DataFrame(
+                        0.0, index=timeseries_index, columns=gens_p[bus].columns
+                    )
+            else:
+                dispatchable_gens_df_p = pd.DataFrame(index=timeseries_index)
+                dispatchable_gens_df_q = pd.DataFrame(index=timeseries_index)
+            if bus in chp_p:
+                for carrier in chp_p[bus].columns:
+                    dispatchable_gens_df_p[carrier] = chp_p[bus][carrier]
+                    dispatchable_gens_df_q[carrier] = zero_series()
+
+            if (dispatchable_gens_df_p < -1e-3).any().any():
+                logger.warning(
+                    f"Dispatchable generator feed-in values smaller -1 kW at bus "
+                    f"{bus_id}."
+                )
+            results[bus_id][
+                "dispatchable_generators_active_power"
+            ] = dispatchable_gens_df_p
+            results[bus_id][
+                "dispatchable_generators_reactive_power"
+            ] = dispatchable_gens_df_q
 
     def renewable_generators():
-
-        weather_dep_gens = ["solar", "solar_rooftop", "wind_onshore"]
-        renaming_carrier_dict = {
-            "solar": ["solar", "solar_rooftop"],
-            "wind": ["wind_onshore"],
-        }
         weather_dep_gens_df = generators_df[
-            generators_df.carrier.isin(weather_dep_gens)
+            generators_df["carrier"].isin(["solar", "solar_rooftop", "wind_onshore"])
         ]
-
         # Rename carrier to aggregate to carriers
-        for new_carrier_name, item in renaming_carrier_dict.items():
-            for carrier in item:
-                weather_dep_gens_df.loc[
-                    weather_dep_gens_df["carrier"] == carrier, "carrier"
-                ] = new_carrier_name
+        carriers = rename_etrago_carriers(weather_dep_gens_df["carrier"])
+        groups = [weather_dep_gens_df["bus"].values, carriers.values]
 
         # Aggregation of p_nom
-        agg_weather_dep_gens_df = (
-            weather_dep_gens_df.groupby(["carrier"]).agg({"p_nom": "sum"}).reset_index()
-        )
-
-        # Initialize dfs
-        # potential
-        weather_dep_gens_df_pot_p = pd.DataFrame(
-            0.0,
-            index=timeseries_index,
-            columns=agg_weather_dep_gens_df.carrier.unique(),
-        )
-        # reactive power
-        weather_dep_gens_df_dis_q = pd.DataFrame(
-            0.0,
-            index=timeseries_index,
-            columns=agg_weather_dep_gens_df.carrier.unique(),
-        )
-        # curtailment
-        weather_dep_gens_df_curt_p = pd.DataFrame(
-            0.0,
-            index=timeseries_index,
-            columns=agg_weather_dep_gens_df.carrier.unique(),
-        )
-
-        for index, carrier, p_nom in weather_dep_gens_df[
-            ["carrier", "p_nom"]
-        ].itertuples():
-            # get index in aggregated dataframe to determine total installed capacity
-            # of the respective carrier
-            agg_idx = agg_weather_dep_gens_df[
-                agg_weather_dep_gens_df["carrier"] == carrier
-            ].index.values[0]
-            p_nom_agg = agg_weather_dep_gens_df.loc[agg_idx, "p_nom"]
-
-            p_series = etrago_obj.generators_t["p"][index]
-            p_max_pu_series = etrago_obj.generators_t["p_max_pu"][index]
-            p_max_pu_normed_series = p_max_pu_series * p_nom / p_nom_agg
-
+        p_nom_agg = weather_dep_gens_df["p_nom"].groupby(groups).sum()
+        # total installed capacity of the respective carrier at the respective bus
+        p_nom_agg_per_gen = p_nom_agg.reindex(pd.MultiIndex.from_arrays(groups)).values
+        p_nom = weather_dep_gens_df["p_nom"].values
+
+        if not weather_dep_gens_df.empty:
+            p_df = etrago_obj.generators_t["p"][weather_dep_gens_df.index]
+            p_max_pu_df = etrago_obj.generators_t["p_max_pu"][weather_dep_gens_df.index]
+
+            potential = _split_columns_by_bus(
+                _sum_columns_by_group(
+                    p_max_pu_df * (p_nom / p_nom_agg_per_gen), groups, sort=True
+                )
+            )
+            curtailment = _split_columns_by_bus(
+                _sum_columns_by_group(p_max_pu_df * p_nom - p_df, groups, sort=True)
+            )
             if pf_post_lopf:
-                q_series = etrago_obj.generators_t["q"][index]
+                q_df = etrago_obj.generators_t["q"][weather_dep_gens_df.index]
                 # If set limit maximum reactive power
                 if max_cos_phi_ren:
                     logger.info(
                         "Applying Q limit (max cos(phi)={})".format(max_cos_phi_ren)
                     )
-                    phi = math.acos(max_cos_phi_ren)
-                    for timestep in timeseries_index:
-                        p = p_series[timestep]
-                        q = q_series[timestep]
-                        q_max = p * math.tan(phi)
-                        q_min = -p * math.tan(phi)
-                        if q > q_max:
-                            q = q_max
-                        elif q < q_min:
-                            q = q_min
-                        q_series[timestep] = q
-                q_normed_series = q_series / p_nom_agg
+                    tan_phi = math.tan(math.acos(max_cos_phi_ren))
+                    q_max = p_df * tan_phi
+                    q_min = -p_df * tan_phi
+                    q_df = q_df.mask(q_df > q_max, q_max).mask(
+                        (q_df <= q_max) & (q_df < q_min), q_min
+                    )
+                reactive_power = _split_columns_by_bus(
+                    _sum_columns_by_group(q_df / p_nom_agg_per_gen, groups, sort=True)
+                )
+        else:
+            potential, curtailment = {}, {}
+
+        for bus, bus_id in bus_names.items():
+            if bus in potential:
+                weather_dep_gens_df_pot_p = potential[bus]
+                weather_dep_gens_df_curt_p = curtailment[bus]
+                if pf_post_lopf:
+                    weather_dep_gens_df_dis_q = reactive_power[bus]
+                else:
+                    weather_dep_gens_df_dis_q = pd.DataFrame(
+                        0.0, index=timeseries_index, columns=potential[bus].columns
+                    )
+                renewables_p_nom = pd.Series(
+                    p_nom_agg.loc[bus].values,
+                    index=pd.Index(
+                        potential[bus].columns, name="carrier", dtype=object
+                    ),
+                    name="p_nom",
+                )
             else:
-                q_normed_series = pd.Series(0.0, index=timeseries_index)
-
-            weather_dep_gens_df_pot_p[carrier] += p_max_pu_normed_series
-            weather_dep_gens_df_dis_q[carrier] += q_normed_series
-            weather_dep_gens_df_curt_p[carrier] += p_max_pu_series * p_nom - p_series
+                weather_dep_gens_df_pot_p = pd.DataFrame(
+                    0.0, index=timeseries_index, columns=[]
+                )
+                weather_dep_gens_df_curt_p = pd.DataFrame(
+                    0.0, index=timeseries_index, columns=[]
+                )
+                weather_dep_gens_df_dis_q = pd.DataFrame(
+                    0.0, index=timeseries_index, columns=[]
+                )
+                renewables_p_nom = pd.Series(
+                    dtype=float,
+                    index=pd.Index([], name="carrier", dtype=object),
+                    name="p_nom",
+                )
 
-        if (weather_dep_gens_df_curt_p.min() < -1e-3).any():
-            logger.warning("Curtailment values smaller -1 kW.")
+            if (weather_dep_gens_df_curt_p.min() < -1e-3).any():
+                logger.warning(f"Curtailment values smaller -1 kW at bus {bus_id}.")
 
-        results["renewables_potential"] = weather_dep_gens_df_pot_p
-        results["renewables_curtailment"] = weather_dep_gens_df_curt_p
-        results["renewables_dispatch_reactive_power"] = weather_dep_gens_df_dis_q
-        results["renewables_p_nom"] = agg_weather_dep_gens_df.set_index("carrier").p_nom
+            results[bus_id]["renewables_potential"] = weather_dep_gens_df_pot_p
+            results[bus_id]["renewables_curtailment"] = weather_dep_gens_df_curt_p
+            results[bus_id][
+                "renewables_dispatch_reactive_power"
+            ] = weather_dep_gens_df_dis_q
+            results[bus_id]["renewables_p_nom"] = renewables_p_nom
 
     def storages():
         # Filter batteries
-        storages_df = etrago_obj.storage_units.loc[
-            (etrago_obj.storage_units["carrier"] == "battery")
-            & (etrago_obj.storage_units["bus"] == str(bus_id))
+        storages_df = etrago_obj.get_components("storage_units", "carrier", "battery")
+        storages_df = storages_df.loc[storages_df["bus"].isin(bus_names)]
+        groups = storages_df["bus"].values
+        # p_nom - p_nom_opt can always be used, if extendable is True or False
+        storages_p_nom = storages_df["p_nom_opt"].groupby(groups).sum()
+        # Capacity
+        storages_max_hours = storages_df.drop_duplicates(subset="bus").set_index("bus")[
+            "max_hours"
         ]
         if not storages_df.empty:
-            # p_nom - p_nom_opt can always be used, if extendable is True or False
-            storages_df_p_nom = storages_df["p_nom_opt"].sum()
-            # Capacity
-            storages_df_max_hours = (storages_df["max_hours"]).values[0]
-            storages_cap = storages_df_p_nom * storages_df_max_hours
             # p and q
-            storages_df_p = etrago_obj.storage_units_t["p"][storages_df.index].sum(
-                axis=1
+            storages_p = _sum_columns_by_group(
+                etrago_obj.storage_units_t["p"][storages_df.index], groups
             )
             if pf_post_lopf:
-                storages_df_q = etrago_obj.storage_units_t["q"][storages_df.index].sum(
-                    axis=1
-                )
-            else:
-                storages_df_q = pd.Series(0.0, index=timeseries_index)
-            storages_df_soc = (
-                etrago_obj.storage_units_t["state_of_charge"][storages_df.index].sum(
-                    axis=1
+                storages_q = _sum_columns_by_group(
+                    etrago_obj.storage_units_t["q"][storages_df.index], groups
                 )
-                / storages_cap
+            storages_soc = _sum_columns_by_group(
+                etrago_obj.storage_units_t["state_of_charge"][storages_df.index], groups
             )
 
-        else:
-            storages_df_p_nom = 0
-            storages_df_max_hours = 0
-            storages_df_p = pd.Series(0.0, index=timeseries_index)
-            storages_df_q = pd.Series(0.0, index=timeseries_index)
-            storages_df_soc = pd.Series(0.0, index=timeseries_index)
-        results["storage_units_p_nom"] = storages_df_p_nom
-        results["storage_units_max_hours"] = storages_df_max_hours
-        results["storage_units_active_power"] = storages_df_p
-        results["storage_units_reactive_power"] = storages_df_q
-        results["storage_units_soc"] = storages_df_soc
+        for bus, bus_id in bus_names.items():
+            if bus in storages_p_nom.index:
+                storages_df_p_nom = storages_p_nom.at[bus]
+                storages_df_max_hours = storages_max_hours.at[bus]
+                storages_cap = storages_df_p_nom * storages_df_max_hours
+                storages_df_p = storages_p[bus].rename(None)
+                if pf_post_lopf:
+                    storages_df_q = storages_q[bus].rename(None)
+                else:
+                    storages_df_q = zero_series()
+                storages_df_soc = storages_soc[bus].rename(None) / storages_cap
+            else:
+                storages_df_p_nom = 0
+                storages_df_max_hours = 0
+                storages_df_p = zero_series()
+                storages_df_q = zero_series()
+                storages_df_soc = zero_series()
+            results[bus_id]["storage_units_p_nom"] = storages_df_p_nom
+            results[bus_id]["storage_units_max_hours"] = storages_df_max_hours
+            results[bus_id]["storage_units_active_power"] = storages_df_p
+            results[bus_id]["storage_units_reactive_power"] = storages_df_q
+            results[bus_id]["storage_units_soc"] = storages_df_soc
+
+    def links_p0_per_bus(carriers):
+        # Sums up p0 of all links with the given carriers per bus0
+        selected_links_df = etrago_obj.get_components("links", "carrier", carriers)
+        selected_links_df = selected_links_df.loc[
+            selected_links_df["bus0"].isin(bus_names)
+        ]
+        if selected_links_df.empty:
+            return pd.DataFrame(index=timeseries_index)
+        return _sum_columns_by_group(
+            etrago_obj.links_t["p0"][selected_links_df.index],
+            selected_links_df["bus0"].values,
+        )
 
     def dsm():
         # not needed in eDisGo in low flex scenario (dsm_df will be empty in that case)
         # DSM
-        dsm_df = links_df.loc[
-            (links_df["carrier"] == "dsm") & (links_df["bus0"] == str(bus_id))
-        ]
-        if not dsm_df.empty:
-            dsm_df_p = etrago_obj.links_t["p0"][dsm_df.index].sum(axis=1)
-        else:
-            dsm_df_p = pd.Series(0.0, index=timeseries_index)
-        results["dsm_active_power"] = dsm_df_p
+        dsm_p = links_p0_per_bus(["dsm"])
+        for bus, bus_id in bus_names.items():
+            if bus in dsm_p.columns:
+                dsm_df_p = dsm_p[bus].rename(None)
+            else:
+                dsm_df_p = zero_series()
+            results[bus_id]["dsm_active_power"] = dsm_df_p
 
     def central_heat():
-
         central_heat_carriers = ["central_heat_pump", "central_resistive_heater"]
-        central_heat_df = links_df.loc[
-            (links_df["carrier"].isin(central_heat_carriers))
-            & (links_df["bus0"] == str(bus_id))
-            & (links_df["p_nom"] <= 20)
+        central_heat_links_df = etrago_obj.get_components(
+            "links", "carrier", central_heat_carriers
+        )
+        central_heat_links_df = central_heat_links_df.loc[
+            (central_heat_links_df["bus0"].isin(bus_names))
+            & (central_heat_links_df["p_nom"] <= 20)
         ]
-        if not central_heat_df.empty:
-            # Timeseries
-            central_heat_df_p = etrago_obj.links_t["p0"][central_heat_df.index].sum(
-                axis=1
+        central_heat_positions = central_heat_links_df.groupby("bus0").indices
+        if not central_heat_links_df.empty:
+            central_heat_p = _sum_columns_by_group(
+                etrago_obj.links_t["p0"][central_heat_links_df.index],
+                central_heat_links_df["bus0"].values,
             )
-            central_heat_df_q = pd.Series(0.0, index=timeseries_index)
 
-            # Nominal power of PtH units
-            p_nom = central_heat_df.p_nom.sum()
-
-            # Stores
-            central_heat_buses = central_heat_df["bus1"].unique()
-            # find all heat stores connected to heat buses
-            central_heat_store_links_df = etrago_obj.links.loc[
-                etrago_obj.links["bus0"].isin(central_heat_buses)
-            ]
-            if central_heat_store_links_df.empty:
+        for bus, bus_id in bus_names.items():
+            if bus in central_heat_positions:
+                central_heat_df = central_heat_links_df.iloc[
+                    central_heat_positions[bus]
+                ]
+                # Timeseries
+                central_heat_df_p = central_heat_p[bus].rename(None)
+                central_heat_df_q = zero_series()
+
+                # Nominal power of PtH units
+                p_nom = central_heat_df.p_nom.sum()
+
+                # Stores and other feed-in
+                (
+                    central_heat_store_capacity,
+                    central_heat_store_efficiency,
+                    soc_ts,
+                    dh_feedin_df,
+                ) = _get_central_heat_store_and_feedin_specs(
+                    etrago_obj, central_heat_df, timeseries_index
+                )
+            else:
+                central_heat_df_p = zero_series()
+                central_heat_df_q = zero_series()
+                p_nom = 0
                 central_heat_store_capacity = pd.Series()
                 central_heat_store_efficiency = 0
                 soc_ts = pd.DataFrame()
-            else:
-                central_heat_store_df = etrago_obj.stores.loc[
-                    (etrago_obj.stores["carrier"] == "central_heat_store")
-                    & (
-                        etrago_obj.stores["bus"].isin(
-                            central_heat_store_links_df.bus1.values
-                        )
-                    )
-                ].reset_index(names="store_name")
-                central_heat_store_merge_links_df = pd.merge(
-                    central_heat_store_links_df,
-                    central_heat_store_df,
-                    left_on="bus1",
-                    right_on="bus",
-                )
-                # capacity
-                central_heat_store_capacity = (
-                    central_heat_store_merge_links_df.set_index("bus0").e_nom_opt
-                )
-                # efficiency
-                central_heat_store_efficiency = (
-                    central_heat_store_links_df.efficiency.values[0]
-                )
-                # SoC
-                soc_ts = etrago_obj.stores_t["e"][
-                    central_heat_store_df.store_name.values
-                ].rename(
-                    columns=central_heat_store_merge_links_df.set_index(
-                        "store_name"
-                    ).bus0
-                )
-                soc_ts = soc_ts / central_heat_store_capacity
-
-            # Other feed-in
-            dh_feedin_df = pd.DataFrame()
-            for heat_bus in central_heat_buses:
-                # get feed-in from generators
-                heat_gens = etrago_obj.generators[
-                    (etrago_obj.generators["bus"] == heat_bus)
-                    & (etrago_obj.generators["carrier"] != "load shedding")
-                ]
-                if not heat_gens.empty:
-                    feedin_df_gens = etrago_obj.generators_t["p"][heat_gens.index].sum(
-                        axis=1
-                    )
-                else:
-                    feedin_df_gens = pd.Series(0.0, index=timeseries_index)
-                # get feed-in from links
-                # get all links feeding into heat bus (except heat store)
-                heat_links_all = etrago_obj.links[
-                    (etrago_obj.links["bus1"] == heat_bus)
-                    & (
-                        etrago_obj.links["carrier"].isin(
-                            [
-                                "central_gas_boiler",
-                                "central_gas_CHP_heat",
-                                "central_heat_pump",
-                                "central_resistive_heater",
-                            ]
-                        )
-                    )
-                ]
-                # filter out PtH units that are already considered in PtH dispatch
-                # above
-                heat_links = heat_links_all.drop(
-                    index=central_heat_df.index, errors="ignore"
-                )
-                if not heat_links.empty:
-                    feedin_df_links = abs(
-                        etrago_obj.links_t["p1"][heat_links.index].sum(axis=1)
-                    )
-                else:
-                    feedin_df_links = pd.Series(0.0, index=timeseries_index)
-                dh_feedin_df[heat_bus] = feedin_df_gens + feedin_df_links
-        else:
-            central_heat_df_p = pd.Series(0.0, index=timeseries_index)
-            central_heat_df_q = pd.Series(0.0, index=timeseries_index)
-            p_nom = 0
-            central_heat_store_capacity = pd.Series()
-            central_heat_store_efficiency = 0
-            soc_ts = pd.DataFrame()
-            dh_feedin_df = pd.DataFrame()
-
-        results["heat_pump_central_active_power"] = central_heat_df_p
-        results["heat_pump_central_reactive_power"] = central_heat_df_q
-        results["heat_pump_central_p_nom"] = p_nom
-        results["thermal_storage_central_capacity"] = central_heat_store_capacity
-        results["thermal_storage_central_efficiency"] = central_heat_store_efficiency
-        results["thermal_storage_central_soc"] = soc_ts
-        results["feedin_district_heating"] = dh_feedin_df
+                dh_feedin_df = pd.DataFrame()
+
+            results[bus_id]["heat_pump_central_active_power"] = central_heat_df_p
+            results[bus_id]["heat_pump_central_reactive_power"] = central_heat_df_q
+            results[bus_id]["heat_pump_central_p_nom"] = p_nom
+            results[bus_id][
+                "thermal_storage_central_capacity"
+            ] = central_heat_store_capacity
+            results[bus_id][
+                "thermal_storage_central_efficiency"
+            ] = central_heat_store_efficiency
+            results[bus_id]["thermal_storage_central_soc"] = soc_ts
+            results[bus_id]["feedin_district_heating"] = dh_feedin_df
 
     def rural_heat():
         # not needed in eDisGo in low flex scenario, but obtained anyway
-        # ToDo (low priority) add resistive heaters (they only exist in eGon100RE)
-        rural_heat_carriers = ["rural_heat_pump"]
-        rural_heat_df = links_df.loc[
-            links_df["carrier"].isin(rural_heat_carriers)
-            & (links_df["bus0"] == str(bus_id))
+        rural_heat_links_df = etrago_obj.get_components(
+            "links", "carrier", "rural_heat_pump"
+        )
+        rural_heat_links_df = rural_heat_links_df.loc[
+            rural_heat_links_df["bus0"].isin(bus_names)
         ]
-        if not rural_heat_df.empty:
-            # Timeseries
-            rural_heat_df_p = etrago_obj.links_t["p0"][rural_heat_df.index].sum(axis=1)
-            rural_heat_df_q = pd.Series(0.0, index=timeseries_index)
-            # p_nom
-            rural_heat_p_nom = rural_heat_df.p_nom.sum()
-            # Store
-            # capacity
-            rural_heat_bus = rural_heat_df["bus1"].values[0]
-            rural_heat_store_link_df = etrago_obj.links.loc[
-                etrago_obj.links["bus0"] == rural_heat_bus
-            ]
-            if rural_heat_store_link_df.empty:
+        rural_heat_positions = rural_heat_links_df.groupby("bus0").indices
+        if not rural_heat_links_df.empty:
+            rural_heat_p = _sum_columns_by_group(
+                etrago_obj.links_t["p0"][rural_heat_links_df.index],
+                rural_heat_links_df["bus0"].values,
+            )
+
+        for bus, bus_id in bus_names.items():
+            if bus in rural_heat_positions:
+                rural_heat_df = rural_heat_links_df.iloc[rural_heat_positions[bus]]
+                # Timeseries
+                rural_heat_df_p = rural_heat_p[bus].rename(None)
+                rural_heat_df_q = zero_series()
+                # p_nom
+                rural_heat_p_nom = rural_heat_df.p_nom.sum()
+                # Store
+                (
+                    rural_heat_store_capacity,
+                    heat_store_efficiency,
+                    soc_ts,
+                ) = _get_rural_heat_store_specs(
+                    etrago_obj, rural_heat_df, timeseries_index
+                )
+            else:
+                rural_heat_df_p = zero_series()
+                rural_heat_df_q = zero_series()
+                rural_heat_p_nom = 0
                 rural_heat_store_capacity = 0
                 heat_store_efficiency = 0
-                soc_ts = pd.Series(0.0, index=timeseries_index)
-            else:
-                rural_heat_store_df = etrago_obj.stores.loc[
-                    (etrago_obj.stores["carrier"] == "rural_heat_store")
-                    & (
-                        etrago_obj.stores["bus"]
-                        == rural_heat_store_link_df.bus1.values[0]
-                    )
-                ]
-                rural_heat_store_capacity = rural_heat_store_df.e_nom_opt.values[0]
-                # efficiency
-                heat_store_efficiency = rural_heat_store_link_df.efficiency.values[0]
-                # SoC
-                if rural_heat_store_capacity > 0:
-                    soc_ts = etrago_obj.stores_t["e"][rural_heat_store_df.index[0]]
-                    soc_ts = soc_ts / rural_heat_store_capacity
-                else:
-                    soc_ts = pd.Series(0.0, index=timeseries_index)
-        else:
-            rural_heat_df_p = pd.Series(0.0, index=timeseries_index)
-            rural_heat_df_q = pd.Series(0.0, index=timeseries_index)
-            rural_heat_p_nom = 0
-            rural_heat_store_capacity = 0
-            heat_store_efficiency = 0
-            soc_ts = pd.Series(0.0, index=timeseries_index)
+                soc_ts = zero_series()
 
-        results["heat_pump_rural_active_power"] = rural_heat_df_p
-        results["heat_pump_rural_reactive_power"] = rural_heat_df_q
-        results["heat_pump_rural_p_nom"] = rural_heat_p_nom
-        results["thermal_storage_rural_capacity"] = rural_heat_store_capacity
-        results["thermal_storage_rural_efficiency"] = heat_store_efficiency
-        results["thermal_storage_rural_soc"] = soc_ts
+            results[bus_id]["heat_pump_rural_active_power"] = rural_heat_df_p
+            results[bus_id]["heat_pump_rural_reactive_power"] = rural_heat_df_q
+            results[bus_id]["heat_pump_rural_p_nom"] = rural_heat_p_nom
+            results[bus_id][
+                "thermal_storage_rural_capacity"
+            ] = rural_heat_store_capacity
+            results[bus_id]["thermal_storage_rural_efficiency"] = heat_store_efficiency
+            results[bus_id]["thermal_storage_rural_soc"] = soc_ts
 
     def bev_charger():
         # not needed in eDisGo in low flex scenario (bev_charger_df will be empty in
         # that case)
         # BEV charger
-        bev_charger_df = links_df.loc[
-            (links_df["carrier"] == "BEV_charger") & (links_df["bus0"] == str(bus_id))
-        ]
-        if not bev_charger_df.empty:
-            bev_charger_df_p = etrago_obj.links_t["p0"][bev_charger_df.index].sum(
-                axis=1
-            )
-            bev_charger_df_q = pd.Series(0.0, index=timeseries_index)
-        else:
-            bev_charger_df_p = pd.Series(0.0, index=timeseries_index)
-            bev_charger_df_q = pd.Series(0.0, index=timeseries_index)
-
-        results["electromobility_active_power"] = bev_charger_df_p
-        results["electromobility_reactive_power"] = bev_charger_df_q
+        bev_charger_p = links_p0_per_bus(["BEV_charger"])
+        for bus, bus_id in bus_names.items():
+            if bus in bev_charger_p.columns:
+                bev_charger_df_p = bev_charger_p[bus].rename(None)
+            else:
+                bev_charger_df_p = zero_series()
+            results[bus_id]["electromobility_active_power"] = bev_charger_df_p
+            results[bus_id]["electromobility_reactive_power"] = zero_series()
 
     # Function part
     t_start = time.perf_counter()
 
-    logger.info("Specs for bus {}".format(bus_id))
+    # bus names as used in eTraGo components mapped to given bus IDs
+    bus_names = {str(bus_id): bus_id for bus_id in bus_ids}
+
+    logger.info("Specs for {} buses".format(len(bus_names)))
     if pf_post_lopf:
         logger.info("Active and reactive power interface")
     else:
         logger.info("Only active power interface")
 
-    results = {}
-
     timeseries_index = etrago_obj.snapshots
-    results["timeindex"] = timeseries_index
+    results = {bus_id: LazySpecs() for bus_id in bus_names.values()}
+    for specs in results.values():
+        specs["timeindex"] = timeseries_index
 
-    # Filter dataframes by bus_id
+    # Filter dataframes by bus_ids
     # Generators
-    generators_df = etrago_obj.generators[etrago_obj.generators["bus"] == str(bus_id)]
+    generators_df = etrago_obj.get_components("generators", "bus", list(bus_names))
     # Links
-    links_df = etrago_obj.links[
-        (etrago_obj.links["bus0"] == str(bus_id))
-        | (etrago_obj.links["bus1"] == str(bus_id))
-    ]
-
-    # Fill results
-    dispatchable_gens()
-    renewable_generators()
-    storages()
-    dsm()
-    central_heat()
-    rural_heat()
-    bev_charger()
+    links_df = etrago_obj.get_components("links", ["bus0", "bus1"], list(bus_names))
+
+    # Fill results of all buses on first access
+    evaluators = {
+        dispatchable_gens: [
+            "dispatchable_generators_active_power",
+            "dispatchable_generators_reactive_power",
+        ],
+        renewable_generators: [
+            "renewables_potential",
+            "renewables_curtailment",
+            "renewables_dispatch_reactive_power",
+            "renewables_p_nom",
+        ],
+        storages: [
+            "storage_units_p_nom",
+            "storage_units_max_hours",
+            "storage_units_active_power",
+            "storage_units_reactive_power",
+            "storage_units_soc",
+        ],
+        dsm: ["dsm_active_power"],
+        central_heat: [
+            "heat_pump_central_active_power",
+            "heat_pump_central_reactive_power",
+            "heat_pump_central_p_nom",
+            "thermal_storage_central_capacity",
+            "thermal_storage_central_efficiency",
+            "thermal_storage_central_soc",
+            "feedin_district_heating",
+        ],
+        rural_heat: [
+            "heat_pump_rural_active_power",
+            "heat_pump_rural_reactive_power",
+            "heat_pump_rural_p_nom",
+            "thermal_storage_rural_capacity",
+            "thermal_storage_rural_efficiency",
+            "thermal_storage_rural_soc",
+        ],
+        bev_charger: ["electromobility_active_power", "electromobility_reactive_power"],
+    }
+    for evaluator, keys in evaluators.items():
+        for specs in results.values():
+            specs.add_evaluator(evaluator, keys)
     logger.info(f"Overall time: {time.perf_counter() - t_start}")
 
     return results
 
 
+def export_etrago_specs(
+    bus_ids, etrago_obj, pf_post_lopf, max_cos_phi_ren, directory, chunk_size=100
+):
+    """
+    Exports specifications from the overlying grid for the given HV buses.
+
+    The specifications as returned by :func:`get_etrago_results_per_bus` are
+    written to a Parquet dataset partitioned by bus ID in the subdirectory
+    "specs" of the given directory. Each row of the dataset contains one column
+    of a dataframe, one series or one scalar value. The time index all time series
+    share is written to "timeindex.parquet". The specifications of one bus can
+    be read using :func:`import_etrago_specs` without the eTraGo network.
+
+    Parameters
+    ----------
+    bus_ids : list(int)
+        IDs of the corresponding HV buses.
+    etrago_obj : :class:`ETraGoMinimalData`
+    pf_post_lopf : bool
+        Variable if pf after lopf was run.
+    max_cos_phi_ren : float or None
+        If not None, the maximum reactive power is set by the given power factor
+        according to the dispatched active power.
+    directory : str
+        Directory to write the dataset to. Already exported specifications of the
+        given buses are overwritten.
+    chunk_size : int
+        Number of buses whose specifications are determined and written at once.
+        Default: 100.
+
+    """
+
+    def spec_to_rows(bus_id, key, value):
+        row = {
+            "bus_id": bus_id,
+            "key": key,
+            "column": None,
+            "name": None,
+            "index_name": None,
+        }
+        if isinstance(value, pd.DataFrame):
+            name = value.columns.name
+            row.update(kind="frame", name=None if name is None else str(name))
+            if value.empty:
+                return [dict(row, values=[])]
+            return [
+                dict(row, column=str(column), values=value[column].values)
+                for column in value.columns
+            ]
+        elif isinstance(value, pd.Series) and value.index.equals(timeseries_index):
+            row.update(kind="series", values=value.values)
+            row["name"] = None if value.name is None else str(value.name)
+            return [row]
+        elif isinstance(value, pd.Series):
+            row.update(
+                kind="labeled_series",
+                name=None if value.name is None else str(value.name),
+                index_name=None if value.index.name is None else str(value.index.name),
+            )
+            if value.empty:
+                return [dict(row, values=[])]
+            return [
+                dict(row, column=str(label), values=[val])
+                for label, val in value.items()
+            ]
+        else:
+            return [dict(row, kind="scalar", values=[value])]
+
+    t_start = time.perf_counter()
+
+    timeseries_index = etrago_obj.snapshots
+    specs_dir = os.path.join(directory, "specs")
+    os.makedirs(specs_dir, exist_ok=True)
+    pd.DataFrame(index=timeseries_index).to_parquet(
+        os.path.join(directory, "timeindex.parquet")
+    )
+
+    for start in range(0, len(bus_ids), chunk_size):
+        chunk = bus_ids[start : start + chunk_size]
+        specs = get_etrago_results_for_buses(
+            chunk, etrago_obj, pf_post_lopf, max_cos_phi_ren
+        )
+        rows = [
+            row
+            for bus_id, specs_per_bus in specs.items()
+            for key, value in specs_per_bus.items()
+            if key != "timeindex"
+            for row in spec_to_rows(bus_id, key, value)
+        ]
+        for row in rows:
+            row["values"] = np.asarray(row["values"], dtype=float)
+        pd.DataFrame(rows).to_parquet(
+            specs_dir,
+            partition_cols=["bus_id"],
+            index=False,
+            existing_data_behavior="delete_matching",
+        )
+        logger.info(f"Exported specs of {start + len(chunk)} of {len(bus_ids)} buses.")
+
+    logger.info(f"Overall export time: {time.perf_counter() - t_start}")
+
+
+def import_etrago_specs(bus_id, directory):
+    """
+    Imports specifications from the overlying grid exported with
+    :func:`export_etrago_specs`.
+
+    Parameters
+    ----------
+    bus_id : int
+        ID of the corresponding HV bus.
+    directory : str
+        Directory the specifications were exported to.
+
+    Returns
+    -------
+    dict
+        Specifications as returned by :func:`get_etrago_results_per_bus`. Empty
+        dataframes are returned with the time index as index.
+
+    """
+    timeseries_index = pd.read_parquet(
+        os.path.join(directory, "timeindex.parquet")
+    ).index
+    rows = pd.read_parquet(os.path.join(directory, "specs", f"bus_id={bus_id}"))
+
+    specs = {"timeindex": timeseries_index}
+    for key, rows_per_key in rows.groupby("key", sort=False):
+        kind, name, index_name = rows_per_key.iloc[0][["kind", "name", "index_name"]]
+        if kind == "frame":
+            rows_per_key = rows_per_key.dropna(subset=["column"])
+            specs[key] = pd.DataFrame(
+                dict(zip(rows_per_key["column"], rows_per_key["values"])),
+                index=timeseries_index,
+                columns=pd.Index(rows_per_key["column"].tolist(), dtype=object),
+            )
+            specs[key].columns.name = name
+        elif kind == "series":
+            specs[key] = pd.Series(
+                rows_per_key["values"].iloc[0], index=timeseries_index, name=name
+            )
+        elif kind == "labeled_series":
+            rows_per_key = rows_per_key.dropna(subset=["column"])
+            specs[key] = pd.Series(
+                [values[0] for values in rows_per_key["values"]],
+                index=pd.Index(
+                    rows_per_key["column"].tolist(), dtype=object, name=index_name
+                ),
+                name=name,
+                dtype=float,
+            )
+        else:
+            specs[key] = float(rows_per_key["values"].iloc[0][0])
+    return specs
+
+
+def rename_etrago_carriers(carriers):
+    """
+    Renames eTraGo carriers to match carrier names in eDisGo.
+
+    Parameters
+    ----------
+    carriers : :pandas:`pandas.Series<Series>`
+        eTraGo carriers.
+
+    Returns
+    -------
+    :pandas:`pandas.Series<Series>`
+        Carriers renamed according to :attr:`CARRIER_MAPPING`. Carriers not
+        contained in the mapping keep their name.
+
+    """
+    return carriers.replace(CARRIER_MAPPING["etrago"])
+
+
 def rename_generator_carriers_edisgo(edisgo_grid):
     """
     Helper function to rename carriers so that they match carrier names in eTraGo.
 
     """
     generators_df = edisgo_grid.topology.generators_df
+    carriers = generators_df["type"].map(CARRIER_MAPPING["edisgo"])
     if "p_nom_th" in generators_df.columns:
-        gens_rename = generators_df[
-            (generators_df["type"].isin(["gas", "gas extended", "oil", "others"]))
-            & (~generators_df["p_nom_th"].isna())
-        ]
-        generators_df.loc[gens_rename.index, "type"] = "gas_CHP"
-        gens_rename = generators_df[
-            (generators_df["type"].isin(["biomass"]))
-            & (~generators_df["p_nom_th"].isna())
-        ]
-        generators_df.loc[gens_rename.index, "type"] = "biomass_CHP"
-    gens_rename = generators_df[generators_df["type"].isin(["water"])]
-    generators_df.loc[gens_rename.index, "type"] = "run_of_river"
-    gens_rename = generators_df[generators_df["type"].isin(["conventional"])]
-    generators_df.loc[gens_rename.index, "type"] = "others"
+        # CHP plants are identified by their thermal capacity
+        carriers_chp = generators_df["type"].map(CARRIER_MAPPING["edisgo_chp"])
+        carriers = carriers_chp.where(~generators_df["p_nom_th"].isna()).fillna(
+            carriers
+        )
+    generators_df["type"] = carriers.fillna(generators_df["type"])
 
 
 def map_etrago_heat_bus_to_district_heating_id(specs, scenario, engine):
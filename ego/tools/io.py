@@ -43,6 +43,7 @@ if "READTHEDOCS" not in os.environ:
 
     from ego.tools.economics import etrago_convert_overnight_cost
     from ego.tools.edisgo_integration import EDisGoNetworks
+    from ego.tools.interface import ETraGoMinimalData, get_csv_folder_hash
     from ego.tools.plots import (
         igeoplot,
         plot_edisgo_cluster,
@@ -120,7 +121,9 @@ class eTraGoResults(egoBasic):
     def __init__(self, *args, **kwargs):
         """ """
         super(eTraGoResults, self).__init__(self, *args, **kwargs)
-        self.etrago = None
+        self._etrago = None
+        self._etrago_csv_folder = None
+        self._etrago_minimal_data = None
 
         logger.info("eTraGo section started")
 
@@ -178,17 +181,70 @@ class eTraGoResults(egoBasic):
 
             if self.json_file["eGo"].get("csv_import_eTraGo") is not False:
 
-                logger.info("Import eTraGo network from csv files")
-
-                self.etrago = Etrago(
-                    csv_folder_name=self.json_file["eGo"].get("csv_import_eTraGo")
-                )
+                self._etrago_csv_folder = self.json_file["eGo"].get("csv_import_eTraGo")
+                self._etrago_minimal_data = self._load_etrago_cache()
+                if self._etrago_minimal_data is None:
+                    logger.info("Import eTraGo network from csv files")
+                    self.etrago = Etrago(csv_folder_name=self._etrago_csv_folder)
+                else:
+                    # eTraGo network is imported on first access
+                    logger.info(
+                        "Reduced eTraGo network loaded from cache, import of eTraGo "
+                        "network from csv files is skipped"
+                    )
 
             else:
                 logger.info("Create eTraGo network calcualted by eGo")
 
                 run_etrago(args=self.json_file["eTraGo"], json_path=None)
 
+    def _load_etrago_cache(self):
+        """
+        Loads reduced eTraGo network needed by eDisGo from the cache.
+
+        Returns
+        -------
+        :class:`~.tools.interface.ETraGoMinimalData` or None
+            Reduced eTraGo network in case eDisGo is run with setting
+            **etrago_cache** and the cache is up to date with the csv files of
+            the eTraGo results. Otherwise None.
+
+        """
+        edisgo_args = self.json_file.get("eDisGo", {})
+        if (
+            self.json_file["eGo"].get("eDisGo") is not True
+            or edisgo_args.get("etrago_cache") is None
+        ):
+            return None
+        return ETraGoMinimalData.load(
+            edisgo_args["etrago_cache"],
+            source_hash=get_csv_folder_hash(self._etrago_csv_folder),
+            compact=edisgo_args.get("compact_etrago_data", False),
+        )
+
+    @property
+    def etrago(self):
+        """
+        eTraGo results container.
+
+        In case the import of the eTraGo network from csv files was skipped because
+        the reduced eTraGo network needed by eDisGo was loaded from the cache, the
+        eTraGo network is imported on first access.
+
+        Returns
+        -------
+        :class:`etrago.Etrago` or None
+
+        """
+        if self._etrago is None and self._etrago_csv_folder is not None:
+            logger.info("Import eTraGo network from csv files")
+            self._etrago = Etrago(csv_folder_name=self._etrago_csv_folder)
+        return self._etrago
+
+    @etrago.setter
+    def etrago(self, etrago):
+        self._etrago = etrago
+
 
 class eDisGoResults(eTraGoResults):
     """The ``eDisGoResults`` class create and contains all results
@@ -202,9 +258,13 @@ class eDisGoResults(eTraGoResults):
         if self.json_file["eGo"]["eDisGo"] is True:
             logger.info("Create eDisGo network")
 
+            if self._etrago_minimal_data is not None:
+                etrago_network = self._etrago_minimal_data
+            else:
+                etrago_network = self.etrago.disaggregated_network
             self._edisgo = EDisGoNetworks(
                 json_file=self.json_file,
-                etrago_network=self.etrago.disaggregated_network,
+                etrago_network=etrago_network,
             )
         else:
             self._edisgo = None
@@ -248,10 +308,18 @@ class eGo(eDisGoResults):
         # add total results here
         self._total_investment_costs = None
         self._total_operation_costs = None
-        self._calculate_investment_cost()
         self._storage_costs = None
         self._ehv_grid_costs = None
         self._mv_grid_costs = None
+        if self._etrago_minimal_data is None:
+            self._calculate_investment_cost()
+        else:
+            # the eTraGo investment costs require the eTraGo network, wherefore
+            # they are calculated on first access instead of importing it here
+            logger.info(
+                "Total investment costs are calculated on first access, as eTraGo "
+                "network was not imported"
+            )
 
     def _calculate_investment_cost(self, storage_mv_integration=True):
         """Get total investment costs of all voltage level for storages
@@ -447,12 +515,17 @@ class eGo(eDisGoResults):
         """
         Contains all investment informations about eGo
 
+        In case the reduced eTraGo network needed by eDisGo was loaded from the
+        cache, the costs are calculated on first access, which imports the eTraGo
+        network from the csv files.
+
         Returns
         -------
         :pandas:`pandas.DataFrame<dataframe>`
 
         """
-
+        if self._total_investment_costs is None:
+            self._calculate_investment_cost()
         return self._total_investment_costs
 
     @property
@@ -478,7 +551,7 @@ class eGo(eDisGoResults):
             display = True
 
         return plot_grid_storage_investment(
-            self._total_investment_costs, filename=filename, display=display, **kwargs
+            self.total_investment_costs, filename=filename, display=display, **kwargs
         )
 
     def plot_power_price(self, filename=None, display=False):
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# Copyright 2016-2018 Europa-Universität Flensburg,
+# Flensburg University of Applied Sciences,
+# Centre for Sustainable Energy Systems
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation; either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# File description
+"""
+This file is part of the eGo toolbox.
+It contains tools to profile the stages of the eDisGo calculation of MV grids,
+e.g. tasks, imports and saving of results, and to aggregate the profiles of all
+MV grids to a report for capacity planning.
+
+The profile of a stage comprises its wall time, its CPU time, the peak resident
+set size (RSS) of the process during the stage and the bytes written. CPU time
+comprises the time of the thread running the stage and of child processes that
+terminated during the stage, e.g. the julia process of the optimisation. Bytes
+written are the bytes passed to write calls by the thread running the stage. Peak
+RSS is measured for the whole process, wherefore stages running at the same time
+in different threads share their peak. Peak RSS, bytes written and per stage
+resets of the peak RSS are only available on Linux. On platforms without the
+:mod:`resource` module, e.g. Windows, peak RSS is not available and CPU time is
+the CPU time of the whole process.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+__copyright__ = (
+    "Flensburg University of Applied Sciences, "
+    "Europa-Universität Flensburg, "
+    "Centre for Sustainable Energy Systems"
+)
+__license__ = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__author__ = "wolf_bunke, maltesc, mltja"
+
+logger = logging.getLogger(__name__)
+
+# name of file the profiles of an MV grid are saved to in its results directory
+PROFILE_FILE_NAME = "profile.jsonl"
+
+# stages currently profiled in this process, which need to be informed about the
+# peak RSS before it is reset by a new stage
+_active_stages = []
+_lock = threading.Lock()
+
+
+def _read_proc_value(path, key):
+    """
+    Returns integer value of key in file of the proc filesystem or None.
+
+    """
+    try:
+        with open(path) as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name == key:
+                    return int(value.split()[0])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _peak_rss():
+    """
+    Returns peak RSS of the process in bytes since the last reset or None.
+
+    """
+    peak_rss = _read_proc_value("/proc/self/status", "VmHWM")
+    if peak_rss is None:
+        if resource is None:
+            return None
+        # peak since start of process, in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return peak_rss * 1024
+
+
+def _reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _bytes_written():
+    return _read_proc_value("/proc/thread-self/io", "wchar")
+
+
+def _cpu_time():
+    if resource is None:
+        return time.process_time()
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.thread_time() + children.ru_utime + children.ru_stime
+
+
+@contextmanager
+def profile_stage(path, stage):
+    """
+    Profiles a stage and appends its profile to a profile file.
+
+    Every profile is appended as a single line in JSON lines format, with the
+    name of the stage, its 'start_time', 'wall_time' and 'cpu_time' in seconds,
+    'peak_rss' and 'bytes_written' in bytes and whether it finished with
+    'success'. Stages can be nested.
+
+    Parameters
+    ----------
+    path : str
+        Path to profile file.
+    stage : str
+        Name of stage.
+
+    """
+    record = {
+        "stage": stage,
+        "start_time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+        "peak_rss": 0,
+    }
+    with _lock:
+        # the peak RSS of stages that are already running is kept before it is
+        # reset for the new stage
+        peak_rss = _peak_rss()
+        if peak_rss is not None:
+            for active_record in _active_stages:
+                active_record["peak_rss"] = max(active_record["peak_rss"], peak_rss)
+        _reset_peak_rss()
+        _active_stages.append(record)
+    t_start = time.monotonic()
+    cpu_start = _cpu_time()
+    bytes_start = _bytes_written()
+    success = False
+    try:
+        yield
+        success = True
+    finally:
+        bytes_end = _bytes_written()
+        record["wall_time"] = time.monotonic() - t_start
+        record["cpu_time"] = _cpu_time() - cpu_start
+        with _lock:
+            peak_rss = _peak_rss()
+            record["peak_rss"] = (
+                None if peak_rss is None else max(record["peak_rss"], peak_rss)
+            )
+            _active_stages.remove(record)
+        record["bytes_written"] = (
+            None if bytes_start is None else bytes_end - bytes_start
+        )
+        record["success"] = success
+        line = (json.dumps(record) + "\n").encode()
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            logger.warning(f"Profile of stage {stage} could not be saved to {path}.")
+
+
+def read_profiles(results_dir, mv_grid_ids):
+    """
+    Reads profiles of all stages of the given MV grids.
+
+    Parameters
+    ----------
+    results_dir : str
+        eDisGo results directory containing a directory per MV grid.
+    mv_grid_ids : list(int)
+        MV grid IDs.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<DataFrame>`
+        Profiles with columns 'mv_grid_id', 'stage', 'start_time', 'wall_time',
+        'cpu_time', 'peak_rss', 'bytes_written' and 'success'.
+
+    """
+    columns = [
+        "stage",
+        "start_time",
+        "wall_time",
+        "cpu_time",
+        "peak_rss",
+        "bytes_written",
+        "success",
+    ]
+    profiles = []
+    for mv_grid_id in mv_grid_ids:
+        path = os.path.join(results_dir, str(mv_grid_id), PROFILE_FILE_NAME)
+        if not os.path.isfile(path):
+            continue
+        with open(path) as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        df = pd.DataFrame.from_records(records, columns=columns)
+        df.insert(0, "mv_grid_id", mv_grid_id)
+        profiles.append(df)
+    if not profiles:
+        return pd.DataFrame(columns=["mv_grid_id"] + columns)
+    return pd.concat(profiles, ignore_index=True)
+
+
+def write_profile_report(results_dir, mv_grid_ids):
+    """
+    Writes profiles of all stages of the given MV grids to a run-level report.
+
+    The profiles of all stages are written to ``profile.csv`` and their
+    aggregation per stage to ``profile_summary.csv`` in the results directory.
+
+    Parameters
+    ----------
+    results_dir : str
+        eDisGo results directory containing a directory per MV grid.
+    mv_grid_ids : list(int)
+        MV grid IDs.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<DataFrame>`
+        Aggregated profiles with stage as index. Columns contain the number of
+        profiled stages, their total, mean and maximum wall time, total and
+        mean CPU time, mean and maximum peak RSS and total and mean bytes
+        written.
+
+    """
+    profiles = read_profiles(results_dir, mv_grid_ids)
+    profiles.to_csv(os.path.join(results_dir, "profile.csv"), index=False)
+    for column in ["wall_time", "cpu_time", "peak_rss", "bytes_written"]:
+        profiles[column] = profiles[column].astype(float)
+    summary = profiles.groupby("stage").agg(
+        count=("mv_grid_id", "size"),
+        wall_time_sum=("wall_time", "sum"),
+        wall_time_mean=("wall_time", "mean"),
+        wall_time_max=("wall_time", "max"),
+        cpu_time_sum=("cpu_time", "sum"),
+        cpu_time_mean=("cpu_time", "mean"),
+        peak_rss_mean=("peak_rss", "mean"),
+        peak_rss_max=("peak_rss", "max"),
+        bytes_written_sum=("bytes_written", "sum"),
+        bytes_written_mean=("bytes_written", "mean"),
+    )
+    summary.to_csv(os.path.join(results_dir, "profile_summary.csv"))
+    logger.info(
+        "Profiles of {} stages of {} MV grids saved to {}.".format(
+            len(profiles), profiles["mv_grid_id"].nunique(), results_dir
+        )
+    )
+    return summary
@@ -0,0 +1,226 @@
+"""
+Benchmarks of the interface between eTraGo and eDisGo on a scaled eTraGo network
+and of the eDisGo integration on synthetic data of the same number of snapshots.
+
+Run the benchmarks with ``pytest tests/benchmarks --runbenchmark``. The scale of
+the network is set with ``--benchmark-buses`` and ``--benchmark-snapshots``, which
+default to the scale of the committed baselines, 100 buses and 8760 snapshots.
+Baselines per scale are stored in ``baselines.json`` with
+``--update-benchmark-baselines`` and benchmarks exceeding their baseline by more
+than ``--benchmark-tolerance`` fail. The run time of a benchmark is the fastest
+of ``--benchmark-repeats`` calls.
+"""
+
+import gc
+import json
+import logging
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pypsa import Network as PyPSANetwork
+
+logger = logging.getLogger(__name__)
+
+BASELINES_PATH = os.path.join(
+    os.path.realpath(os.path.dirname(__file__)), "baselines.json"
+)
+# minimum total run time in seconds of the timed calls of a benchmark
+MIN_MEASURE_TIME = 2.0
+
+
+def scale_etrago_test_network(n_buses, n_snapshots, seed=42):
+    """
+    Scales eTraGo test network to the given number of HV buses and snapshots.
+
+    The components connected to HV bus 0 of the test network, including the
+    district heating and rural heat buses, stores and links, are copied once per HV
+    bus. Time series are drawn randomly.
+
+    Parameters
+    ----------
+    n_buses : int
+        Number of HV buses of the scaled network.
+    n_snapshots : int
+        Number of hourly snapshots of the scaled network.
+    seed : int
+        Seed of the random time series. Default: 42.
+
+    Returns
+    -------
+    :pypsa:`pypsa.Network<network>`
+
+    """
+    rng = np.random.default_rng(seed)
+    test_network = PyPSANetwork(pytest.etrago_test_network_1_path)
+    # buses not belonging to the tile around HV bus 0 are dropped
+    tile_buses = test_network.buses.index[test_network.buses.carrier != "junk"]
+    offset = max(int(_) for _ in tile_buses) + 1
+
+    def rename_bus(bus, tile):
+        return str(int(bus) + tile * offset)
+
+    def scale_components(df, bus_columns):
+        df = df[df[bus_columns].isin(tile_buses).all(axis="columns")]
+        tiles = []
+        for tile in range(n_buses):
+            df_tile = df.rename(index=lambda x: f"{x} {tile}")
+            for column in bus_columns:
+                df_tile[column] = df_tile[column].map(lambda x: rename_bus(x, tile))
+            tiles.append(df_tile)
+        return pd.concat(tiles)
+
+    network = PyPSANetwork()
+    network.set_snapshots(
+        pd.date_range("2011-01-01", periods=n_snapshots, freq="H", name="snapshot")
+    )
+    buses = test_network.buses.loc[tile_buses]
+    network.import_components_from_dataframe(
+        pd.concat(
+            [
+                buses.rename(index=lambda x: rename_bus(x, tile))
+                for tile in range(n_buses)
+            ]
+        ),
+        "Bus",
+    )
+    components = {
+        "Generator": ["bus"],
+        "Link": ["bus0", "bus1"],
+        "Store": ["bus"],
+        "StorageUnit": ["bus"],
+    }
+    for component, bus_columns in components.items():
+        list_name = network.components[component]["list_name"]
+        df = scale_components(getattr(test_network, list_name), bus_columns)
+        network.import_components_from_dataframe(df, component)
+        for attribute, timeseries in getattr(test_network, list_name + "_t").items():
+            if timeseries.empty:
+                continue
+            network.import_series_from_dataframe(
+                pd.DataFrame(
+                    rng.uniform(0.0, 1.0, (n_snapshots, len(df))),
+                    index=network.snapshots,
+                    columns=df.index,
+                ),
+                component,
+                attribute,
+            )
+    return network
+
+
+@pytest.fixture(scope="session")
+def benchmark_scale(request):
+    return {
+        "n_buses": request.config.getoption("--benchmark-buses"),
+        "n_snapshots": request.config.getoption("--benchmark-snapshots"),
+    }
+
+
+@pytest.fixture(scope="session")
+def scaled_etrago_network(benchmark_scale):
+    t_start = time.perf_counter()
+    network = scale_etrago_test_network(**benchmark_scale)
+    logger.info(
+        f"Scaled eTraGo test network to {len(network.buses)} buses, "
+        f"{len(network.generators)} generators, {len(network.links)} links and "
+        f"{len(network.snapshots)} snapshots in "
+        f"{time.perf_counter() - t_start:.1f} s."
+    )
+    return network
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines(request, benchmark_scale):
+    """
+    Baselines of all benchmarks at the current scale.
+
+    In case option ``--update-benchmark-baselines`` is given, the results of the
+    benchmarks of this session are written to the baselines file afterwards.
+
+    """
+    scale = "{n_buses}_buses_{n_snapshots}_snapshots".format(**benchmark_scale)
+    if os.path.isfile(BASELINES_PATH):
+        with open(BASELINES_PATH) as f:
+            all_baselines = json.load(f)
+    else:
+        all_baselines = {}
+    baselines = dict(all_baselines.get(scale, {}))
+    results = {}
+    yield baselines, results
+
+    if request.config.getoption("--update-benchmark-baselines") and results:
+        all_baselines.setdefault(scale, {}).update(results)
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(all_baselines, f, indent=2, sort_keys=True)
+        logger.info(f"Updated benchmark baselines in {BASELINES_PATH}.")
+
+
+@pytest.fixture
+def measure(request, benchmark_baselines):
+    """
+    Measures run time and peak memory of a function call.
+
+    The run time is the minimum of the number of calls given by option
+    ``--benchmark-repeats``, so that a single slow call, e.g. the first one with
+    cold caches, does not count as regression. Short calls are repeated further
+    until they took ``MIN_MEASURE_TIME`` in total. As in :mod:`timeit`, garbage
+    collection is disabled during the timed calls, as its duration depends on all
+    objects alive in the session, e.g. the scaled network of other benchmarks.
+    The measurement is compared to the stored baseline of the benchmark, and the
+    benchmark fails in case run time or peak memory exceed the baseline by more
+    than the factor given by option ``--benchmark-tolerance``. As tracing memory
+    allocations slows down the function considerably, peak memory is measured in
+    a separate call.
+
+    """
+    baselines, results = benchmark_baselines
+    tolerance = request.config.getoption("--benchmark-tolerance")
+    repeats = request.config.getoption("--benchmark-repeats")
+
+    def _measure(func, *args, **kwargs):
+        name = request.node.name
+        elapsed_times = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            while len(elapsed_times) < repeats or sum(elapsed_times) < MIN_MEASURE_TIME:
+                t_start = time.perf_counter()
+                result = func(*args, **kwargs)
+                elapsed_times.append(time.perf_counter() - t_start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        elapsed_time = min(elapsed_times)
+        tracemalloc.start()
+        func(*args, **kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        logger.info(
+            f"{name}: run time {elapsed_time:.3f} s, "
+            f"peak memory {peak_memory / 1e6:.1f} MB"
+        )
+        results[name] = {"time": elapsed_time, "peak_memory": peak_memory}
+
+        baseline = baselines.get(name)
+        if baseline is None:
+            logger.warning(f"No baseline for {name}.")
+        else:
+            regressions = [
+                f"{metric} {results[name][metric]:.4g} exceeds baseline "
+                f"{baseline[metric]:.4g}"
+                for metric in ["time", "peak_memory"]
+                if results[name][metric] > tolerance * baseline[metric]
+            ]
+            if regressions:
+                pytest.fail(
+                    f"Performance regression in {name} by more than factor "
+                    f"{tolerance}: " + ", ".join(regressions)
+                )
+        return result
+
+    return _measure
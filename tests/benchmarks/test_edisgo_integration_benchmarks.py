@@ -0,0 +1,60 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("edisgo")
+
+from ego.tools.edisgo_integration import _write_back_time_series  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# number of loads of an MV grid including its LV grids
+N_LOADS = 4000
+# number of time intervals optimised and their number of time steps
+N_INTERVALS = 2
+N_INTERVAL_STEPS = 168
+
+
+@pytest.fixture(scope="module")
+def loads_time_series(benchmark_scale):
+    rng = np.random.default_rng(42)
+    timeindex = pd.date_range(
+        "2011-01-01", periods=benchmark_scale["n_snapshots"], freq="H"
+    )
+    columns = [f"Load_{i}" for i in range(N_LOADS)]
+    df = pd.DataFrame(
+        rng.random((len(timeindex), N_LOADS)), index=timeindex, columns=columns
+    )
+    steps = min(N_INTERVAL_STEPS, len(timeindex) // N_INTERVALS)
+    interval_dfs = [
+        pd.DataFrame(
+            rng.random((steps, N_LOADS)),
+            index=timeindex[start : start + steps],
+            columns=columns,
+        )
+        for start in range(0, N_INTERVALS * steps, steps)
+    ]
+    return df, interval_dfs
+
+
+def write_back_time_series_loc(df, interval_dfs):
+    # previous write back of every time interval with .loc as reference
+    df = df.copy()
+    for interval_df in interval_dfs:
+        df.loc[interval_df.index, :] = interval_df
+    return df
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("bulk", [False, True])
+def test_benchmark_write_back_time_series(loads_time_series, measure, bulk):
+    df, interval_dfs = loads_time_series
+    if bulk:
+        result = measure(_write_back_time_series, df, interval_dfs)
+        pd.testing.assert_frame_equal(
+            result, write_back_time_series_loc(df, interval_dfs)
+        )
+    else:
+        measure(write_back_time_series_loc, df, interval_dfs)
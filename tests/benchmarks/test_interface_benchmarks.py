@@ -0,0 +1,168 @@
+import logging
+import pickle
+import time
+
+import pandas as pd
+import pytest
+
+from pypsa import Network as PyPSANetwork
+
+from ego.tools.interface import (
+    CARRIER_MAPPING,
+    ETraGoMinimalData,
+    get_etrago_results_per_bus,
+    map_etrago_heat_bus_to_district_heating_id,
+)
+
+logger = logging.getLogger(__name__)
+
+# number of HV buses the per-bus benchmarks are run for
+N_SAMPLE_BUSES = 20
+
+
+@pytest.fixture(scope="module")
+def sample_bus_ids(scaled_etrago_network):
+    hv_buses = scaled_etrago_network.buses.index[
+        scaled_etrago_network.buses.carrier == "AC"
+    ]
+    step = max(len(hv_buses) // N_SAMPLE_BUSES, 1)
+    return [int(_) for _ in hv_buses[::step]]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("compact", [False, True])
+def test_benchmark_etrago_minimal_data(scaled_etrago_network, measure, compact):
+    etrago_obj = measure(ETraGoMinimalData, scaled_etrago_network, compact=compact)
+    assert len(etrago_obj.generators) > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("compact", [False, True])
+def test_benchmark_get_etrago_results_per_bus(
+    scaled_etrago_network, sample_bus_ids, measure, compact
+):
+    etrago_obj = ETraGoMinimalData(scaled_etrago_network, compact=compact)
+
+    def get_specs():
+        return [
+            dict(get_etrago_results_per_bus(bus_id, etrago_obj, True, 0.9))
+            for bus_id in sample_bus_ids
+        ]
+
+    specs = measure(get_specs)
+    assert not specs[0]["feedin_district_heating"].empty
+
+
+@pytest.mark.benchmark
+def test_benchmark_map_etrago_heat_bus_to_district_heating_id(
+    request, scaled_etrago_network, sample_bus_ids, measure
+):
+    # the heat bus IDs of the scaled network are not in the database, wherefore
+    # only the database query and renaming is benchmarked
+    jsonpath = request.config.getoption("--benchmark-scenario-setting")
+    if jsonpath is None:
+        pytest.skip("need --benchmark-scenario-setting option to run")
+    from ego.mv_clustering import database
+    from ego.tools.utilities import get_scenario_setting
+
+    config = get_scenario_setting(jsonpath=jsonpath)
+    etrago_obj = ETraGoMinimalData(scaled_etrago_network)
+    specs = [
+        dict(get_etrago_results_per_bus(bus_id, etrago_obj, True, 0.9))
+        for bus_id in sample_bus_ids
+    ]
+
+    with database.sshtunnel(config=config):
+        engine = database.get_engine(config=config)
+
+        def map_heat_buses():
+            for specs_per_bus in specs:
+                map_etrago_heat_bus_to_district_heating_id(
+                    specs_per_bus, config["eTraGo"]["scn_name"], engine
+                )
+
+        measure(map_heat_buses)
+
+
+@pytest.mark.benchmark
+def test_benchmark_etrago_minimal_data_compact(
+    request, scaled_etrago_network, sample_bus_ids
+):
+
+    repeats = request.config.getoption("--benchmark-repeats")
+    memory = {}
+    extraction_time = {}
+    for compact in [False, True]:
+        etrago_obj = ETraGoMinimalData(scaled_etrago_network, compact=compact)
+        # the pickled object is what is copied to every worker process
+        memory[compact] = len(
+            pickle.dumps(etrago_obj, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        elapsed_times = []
+        for _ in range(repeats):
+            t_start = time.perf_counter()
+            for bus_id in sample_bus_ids:
+                dict(get_etrago_results_per_bus(bus_id, etrago_obj, True, 0.9))
+            elapsed_times.append(time.perf_counter() - t_start)
+        extraction_time[compact] = min(elapsed_times) / len(sample_bus_ids)
+        logger.info(
+            f"Compact: {compact}, memory: {memory[compact] / 1e6:.1f} MB, "
+            f"per-bus extraction time: {extraction_time[compact]:.3f} s"
+        )
+
+    assert memory[True] < 0.55 * memory[False]
+    # compact time series do not slow down the extraction of the specifications
+    tolerance = request.config.getoption("--benchmark-tolerance")
+    assert extraction_time[True] < tolerance * extraction_time[False]
+
+
+@pytest.mark.benchmark
+def test_benchmark_carrier_aggregation(measure):
+
+    # scale up test network by copying the generators at bus 0
+    etrago_network = PyPSANetwork(pytest.etrago_test_network_1_path)
+    generators = etrago_network.generators[etrago_network.generators.bus == "0"]
+    n_copies = 500
+    etrago_network.import_components_from_dataframe(
+        pd.concat(
+            [generators.rename(index=lambda x: f"{x} {i}") for i in range(n_copies)]
+        ),
+        "Generator",
+    )
+    for attribute in ["p", "p_max_pu", "q"]:
+        timeseries = etrago_network.generators_t[attribute][generators.index]
+        etrago_network.import_series_from_dataframe(
+            pd.concat(
+                [
+                    timeseries.rename(columns=lambda x: f"{x} {i}")
+                    for i in range(n_copies)
+                ],
+                axis=1,
+            ),
+            "Generator",
+            attribute,
+        )
+    etrago_obj = ETraGoMinimalData(etrago_network)
+    logger.info(f"Number of generators: {len(etrago_obj.generators)}")
+
+    etrago_results_per_bus = measure(
+        lambda: dict(get_etrago_results_per_bus(0, etrago_obj, True, 0.9))
+    )
+
+    # aggregation with one mask per carrier as reference
+    generators_df = etrago_obj.generators[etrago_obj.generators.bus == "0"]
+    generators_df = generators_df[
+        ~generators_df["carrier"].str.contains("solar|wind")
+    ].replace({"carrier": CARRIER_MAPPING["etrago"]})
+    dispatchable_gens_df_p = pd.DataFrame(index=etrago_obj.snapshots)
+    for carrier in generators_df.carrier.unique():
+        columns_to_aggregate = generators_df[generators_df["carrier"] == carrier].index
+        dispatchable_gens_df_p[carrier] = (
+            etrago_obj.generators_t["p"][columns_to_aggregate].sum(axis="columns")
+            / generators_df.loc[columns_to_aggregate, "p_nom"].sum()
+        )
+
+    pd.testing.assert_frame_equal(
+        etrago_results_per_bus["dispatchable_generators_active_power"],
+        dispatchable_gens_df_p,
+    )
@@ -13,19 +13,58 @@ def pytest_configure(config):
     )
 
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    config.addinivalue_line("markers", "benchmark: mark test as benchmark")
 
 
 def pytest_addoption(parser):
     parser.addoption(
         "--runslow", action="store_true", default=False, help="run slow tests"
     )
+    parser.addoption(
+        "--runbenchmark", action="store_true", default=False, help="run benchmarks"
+    )
+    parser.addoption(
+        "--benchmark-buses",
+        type=int,
+        default=100,
+        help="number of HV buses of the scaled eTraGo network in benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-snapshots",
+        type=int,
+        default=8760,
+        help="number of snapshots of the scaled eTraGo network in benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-repeats",
+        type=int,
+        default=5,
+        help="number of timed calls per benchmark, of which the fastest is used",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=1.5,
+        help="factor by which a benchmark may exceed its baseline",
+    )
+    parser.addoption(
+        "--update-benchmark-baselines",
+        action="store_true",
+        default=False,
+        help="store benchmark results as new baselines",
+    )
+    parser.addoption(
+        "--benchmark-scenario-setting",
+        default=None,
+        help="scenario settings with database access for database benchmarks",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
-    if config.getoption("--runslow"):
-        # --runslow given in cli: do not skip slow tests
-        return
     skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    skip_benchmark = pytest.mark.skip(reason="need --runbenchmark option to run")
     for item in items:
-        if "slow" in item.keywords:
+        if "slow" in item.keywords and not config.getoption("--runslow"):
             item.add_marker(skip_slow)
+        if "benchmark" in item.keywords and not config.getoption("--runbenchmark"):
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,101 @@
+import time
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("etrago")
+
+from ego.tools.economics import edisgo_grid_investment  # noqa: E402
+
+JSON_FILE = {"eTraGo": {"start_snapshot": 1, "end_snapshot": 8760}}
+
+
+def edisgo_networks_mock(no_grids):
+    """
+    EDisGoNetworks with synthetic grids, of which every tenth grid failed and
+    every fifth grid was not reinforced.
+
+    """
+    network = {}
+    for mv_grid_id in range(no_grids):
+        if mv_grid_id % 10 == 0:
+            network[mv_grid_id] = "This grid failed to reimport"
+            continue
+        costs = 0.0 if mv_grid_id % 5 == 0 else float(mv_grid_id)
+        network[mv_grid_id] = SimpleNamespace(
+            results=SimpleNamespace(
+                grid_expansion_costs=pd.DataFrame(
+                    {
+                        "voltage_level": ["mv", "mv/lv", "lv"],
+                        "total_costs": [costs, 2 * costs, 3 * costs],
+                    }
+                )
+            )
+        )
+    grid_choice = pd.DataFrame(
+        {
+            "the_selected_network_id": list(range(no_grids)),
+            "no_of_points_per_cluster": [1 + i % 3 for i in range(no_grids)],
+        }
+    )
+    return SimpleNamespace(
+        network=network, grid_choice=grid_choice, successful_grids=0.9, summary=None
+    )
+
+
+def test_edisgo_grid_investment():
+    costs = edisgo_grid_investment(edisgo_networks_mock(20), JSON_FILE)
+    costs = costs.set_index("voltage_level")
+    # weighted costs of reinforced grids in EUR, extrapolated to all grids
+    weighted_costs = sum(
+        i * (1 + i % 3) for i in range(20) if i % 10 != 0 and i % 5 != 0
+    )
+    assert costs.at["mv", "overnight_costs"] == pytest.approx(
+        weighted_costs * 1000 / 0.9
+    )
+    assert costs.at["lv", "overnight_costs"] == pytest.approx(
+        3 * weighted_costs * 1000 / 0.9
+    )
+    assert (costs.capital_cost < costs.overnight_costs).all()
+
+    assert edisgo_grid_investment(edisgo_networks_mock(1), JSON_FILE) is None
+
+
+def test_edisgo_grid_investment_summary():
+    edisgo = edisgo_networks_mock(20)
+    costs = edisgo_grid_investment(edisgo, JSON_FILE)
+
+    # costs are taken from the summary of the eDisGo runs, in case it exists
+    summary = pd.DataFrame(
+        {
+            "status": "success",
+            "grid_expansion_costs_mv": [
+                float(i) if i % 5 != 0 else 0.0 for i in range(20)
+            ],
+        },
+        index=pd.Index(range(20), name="mv_grid_id"),
+    )
+    summary["grid_expansion_costs_mvlv"] = 2 * summary.grid_expansion_costs_mv
+    summary["grid_expansion_costs_lv"] = 3 * summary.grid_expansion_costs_mv
+    summary.loc[summary.index % 10 == 0, "status"] = "failed"
+    summary.loc[summary.index % 10 == 0, "grid_expansion_costs_mv":] = None
+    edisgo.summary = summary
+    edisgo.network = {}
+    pd.testing.assert_frame_equal(edisgo_grid_investment(edisgo, JSON_FILE), costs)
+
+
+def test_edisgo_grid_investment_scaling():
+    def runtime(no_grids):
+        edisgo = edisgo_networks_mock(no_grids)
+        runtimes = []
+        for _ in range(3):
+            t_start = time.perf_counter()
+            edisgo_grid_investment(edisgo, JSON_FILE)
+            runtimes.append(time.perf_counter() - t_start)
+        return min(runtimes)
+
+    # runtime grows linearly with the number of grids, it would grow 16-fold in
+    # case every grid was looked up and appended separately
+    assert runtime(4000) < 8 * runtime(1000)
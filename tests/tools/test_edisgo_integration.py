@@ -0,0 +1,960 @@
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from types import SimpleNamespace
+from zipfile import ZipFile
+
+import multiprocess as mp2
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("edisgo")
+
+from ego.tools import edisgo_integration  # noqa: E402
+from ego.tools.edisgo_integration import (  # noqa: E402
+    EDisGoNetworks,
+    _reduced_deepcopy,
+    _write_back_time_series,
+)
+from ego.tools.executors import (  # noqa: E402
+    DistributedExecutor,
+    LocalProcessExecutor,
+    LocalThreadExecutor,
+)
+from ego.tools.profiling import read_profiles  # noqa: E402
+
+
+class EDisGoMock:
+    def __init__(self):
+        self.no_tasks = 0
+        self.results = SimpleNamespace(
+            grid_expansion_costs=pd.DataFrame(
+                {"voltage_level": ["mv", "lv", "lv"], "total_costs": [1.0, 2.0, 3.0]}
+            )
+        )
+        self.topology = SimpleNamespace(
+            buses_df=pd.DataFrame(index=range(3)), lines_df=pd.DataFrame(index=range(2))
+        )
+        self.overlying_grid = SimpleNamespace(
+            renewables_curtailment=pd.Series([1.0, 2.0])
+        )
+        self.opf_results = SimpleNamespace(
+            grid_slacks_t=SimpleNamespace(
+                gen_d_crt=pd.DataFrame([[0.5]]), gen_nd_crt=pd.DataFrame()
+            )
+        )
+
+    def save(self, directory, **kwargs):
+        # saving takes longer than the tasks
+        time.sleep(0.2)
+        with open(f"{directory}.zip", "w") as f:
+            f.write(str(self.no_tasks))
+
+
+class TimeSeriesMock:
+    attributes = [
+        "loads_active_power",
+        "loads_reactive_power",
+        "generators_active_power",
+        "generators_reactive_power",
+        "storage_units_active_power",
+        "storage_units_reactive_power",
+    ]
+
+    def __init__(self, timeindex, value=0.0):
+        self.timeindex = timeindex
+        for attr in self.attributes[:4]:
+            setattr(self, attr, pd.DataFrame(value, index=timeindex, columns=["a"]))
+
+    def __setattr__(self, name, value):
+        if name in self.attributes:
+            name = "_" + name
+        super().__setattr__(name, value)
+
+    def __getattr__(self, name):
+        if name in self.attributes:
+            return getattr(self, "_" + name)
+        raise AttributeError(name)
+
+
+class GridSlacksMock(SimpleNamespace):
+    def _attributes(self):
+        return ["gen_d_crt", "gen_nd_crt"]
+
+
+def opf_results_mock(index=None, value=0.0):
+    def df(column="a"):
+        return pd.DataFrame(value, index=pd.Index(index or []), columns=[column])
+
+    return SimpleNamespace(
+        overlying_grid=df(),
+        battery_storage_t=SimpleNamespace(p=df(), e=df()),
+        grid_slacks_t=GridSlacksMock(
+            gen_d_crt=df(f"gen_{value}"), gen_nd_crt=df(f"gen_{value}")
+        ),
+    )
+
+
+class TestEDisGoNetworks:
+    def test_estimate_mv_grid_costs(self, tmpdir):
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._grid_path = os.path.join(tmpdir, "grids")
+        edisgo_networks._results = os.path.join(tmpdir, "results")
+        for mv_grid_id, n_buses in [(1, 10), (2, 30), (3, 20)]:
+            os.makedirs(os.path.join(edisgo_networks._grid_path, str(mv_grid_id)))
+            pd.DataFrame(index=range(n_buses)).to_csv(
+                os.path.join(edisgo_networks._grid_path, str(mv_grid_id), "buses.csv")
+            )
+
+        costs = edisgo_networks._estimate_mv_grid_costs([1, 2, 3, 4])
+        assert costs[2] > costs[3] > costs[1]
+        # grid without topology files is assumed to be of median costs
+        assert costs[4] == costs[3]
+
+        # recorded runtimes are used instead of estimates
+        os.makedirs(os.path.join(edisgo_networks._results, "status"))
+        pd.DataFrame(
+            {
+                "start_time": ["2023-01-01_10:00", "2023-01-01_10:00"],
+                "end_time": ["2023-01-01_10:10", "Not finished yet"],
+            },
+            index=pd.Index([1, 2], name="MV grid id"),
+        ).to_csv(os.path.join(edisgo_networks._results, "status", "eGo_1.csv"))
+        costs = edisgo_networks._estimate_mv_grid_costs([1, 2, 3])
+        assert costs[1] == 600
+        # 60 seconds per component
+        assert costs[2] == 30 * 60
+        assert costs[3] == 20 * 60
+
+        # runtimes of later runs are read from their status event log
+        with open(
+            os.path.join(edisgo_networks._results, "status", "eGo_2.jsonl"), "w"
+        ) as f:
+            for mv_grid_id, event, time_stamp, outcome in [
+                (2, "start", "2023-01-02 10:00:00", None),
+                (3, "start", "2023-01-02 10:00:00", None),
+                (2, "end", "2023-01-02 10:20:00", "success"),
+                (3, "end", "2023-01-02 10:01:00", "timeout"),
+            ]:
+                f.write(
+                    json.dumps(
+                        {
+                            "mv_grid_id": mv_grid_id,
+                            "stage": "run",
+                            "event": event,
+                            "time": time_stamp,
+                            "outcome": outcome,
+                        }
+                    )
+                    + "\n"
+                )
+        costs = edisgo_networks._estimate_mv_grid_costs([1, 2, 3])
+        assert costs[1] == 600
+        assert costs[2] == 1200
+        # runtime of grid that timed out is not known, median of 60 and 40 seconds
+        # per component
+        assert costs[3] == 20 * 50
+
+    def test_status(self, tmpdir):
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {"eDisGo": {"results": str(tmpdir)}}
+        edisgo_networks._grid_choice = pd.DataFrame(
+            {
+                "no_of_points_per_cluster": [1, 2, 1, 4],
+                "the_selected_network_id": [1, 2, 3, 4],
+                "represented_grids": [[1], [2], [3], [4]],
+            }
+        )
+        edisgo_networks._init_status()
+
+        # events of workers writing at the same time are not lost
+        def write_events(mv_grid_id):
+            edisgo_networks._status_update(mv_grid_id, "start")
+            for i in range(200):
+                edisgo_networks._status_update(mv_grid_id, "start", stage=f"task_{i}")
+            if mv_grid_id == 1:
+                edisgo_networks._status_update(
+                    mv_grid_id, "end", duration=60.0, outcome="success"
+                )
+            elif mv_grid_id == 2:
+                edisgo_networks._status_update(
+                    mv_grid_id, "end", outcome="failed", message="ValueError()"
+                )
+
+        processes = [
+            mp2.Process(target=write_events, args=(mv_grid_id,))
+            for mv_grid_id in [1, 2, 3]
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        edisgo_networks._status_timeout(3)
+
+        events = edisgo_networks._read_status_events(edisgo_networks._status_file_path)
+        assert len(events) == 3 * 201 + 3
+        assert events.groupby("mv_grid_id").size().to_dict() == {1: 202, 2: 202, 3: 202}
+
+        status = edisgo_networks.status
+        assert status.index.tolist() == [1, 2, 3, 4]
+        assert status.at[2, "cluster_perc"] == 0.25
+        assert status.at[1, "outcome"] == "success"
+        assert status.at[1, "runtime"] >= 0
+        assert status.at[2, "end_time"] == "Failed in task task_199"
+        assert status.at[3, "end_time"] == "Timeout in task task_199"
+        assert status.at[4, "start_time"] == "Not started yet"
+        assert status.at[4, "task"] == "Not started yet"
+        assert status.at[1, "start_time"] != "Not started yet"
+
+    def test_run_edisgo_pool_profiling(self, tmpdir):
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eDisGo": {"tasks": ["1_setup_grid"], "results": str(tmpdir)}
+        }
+        edisgo_networks._results = str(tmpdir)
+        edisgo_networks._parallelization = False
+        edisgo_networks._profiling = True
+        edisgo_networks._edisgo_grids = {}
+        edisgo_networks._grid_choice = pd.DataFrame(
+            {"the_selected_network_id": [1, 2], "no_of_points_per_cluster": [1, 1]}
+        )
+
+        def run_edisgo(mv_grid_id):
+            results_dir = os.path.join(tmpdir, str(mv_grid_id))
+            os.makedirs(results_dir, exist_ok=True)
+            with edisgo_networks._profile(results_dir, "1_setup_grid"):
+                pass
+            return {mv_grid_id: results_dir}
+
+        edisgo_networks.run_edisgo = run_edisgo
+        edisgo_networks._save_edisgo_results = lambda: None
+        edisgo_networks._load_edisgo_results = lambda: None
+        edisgo_networks._run_edisgo_pool()
+        # profiles of sequential run are gathered in report
+        profiles = pd.read_csv(os.path.join(tmpdir, "profile.csv"))
+        assert profiles.mv_grid_id.tolist() == [1, 2]
+
+    def test_run_edisgo_tasks_parallel(self):
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eDisGo": {"tasks": ["1_setup_grid", "2_specs_overlying_grid"]}
+        }
+        edisgo_networks._max_calc_time = 1
+        edisgo_networks._max_calc_time_per_grid = None
+        edisgo_networks._task_retries = 0
+        edisgo_networks._task_max_workers = {"2_specs_overlying_grid": 1}
+
+        def run_edisgo(mv_grid_id, tasks):
+            if mv_grid_id == 2 and tasks == ["2_specs_overlying_grid"]:
+                raise ValueError("Task failed.")
+            return {mv_grid_id: f"results/{mv_grid_id}"}
+
+        edisgo_networks.run_edisgo = run_edisgo
+        results = edisgo_networks._run_edisgo_tasks_parallel(
+            [1, 2], LocalProcessExecutor(workers=2)
+        )
+        assert results[1] == "results/1"
+        # error of task is assigned to MV grid
+        assert isinstance(results[2], ValueError)
+        assert len(results) == 2
+
+    def test_get_executor(self):
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._executor_address = "localhost:6001"
+        edisgo_networks._executor_authkey = "secret"
+
+        edisgo_networks._executor = "process"
+        executor = edisgo_networks._get_executor(3)
+        assert isinstance(executor, LocalProcessExecutor)
+        assert executor.workers == 3
+        edisgo_networks._executor = "thread"
+        assert isinstance(edisgo_networks._get_executor(3), LocalThreadExecutor)
+        edisgo_networks._executor = "distributed"
+        executor = edisgo_networks._get_executor(3)
+        assert isinstance(executor, DistributedExecutor)
+        assert executor.address == ("localhost", 6001)
+        assert executor.authkey == b"secret"
+        edisgo_networks._executor = "cluster"
+        with pytest.raises(ValueError):
+            edisgo_networks._get_executor(3)
+
+    def test_task_hashes(self, tmpdir):
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eDisGo": {"tasks": ["1_setup_grid"], "max_workers": 2},
+            "eTraGo": {"scn_name": "eGon2035", "pf_post_lopf": False},
+        }
+        edisgo_networks._results = os.path.join(tmpdir, "results")
+        edisgo_networks._grid_path = os.path.join(tmpdir, "grids")
+        edisgo_networks._etrago_hash = "etrago"
+        os.makedirs(os.path.join(edisgo_networks._grid_path, "1"))
+        pd.DataFrame(index=range(3)).to_csv(
+            os.path.join(edisgo_networks._grid_path, "1", "buses.csv")
+        )
+
+        task_hash = edisgo_networks._get_task_hash(1, "1_setup_grid")
+        assert not edisgo_networks._task_is_done(1, "1_setup_grid", task_hash)
+        edisgo_networks._set_task_hash(1, "1_setup_grid", task_hash)
+        # results are only valid in case output files exist
+        assert not edisgo_networks._task_is_done(1, "1_setup_grid", task_hash)
+        open(os.path.join(edisgo_networks._results, "1", "grid_data.zip"), "w").close()
+        assert edisgo_networks._task_is_done(1, "1_setup_grid", task_hash)
+
+        # settings that do not influence results do not change the hash
+        edisgo_networks._json_file["eDisGo"]["max_workers"] = 4
+        assert edisgo_networks._get_task_hash(1, "1_setup_grid") == task_hash
+        # changed grid changes the hash
+        pd.DataFrame(index=range(4)).to_csv(
+            os.path.join(edisgo_networks._grid_path, "1", "buses.csv")
+        )
+        assert edisgo_networks._get_task_hash(1, "1_setup_grid") != task_hash
+
+        # hash of following task depends on hash of previous task
+        specs_hash = edisgo_networks._get_task_hash(1, "2_specs_overlying_grid")
+        edisgo_networks._set_task_hash(
+            1, "1_setup_grid", edisgo_networks._get_task_hash(1, "1_setup_grid")
+        )
+        assert edisgo_networks._get_task_hash(1, "2_specs_overlying_grid") != specs_hash
+        edisgo_networks._set_task_hash(1, "1_setup_grid", None)
+        assert edisgo_networks._get_task_hashes(1) == {}
+
+    @pytest.mark.parametrize("async_checkpoints", [False, True])
+    def test_run_edisgo(self, tmpdir, monkeypatch, async_checkpoints):
+        monkeypatch.setattr(edisgo_integration.database, "get_engine", lambda **_: None)
+        monkeypatch.setattr(edisgo_integration, "setup_logger", lambda **_: None)
+        tasks = ["1_setup_grid", "2_specs_overlying_grid", "4_optimisation"]
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eDisGo": {"tasks": tasks},
+            "eTraGo": {"scn_name": "eGon2035", "pf_post_lopf": False},
+        }
+        edisgo_networks._results = os.path.join(tmpdir, "results")
+        edisgo_networks._grid_path = os.path.join(tmpdir, "grids")
+        os.makedirs(os.path.join(edisgo_networks._grid_path, "1"))
+        edisgo_networks._etrago_hash = "etrago"
+        edisgo_networks._parallelization = False
+        edisgo_networks._resume = True
+        edisgo_networks._async_checkpoints = async_checkpoints
+        edisgo_networks._profiling = True
+        edisgo_networks._status_update = lambda *args, **kwargs: None
+        calls = []
+
+        def run_edisgo_task(
+            mv_grid_id, task, edisgo_grid, time_intervals, *args, checkpointer=None
+        ):
+            calls.append(task)
+            if edisgo_grid is None:
+                edisgo_grid = EDisGoMock()
+            edisgo_grid.no_tasks += 1
+            checkpoint = edisgo_networks._save_edisgo_grid(
+                edisgo_grid,
+                checkpointer,
+                directory=os.path.join(
+                    edisgo_networks._results,
+                    str(mv_grid_id),
+                    edisgo_networks._get_task_outputs(task)[0][: -len(".zip")],
+                ),
+            )
+            return edisgo_grid, time_intervals, checkpoint
+
+        edisgo_networks._run_edisgo_task = run_edisgo_task
+        edisgo_networks.run_edisgo(1)
+        assert calls == tasks
+        # saved results are not changed by following tasks
+        for no_tasks, task in enumerate(tasks, 1):
+            output = edisgo_networks._get_task_outputs(task)[0]
+            with open(os.path.join(edisgo_networks._results, "1", output)) as f:
+                assert f.read() == str(no_tasks)
+        assert set(edisgo_networks._get_task_hashes(1)) == set(tasks)
+        # saving of results is profiled
+        profiles = read_profiles(edisgo_networks._results, [1])
+        assert profiles.stage.tolist() == [
+            "save grid_data",
+            "save grid_data_overlying_grid",
+            "save grid_data_optimisation",
+        ]
+        assert profiles.success.all()
+
+        # summary of run is saved
+        with open(os.path.join(edisgo_networks._results, "1", "summary.json")) as f:
+            summary = json.load(f)
+        assert summary["status"] == "success"
+        assert summary["runtime"] > 0
+        assert summary["grid_expansion_costs_lv"] == 5.0
+        assert summary["grid_expansion_costs_mvlv"] == 0.0
+        assert summary["no_of_buses"] == 3
+        assert summary["curtailment_overlying_grid"] == 3.0
+        assert summary["curtailment_optimisation"] == 0.5
+
+        # tasks with valid results are skipped
+        calls.clear()
+        os.remove(os.path.join(edisgo_networks._results, "1", "grid_data.zip"))
+        edisgo_networks.run_edisgo(1)
+        assert calls == ["1_setup_grid"]
+
+        # results of grid are kept in summary, in case the last task is skipped,
+        # and summaries of all grids are gathered in one file
+        edisgo_networks._csv_import = None
+        status = pd.DataFrame({"outcome": ["success", "timeout"]}, index=[1, 2])
+        edisgo_networks._save_summary_index([1, 2], status)
+        summary = edisgo_networks.summary
+        assert summary.status.tolist() == ["success", "timeout"]
+        assert summary.at[1, "grid_expansion_costs_mv"] == 1.0
+        assert summary.loc[2, "runtime":].isna().all()
+
+    def test_run_edisgo_task_scheduling(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(edisgo_integration.database, "get_engine", lambda **_: None)
+        monkeypatch.setattr(edisgo_integration, "setup_logger", lambda **_: None)
+        # status events are written one minute apart
+        time_stamps = iter(range(0, 3600, 60))
+        monkeypatch.setattr(
+            edisgo_integration, "localtime", lambda: time.gmtime(next(time_stamps))
+        )
+        tasks = ["1_setup_grid", "2_specs_overlying_grid"]
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eDisGo": {"tasks": tasks, "results": str(tmpdir)},
+            "eTraGo": {"scn_name": "eGon2035", "pf_post_lopf": False},
+        }
+        edisgo_networks._results = os.path.join(tmpdir, "results")
+        edisgo_networks._grid_choice = pd.DataFrame(
+            {"no_of_points_per_cluster": [1], "the_selected_network_id": [1]}
+        )
+        edisgo_networks._parallelization = False
+        edisgo_networks._resume = False
+        edisgo_networks._async_checkpoints = False
+        edisgo_networks._init_status()
+        edisgo_networks._run_edisgo_task = (
+            lambda mv_grid_id, task, edisgo_grid, time_intervals, *args, **kwargs: (
+                EDisGoMock(),
+                time_intervals,
+                None,
+            )
+        )
+
+        # runtime of run with one task per call is taken from the status file
+        for task in tasks:
+            edisgo_networks.run_edisgo(1, tasks=[task])
+        with open(os.path.join(edisgo_networks._results, "1", "summary.json")) as f:
+            summary = json.load(f)
+        assert summary["status"] == "success"
+        assert summary["runtime"] == 5 * 60.0
+        assert edisgo_networks.status.at[1, "runtime"] == summary["runtime"]
+
+    @pytest.mark.parametrize("optimisation_workers", [1, 2])
+    def test_run_edisgo_task_optimisation(self, monkeypatch, optimisation_workers):
+        monkeypatch.setattr(
+            edisgo_integration,
+            "aggregate_district_heating_components",
+            lambda *args, **kwargs: None,
+            raising=False,
+        )
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._optimisation_workers = optimisation_workers
+        edisgo_networks._max_workers = 4
+        timeindex = pd.date_range("2011-01-01", periods=10, freq="H")
+        edisgo_grid = SimpleNamespace(
+            overlying_grid=SimpleNamespace(
+                feedin_district_heating=pd.DataFrame(),
+                thermal_storage_units_central_soc=pd.DataFrame(),
+            ),
+            apply_heat_pump_operating_strategy=lambda: None,
+            timeseries=TimeSeriesMock(timeindex),
+            opf_results=opf_results_mock(),
+            results=SimpleNamespace(grid_expansion_costs=pd.DataFrame()),
+            topology=SimpleNamespace(buses_df=pd.DataFrame(), lines_df=pd.DataFrame()),
+        )
+        edisgo_grid.overlying_grid.renewables_curtailment = pd.Series(dtype=float)
+        time_intervals = pd.DataFrame(
+            {"time_steps": [timeindex[2:4], None, timeindex[6:9]]},
+            index=["time_interval_1", "time_interval_2", "time_interval_3"],
+        )
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def optimise_interval(
+            edisgo_grid, scenario, logger, time_interval, time_steps, *args
+        ):
+            with lock:
+                running.append(time_interval)
+                max_running.append(len(running))
+            time.sleep(0.2)
+            with lock:
+                running.remove(time_interval)
+            value = float(time_interval[-1])
+            edisgo_copy = SimpleNamespace(
+                timeseries=TimeSeriesMock(time_steps, value),
+                opf_results=opf_results_mock(list(time_steps), value),
+            )
+            for attr in TimeSeriesMock.attributes[4:]:
+                setattr(
+                    edisgo_copy.timeseries,
+                    attr,
+                    pd.DataFrame(value, index=time_steps, columns=["b"]),
+                )
+            return edisgo_copy
+
+        edisgo_networks._run_edisgo_task_optimisation_interval = optimise_interval
+        edisgo_grid = edisgo_networks._run_edisgo_task_optimisation(
+            edisgo_grid,
+            "eGon2035",
+            logging.getLogger(__name__),
+            time_intervals,
+            "results",
+        )
+
+        # intervals are optimised in parallel
+        assert max(max_running) == optimisation_workers
+        # results of all intervals are written back
+        timeindex = timeindex[2:4].append(timeindex[6:9])
+        expected = pd.Series([1.0] * 2 + [3.0] * 3, index=timeindex)
+        for attr in TimeSeriesMock.attributes:
+            df = getattr(edisgo_grid.timeseries, attr)
+            column = "a" if attr in TimeSeriesMock.attributes[:4] else "b"
+            pd.testing.assert_series_equal(
+                df.loc[timeindex, column], expected, check_names=False
+            )
+        assert (edisgo_grid.timeseries.timeindex == timeindex).all()
+        for df in [
+            edisgo_grid.opf_results.overlying_grid,
+            edisgo_grid.opf_results.battery_storage_t.p,
+            edisgo_grid.opf_results.battery_storage_t.e,
+        ]:
+            pd.testing.assert_series_equal(df.a, expected, check_names=False)
+        # curtailment in the optimisation of all intervals is summarised
+        summary = edisgo_integration._summarize_edisgo_grid(edisgo_grid)
+        assert summary["curtailment_optimisation"] == 2 * (2 * 1.0 + 3 * 3.0)
+
+    def test_run_edisgo_task_optimisation_interval(self, monkeypatch):
+        class EDisGoCopyMock:
+            dsm = SimpleNamespace(p_max=pd.DataFrame())
+            heat_pump = SimpleNamespace(heat_demand_df=pd.DataFrame())
+            topology = SimpleNamespace(storage_units_df=pd.DataFrame())
+
+            def __init__(self, time_steps):
+                self.time_steps = time_steps
+
+            def spatial_complexity_reduction(self, **kwargs):
+                pass
+
+            def to_pypsa(self):
+                return SimpleNamespace(loads=pd.DataFrame(index=["home_1", "work_1"]))
+
+            def to_powermodels(self, **kwargs):
+                return {"name": f"ding0_1_t_{len(self.time_steps)}"}, {}
+
+            def pm_optimize(self, **kwargs):
+                pm, _ = self.to_powermodels(**kwargs)
+                # wait for the other time interval
+                time.sleep(0.2)
+                with lock:
+                    names.append(pm["name"])
+
+        monkeypatch.setattr(
+            edisgo_integration,
+            "_reduced_deepcopy",
+            lambda edisgo_grid, time_steps: EDisGoCopyMock(time_steps),
+        )
+        monkeypatch.setattr(
+            edisgo_integration,
+            "reduce_timeseries_data_to_given_timeindex",
+            lambda *args: None,
+            raising=False,
+        )
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._profiling = False
+        edisgo_networks._save_edisgo_grid = lambda *args, **kwargs: None
+        timeindex = pd.date_range("2011-01-01", periods=10, freq="H")
+        names = []
+        lock = threading.Lock()
+
+        def optimise_interval(time_interval, time_steps):
+            return edisgo_networks._run_edisgo_task_optimisation_interval(
+                None,
+                "eGon2035",
+                logging.getLogger(__name__),
+                time_interval,
+                time_steps,
+                "results",
+                0.3,
+            )
+
+        # concurrent time intervals of the same length use distinct OPF names
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            edisgo_copies = list(
+                pool.map(
+                    optimise_interval,
+                    ["time_interval_1", "time_interval_2"],
+                    [timeindex[:5], timeindex[5:]],
+                )
+            )
+        assert sorted(names) == [
+            "ding0_1_t_5_time_interval_1",
+            "ding0_1_t_5_time_interval_2",
+        ]
+        # returned copies are not changed
+        assert edisgo_copies[0].to_powermodels()[0]["name"] == "ding0_1_t_5"
+
+    def test_run_edisgo_task_optimisation_input(self, tmpdir, monkeypatch):
+        timeindex = pd.date_range("2011-01-01", periods=504, freq="H")
+        csv_folder = os.path.join(tmpdir, "etrago_results")
+        os.makedirs(csv_folder)
+        pd.DataFrame(
+            {"converged": [True] * 400 + [False] + [True] * 103}, index=timeindex
+        ).to_csv(os.path.join(csv_folder, "pf_solution.csv"))
+
+        def import_edisgo_from_files(edisgo_path, **kwargs):
+            # grid as saved by task specs overlying grid
+            return SimpleNamespace(
+                topology=SimpleNamespace(id=1),
+                timeseries=SimpleNamespace(
+                    _attributes=["loads_active_power"],
+                    loads_active_power=pd.DataFrame(
+                        1.0, index=timeindex, columns=["a"]
+                    ),
+                ),
+                overlying_grid=SimpleNamespace(
+                    _attributes=["renewables_curtailment", "storage_units_soc"],
+                    renewables_curtailment=pd.Series(1.0, index=timeindex),
+                    storage_units_soc=pd.Series(1.0, index=timeindex),
+                ),
+            )
+
+        def get_most_critical_time_intervals(edisgo_grid, **kwargs):
+            return pd.DataFrame(
+                {
+                    "time_steps_overloading": [timeindex[:168]],
+                    "time_steps_voltage_issues": [timeindex[168:336]],
+                    "percentage_max_overloaded_components": [1.0],
+                    "percentage_buses_max_voltage_deviation": [1.0],
+                }
+            )
+
+        for name, func in [
+            ("import_edisgo_from_files", import_edisgo_from_files),
+            ("distribute_overlying_grid_requirements", deepcopy),
+            ("get_most_critical_time_intervals", get_most_critical_time_intervals),
+        ]:
+            monkeypatch.setattr(edisgo_integration, name, func, raising=False)
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eGo": {"csv_import_eTraGo": csv_folder},
+            "eTraGo": {"scn_name": "eGon2035"},
+        }
+        edisgo_networks._results = str(tmpdir)
+        edisgo_networks._profiling = False
+        os.makedirs(os.path.join(tmpdir, "1"))
+        inputs = []
+
+        def run_edisgo_task_optimisation(edisgo_grid, scenario, logger, ti, path):
+            inputs.append((edisgo_grid, ti))
+            return edisgo_grid
+
+        edisgo_networks._run_edisgo_task_optimisation = run_edisgo_task_optimisation
+        edisgo_networks._save_edisgo_grid = lambda *args, **kwargs: None
+
+        def run_edisgo_task(task, edisgo_grid, time_intervals):
+            return edisgo_networks._run_edisgo_task(
+                1, task, edisgo_grid, time_intervals, logging.getLogger(), None
+            )
+
+        # monolithic run hands results to the next task in memory
+        edisgo_grid, time_intervals, _ = run_edisgo_task(
+            "3_temporal_complexity_reduction", None, None
+        )
+        run_edisgo_task("4_optimisation", edisgo_grid, time_intervals)
+        # task graph runs every task separately and imports previous results
+        run_edisgo_task("3_temporal_complexity_reduction", None, None)
+        run_edisgo_task("4_optimisation", None, None)
+
+        (grid_monolithic, ti_monolithic), (grid_task_graph, ti_task_graph) = inputs
+        assert grid_task_graph is not grid_monolithic
+        pd.testing.assert_frame_equal(
+            grid_task_graph.timeseries.loads_active_power,
+            grid_monolithic.timeseries.loads_active_power,
+        )
+        assert grid_task_graph.timeseries.loads_active_power.iat[400, 0] == 0.0
+        for attr in ["renewables_curtailment", "storage_units_soc"]:
+            pd.testing.assert_series_equal(
+                getattr(grid_task_graph.overlying_grid, attr),
+                getattr(grid_monolithic.overlying_grid, attr),
+            )
+        for ti in ["time_interval_1", "time_interval_2"]:
+            assert list(ti_task_graph.at[ti, "time_steps"]) == list(
+                ti_monolithic.at[ti, "time_steps"]
+            )
+
+        # OPF results of the selected time intervals are results of the
+        # optimisation as well
+        assert edisgo_networks._get_task_outputs("4_optimisation", 1) == [
+            "grid_data_optimisation.zip",
+            "opf_results_time_interval_1.zip",
+            "opf_results_time_interval_2.zip",
+        ]
+
+        # resumed run skips the temporal complexity reduction and imports the grid
+        monkeypatch.setattr(edisgo_integration.database, "get_engine", lambda **_: None)
+        monkeypatch.setattr(edisgo_integration, "setup_logger", lambda **_: None)
+        edisgo_networks._json_file["eDisGo"] = {
+            "tasks": ["3_temporal_complexity_reduction", "4_optimisation"]
+        }
+        edisgo_networks._parallelization = False
+        edisgo_networks._async_checkpoints = False
+        edisgo_networks._resume = True
+        edisgo_networks._save_summary = lambda *args, **kwargs: None
+        outcomes = []
+        edisgo_networks._status_update = lambda *args, **kwargs: outcomes.append(
+            kwargs.get("outcome")
+        )
+        inputs.clear()
+        edisgo_networks.run_edisgo(1)
+        outcomes.clear()
+        edisgo_networks.run_edisgo(1)
+        assert "skipped" in outcomes
+        pd.testing.assert_frame_equal(
+            inputs[1][0].timeseries.loads_active_power,
+            grid_monolithic.timeseries.loads_active_power,
+        )
+
+    def test_run_edisgo_task_grid_reinforcement_import(self, tmpdir, monkeypatch):
+        def import_edisgo_from_files(edisgo_path, **kwargs):
+            # only imported data is available
+            edisgo_grid = EDisGoMock()
+            if not kwargs.get("import_overlying_grid"):
+                edisgo_grid.overlying_grid.renewables_curtailment = pd.Series(
+                    dtype=float
+                )
+            if not kwargs.get("import_opf_results"):
+                edisgo_grid.opf_results.grid_slacks_t.gen_d_crt = pd.DataFrame()
+            return edisgo_grid
+
+        monkeypatch.setattr(
+            edisgo_integration,
+            "import_edisgo_from_files",
+            import_edisgo_from_files,
+            raising=False,
+        )
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {"eTraGo": {"scn_name": "eGon2035"}}
+        edisgo_networks._results = str(tmpdir)
+        edisgo_networks._profiling = False
+        edisgo_networks._run_edisgo_task_grid_reinforcement = (
+            lambda edisgo_grid, logger: edisgo_grid
+        )
+        edisgo_networks._save_edisgo_grid = lambda *args, **kwargs: None
+
+        # task imports the data needed for the summary of the run
+        edisgo_grid, _, _ = edisgo_networks._run_edisgo_task(
+            1, "5_grid_reinforcement", None, None, logging.getLogger(), None
+        )
+        summary = edisgo_integration._summarize_edisgo_grid(edisgo_grid)
+        assert summary["curtailment_overlying_grid"] == 3.0
+        assert summary["curtailment_optimisation"] == 0.5
+
+    def test_successful_grids(self, tmpdir):
+        def edisgo_networks_mock(no_grids):
+            edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+            edisgo_networks._csv_import = None
+            edisgo_networks._results = str(tmpdir)
+            edisgo_networks._grid_choice = pd.DataFrame(
+                {
+                    "the_selected_network_id": list(range(no_grids)),
+                    "no_of_points_per_cluster": [1 + i % 3 for i in range(no_grids)],
+                }
+            )
+            # every tenth grid failed
+            edisgo_networks._edisgo_grids = {
+                i: "Timeout" if i % 10 == 0 else object() for i in range(no_grids)
+            }
+            return edisgo_networks
+
+        edisgo_networks = edisgo_networks_mock(20)
+        edisgo_networks._edisgo_grids[5] = ValueError()
+        # weights of failed grids 0, 5 and 10 are 1, 3 and 2
+        assert edisgo_networks._successful_grids() == pytest.approx(1 - 6 / 39)
+
+        def runtime(no_grids):
+            edisgo_networks = edisgo_networks_mock(no_grids)
+            runtimes = []
+            for _ in range(3):
+                t_start = time.perf_counter()
+                edisgo_networks._successful_grids()
+                runtimes.append(time.perf_counter() - t_start)
+            return min(runtimes)
+
+        # runtime grows linearly with the number of grids, it would grow 16-fold
+        # in case the weight of every grid was looked up separately
+        assert runtime(4000) < 8 * runtime(1000)
+
+        # status is taken from summary of eDisGo runs, in case it exists
+        edisgo_networks._edisgo_grids = {}
+        pd.DataFrame(
+            {"status": ["failed" if i % 5 == 0 else "success" for i in range(20)]},
+            index=pd.Index(range(20), name="mv_grid_id"),
+        ).to_parquet(os.path.join(tmpdir, "summary.parquet"))
+        # weights of failed grids 0, 5, 10 and 15 are 1, 3, 2 and 1
+        assert edisgo_networks._successful_grids() == pytest.approx(1 - 7 / 39)
+
+    @pytest.mark.parametrize("lazy_results_import", [False, True, None])
+    def test_load_edisgo_results(self, tmpdir, monkeypatch, lazy_results_import):
+        imported = []
+
+        def import_edisgo_from_files(edisgo_path, **kwargs):
+            imported.append(edisgo_path)
+            with ZipFile(edisgo_path) as archive:
+                with archive.open(
+                    "results/grid_expansion_results/grid_expansion_costs.csv"
+                ) as f:
+                    costs = pd.read_csv(f, index_col=0)
+            return SimpleNamespace(
+                results=SimpleNamespace(grid_expansion_costs=costs), topology="grid"
+            )
+
+        monkeypatch.setattr(
+            edisgo_integration,
+            "import_edisgo_from_files",
+            import_edisgo_from_files,
+            raising=False,
+        )
+        edisgo_networks = EDisGoNetworks.__new__(EDisGoNetworks)
+        edisgo_networks._json_file = {
+            "eDisGo": {"tasks": ["1_setup_grid", "5_grid_reinforcement"]},
+            "eTraGo": {"scn_name": "eGon2035"},
+        }
+        edisgo_networks._results = str(tmpdir)
+        edisgo_networks._csv_import = str(tmpdir)
+        edisgo_networks._max_workers = 2
+        edisgo_networks._lazy_results_import = lazy_results_import
+        edisgo_networks._edisgo_grids = {}
+        pd.DataFrame(
+            {
+                "no_of_points_per_cluster": [1, 1, 1],
+                "the_selected_network_id": [1, 2, 3],
+                "represented_grids": ["[1]", "[2]", "[3]"],
+            }
+        ).to_csv(os.path.join(tmpdir, "grid_choice.csv"))
+        for mv_grid_id in [1, 2]:
+            os.makedirs(os.path.join(tmpdir, str(mv_grid_id)))
+            path = os.path.join(
+                tmpdir, str(mv_grid_id), "grid_data_reinforcement_eGon2035.zip"
+            )
+            with ZipFile(path, "w") as archive:
+                archive.writestr(
+                    "results/grid_expansion_results/grid_expansion_costs.csv",
+                    pd.DataFrame(
+                        {"total_costs": [mv_grid_id], "voltage_level": ["mv"]},
+                        index=["Line_1"],
+                    ).to_csv(),
+                )
+
+        if lazy_results_import is None:
+            # grids are imported lazily, in case a summary of the eDisGo runs exists
+            pd.DataFrame(
+                {"status": ["success", "success", "failed"]},
+                index=pd.Index([1, 2, 3], name="mv_grid_id"),
+            ).to_parquet(os.path.join(tmpdir, "summary.parquet"))
+
+        edisgo_networks._load_edisgo_results()
+        edisgo_grids = edisgo_networks.network
+        # MV grid without results is marked as failed
+        assert list(edisgo_grids) == [1, 2, 3]
+        assert isinstance(edisgo_grids[3], str)
+        if lazy_results_import is not False:
+            # costs are read without importing the grids
+            assert edisgo_grids[2].grid_expansion_costs.at["Line_1", "total_costs"] == 2
+            assert not edisgo_grids[2].loaded
+            assert imported == []
+            # grid is imported once on attribute access
+            assert edisgo_grids[2].topology == "grid"
+            assert edisgo_grids[2].results.grid_expansion_costs.total_costs[0] == 2
+            assert edisgo_grids[2].loaded
+            assert imported == [edisgo_grids[2].path]
+            # proxies can be copied without importing the grids
+            assert not deepcopy(edisgo_grids[1]).loaded
+        else:
+            assert len(imported) == 2
+            assert edisgo_grids[1].results.grid_expansion_costs.total_costs[0] == 1
+
+
+def test_reduced_deepcopy():
+    timeindex = pd.date_range("2011-01-01", periods=8760, freq="H")
+    rng = np.random.default_rng(42)
+    timeseries = SimpleNamespace(
+        timeindex=timeindex,
+        loads_active_power=pd.DataFrame(rng.random((8760, 500)), index=timeindex),
+    )
+    edisgo_grid = SimpleNamespace(
+        topology=SimpleNamespace(buses_df=pd.DataFrame({"v_nom": [20.0, 0.4]})),
+        timeseries=timeseries,
+        dsm=SimpleNamespace(
+            p_max=pd.DataFrame(rng.random((8760, 10)), index=timeindex),
+            # time series referenced twice is only sliced once
+            e_max=timeseries.loads_active_power,
+        ),
+        overlying_grid={"heat_pump": pd.Series(rng.random(8760), index=timeindex)},
+    )
+    edisgo_grid.timeseries.edisgo_obj = edisgo_grid
+    time_steps = timeindex[168:336]
+
+    tracemalloc.start()
+    edisgo_copy = _reduced_deepcopy(edisgo_grid, time_steps)
+    reduced_peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    tracemalloc.start()
+    deepcopy(edisgo_grid)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # memory falls roughly by the ratio of time steps to whole year
+    assert reduced_peak_memory < 5 * len(time_steps) / len(timeindex) * peak_memory
+
+    pd.testing.assert_frame_equal(
+        edisgo_copy.timeseries.loads_active_power,
+        edisgo_grid.timeseries.loads_active_power.loc[time_steps],
+    )
+    assert edisgo_copy.dsm.e_max is edisgo_copy.timeseries.loads_active_power
+    pd.testing.assert_frame_equal(
+        edisgo_copy.dsm.p_max, edisgo_grid.dsm.p_max.loc[time_steps]
+    )
+    pd.testing.assert_series_equal(
+        edisgo_copy.overlying_grid["heat_pump"],
+        edisgo_grid.overlying_grid["heat_pump"].loc[time_steps],
+    )
+    # all other data is deep copied
+    pd.testing.assert_frame_equal(
+        edisgo_copy.topology.buses_df, edisgo_grid.topology.buses_df
+    )
+    assert edisgo_copy.topology.buses_df is not edisgo_grid.topology.buses_df
+    assert edisgo_copy.timeseries.edisgo_obj is edisgo_copy
+    assert len(edisgo_grid.timeseries.loads_active_power) == 8760
+
+
+@pytest.mark.parametrize("align_columns", [True, False])
+def test_write_back_time_series(align_columns):
+    timeindex = pd.date_range("2011-01-01", periods=10, freq="H")
+    df = pd.DataFrame(1.0, index=timeindex, columns=["a", "b", "c"])
+    interval_dfs = [
+        pd.DataFrame(2.0, index=timeindex[[5, 2]], columns=["c", "a"]),
+        pd.DataFrame(3.0, index=timeindex[7:9], columns=["a", "d"]),
+    ]
+    expected = df.copy()
+    for interval_df in interval_dfs:
+        if align_columns:
+            expected.loc[interval_df.index, :] = interval_df
+        else:
+            expected.loc[interval_df.index, interval_df.columns] = interval_df
+
+    result = _write_back_time_series(df, interval_dfs, align_columns=align_columns)
+    pd.testing.assert_frame_equal(result, expected)
+
+    with pytest.raises(ValueError):
+        _write_back_time_series(
+            df, [pd.DataFrame(2.0, index=[pd.Timestamp("2012-01-01")], columns=["a"])]
+        )
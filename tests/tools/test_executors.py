@@ -0,0 +1,215 @@
+import os
+import socket
+import time
+
+import multiprocess as mp2
+import pandas as pd
+import pytest
+
+from ego.tools.executors import (
+    DistributedExecutor,
+    LocalProcessExecutor,
+    LocalThreadExecutor,
+    parallelizer,
+    run_worker,
+)
+
+
+def run_grid(grid_id, factor):
+    if grid_id == 2:
+        raise ValueError("Grid 2 failed.")
+    if grid_id == 3:
+        time.sleep(10)
+    if grid_id == 5:
+        os._exit(1)
+    return {grid_id: grid_id * factor}
+
+
+def run_task(key, log_path, fail_once=False):
+    mv_grid_id, task = key
+    with open(log_path, "a") as f:
+        f.write(f"{mv_grid_id},{task},start,{time.time()}\n")
+    if mv_grid_id == 2 and task == "a":
+        marker = f"{log_path}.failed"
+        if not fail_once or not os.path.exists(marker):
+            open(marker, "w").close()
+            raise ValueError("Task a of grid 2 failed.")
+    time.sleep(0.2)
+    with open(log_path, "a") as f:
+        f.write(f"{mv_grid_id},{task},end,{time.time()}\n")
+    return {mv_grid_id: task}
+
+
+@pytest.fixture
+def distributed_executor():
+    """
+    Distributed executor with two remote workers running in local processes.
+
+    """
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        address = ("localhost", s.getsockname()[1])
+    processes = [
+        mp2.Process(target=run_worker, args=(address, "secret", 1, 5)) for _ in range(2)
+    ]
+    for process in processes:
+        process.start()
+    yield DistributedExecutor(address=address, authkey="secret")
+    for process in processes:
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+
+
+class TestParallelizer:
+    def test_parallelizer(self):
+        results = parallelizer([1, 2, 4, 5, 6], run_grid, (10,), 1, workers=2)
+        assert results[1] == 10
+        assert results[4] == 40
+        assert results[6] == 60
+        assert isinstance(results[2], ValueError)
+        # died worker is replaced
+        assert isinstance(results[5], RuntimeError)
+
+    @pytest.mark.parametrize("worker_lifetime", [1, None])
+    def test_parallelizer_worker_lifetime(self, worker_lifetime):
+        results = parallelizer(
+            [1, 4, 6, 7], run_grid, (10,), 1, workers=2, worker_lifetime=worker_lifetime
+        )
+        assert results == {1: 10, 4: 40, 6: 60, 7: 70}
+
+    def test_parallelizer_timeout(self):
+        timed_out = []
+        t_start = time.perf_counter()
+        results = parallelizer(
+            [1, 3, 4],
+            run_grid,
+            (10,),
+            1 / 3600,
+            workers=1,
+            timeout_callback=timed_out.append,
+        )
+        # timed out grid is stopped after the given time
+        assert time.perf_counter() - t_start < 5
+        assert results == {1: 10}
+        assert timed_out == [3]
+
+    def test_parallelizer_timeout_per_grid(self):
+        timed_out = []
+        t_start = time.perf_counter()
+        results = parallelizer(
+            [3, 1, 4, 6],
+            run_grid,
+            (10,),
+            1,
+            workers=2,
+            max_calc_time_per_grid=1 / 3600,
+            timeout_callback=timed_out.append,
+        )
+        # only the slow grid is stopped, while the other grids are calculated
+        assert time.perf_counter() - t_start < 5
+        assert results == {1: 10, 4: 40, 6: 60}
+        assert timed_out == [3]
+
+    @pytest.mark.parametrize("retries", [0, 1])
+    def test_parallelizer_dependencies(self, tmpdir, retries):
+        log_path = os.path.join(tmpdir, "log.csv")
+        keys = [(mv_grid_id, task) for mv_grid_id in [1, 2, 3] for task in "abc"]
+        results = parallelizer(
+            keys,
+            run_task,
+            (log_path, True),
+            1,
+            workers=3,
+            dependencies={
+                (mv_grid_id, task): [(mv_grid_id, chr(ord(task) - 1))]
+                for mv_grid_id, task in keys
+            },
+            retries=retries,
+            task_groups={key: key[1] for key in keys},
+            group_limits={"b": 1},
+        )
+        log = pd.read_csv(log_path, names=["grid", "task", "event", "time"])
+        no_starts = log[log.event == "start"].groupby(["grid", "task"]).size()
+        starts = log[log.event == "start"].groupby(["grid", "task"]).time.max()
+        ends = log[log.event == "end"].set_index(["grid", "task"]).time
+
+        if retries == 0:
+            # tasks depending on failed task are not run
+            assert isinstance(results[(2, "a")], ValueError)
+            assert (2, "b") not in starts.index
+            assert results[1] == "c"
+        else:
+            # failed task is retried
+            assert results == {1: "c", 2: "c", 3: "c"}
+            assert no_starts[(2, "a")] == 2
+        # tasks start after the tasks they depend on ended
+        for mv_grid_id, task in ends.index:
+            if task != "a":
+                assert starts[(mv_grid_id, task)] >= ends[(mv_grid_id, "a")]
+        # tasks of group with limit do not run at the same time
+        intervals = sorted(
+            (starts[key], ends[key]) for key in ends.index if key[1] == "b"
+        )
+        for (_, end), (start, _) in zip(intervals[:-1], intervals[1:]):
+            assert start >= end
+
+
+class TestExecutors:
+    def test_local_thread_executor(self):
+        timed_out = []
+        t_start = time.perf_counter()
+        results = parallelizer(
+            [3, 1, 2, 4, 6],
+            run_grid,
+            (10,),
+            1,
+            max_calc_time_per_grid=1 / 3600,
+            timeout_callback=timed_out.append,
+            executor=LocalThreadExecutor(workers=2),
+        )
+        # timed out grid is left running in the background
+        assert time.perf_counter() - t_start < 5
+        assert isinstance(results.pop(2), ValueError)
+        assert results == {1: 10, 4: 40, 6: 60}
+        assert timed_out == [3]
+
+    def test_distributed_executor(self, distributed_executor):
+        results = parallelizer(
+            [1, 2, 4, 5, 6, 7], run_grid, (10,), 1, executor=distributed_executor
+        )
+        assert isinstance(results.pop(2), ValueError)
+        # died process of remote worker is reported as error
+        assert isinstance(results.pop(5), RuntimeError)
+        assert results == {1: 10, 4: 40, 6: 60, 7: 70}
+
+    def test_distributed_executor_timeout_per_grid(self, distributed_executor):
+        timed_out = []
+        t_start = time.perf_counter()
+        results = parallelizer(
+            [3, 1, 4, 6],
+            run_grid,
+            (10,),
+            1,
+            max_calc_time_per_grid=2 / 3600,
+            timeout_callback=timed_out.append,
+            executor=distributed_executor,
+        )
+        # remote worker stops the slow grid and connects again
+        assert time.perf_counter() - t_start < 8
+        assert results == {1: 10, 4: 40, 6: 60}
+        assert timed_out == [3]
+
+    def test_distributed_executor_authkey(self):
+        with pytest.raises(ValueError):
+            DistributedExecutor(address=("localhost", 6000))
+
+    def test_local_process_executor_workers(self):
+        executor = LocalProcessExecutor(workers=1)
+        executor.start(run_grid, (10,))
+        worker = executor.get_worker(0)
+        assert executor.get_worker(1) is None
+        worker.connection.send(4)
+        assert worker.connection.recv() == (4, {4: 40}, None)
+        worker.stop()
+        executor.shutdown()
@@ -1,13 +1,24 @@
 import logging
 import os
+import pickle
 import random
+import shutil
 
+import multiprocess as mp2
+import numpy as np
 import pandas as pd
 import pytest
 
 from pypsa import Network as PyPSANetwork
 
-from ego.tools.interface import ETraGoMinimalData, get_etrago_results_per_bus
+from ego.tools.interface import (
+    ETraGoMinimalData,
+    export_etrago_specs,
+    get_csv_folder_hash,
+    get_etrago_results_for_buses,
+    get_etrago_results_per_bus,
+    import_etrago_specs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +34,25 @@ class TestSpecs:
         etrago_network = ETraGoMinimalData(self.etrago_network)
         assert "p_min_pu" not in etrago_network.generators_t
 
+    def test_get_heat_bus_components(self):
+        etrago_network = ETraGoMinimalData(self.etrago_network)
+
+        store_links = etrago_network.get_heat_bus_components("4", "store_links")
+        assert store_links.index.tolist() == ["8"]
+        stores = etrago_network.get_heat_bus_components(["4", "6"], "stores")
+        assert stores.index.tolist() == ["5 central_heat_store", "7 rural_heat_store"]
+        feedin_links = etrago_network.get_heat_bus_components("4", "feedin_links")
+        assert feedin_links.index.tolist() == ["4", "6"]
+        feedin_generators = etrago_network.get_heat_bus_components(
+            "4", "feedin_generators"
+        )
+        assert feedin_generators.index.tolist() == [
+            "4 solar_thermal_collector",
+            "4 geo_thermal",
+        ]
+        # buses PtH units do not feed into are not considered
+        assert etrago_network.get_heat_bus_components("0", "store_links").empty
+
     def test_get_etrago_results_per_bus(self):
 
         bus_id = 0
@@ -89,6 +119,31 @@ class TestSpecs:
                         value, reference_s, check_index_type=False, check_names=False
                     )
 
+    def test_get_etrago_results_per_bus_lazy(self):
+
+        etrago_results_per_bus = get_etrago_results_per_bus(
+            0, ETraGoMinimalData(self.etrago_network), True, False
+        )
+        assert len(etrago_results_per_bus) == 28
+        assert "thermal_storage_central_soc" in etrago_results_per_bus
+        assert "renewables_potential" not in etrago_results_per_bus._data
+
+        # all specifications of the respective group are computed and memoized
+        renewables_curtailment = etrago_results_per_bus["renewables_curtailment"]
+        assert "renewables_potential" in etrago_results_per_bus._data
+        assert "thermal_storage_central_soc" not in etrago_results_per_bus._data
+        assert (
+            etrago_results_per_bus["renewables_curtailment"] is renewables_curtailment
+        )
+
+        # pickling computes all specifications
+        etrago_results_per_bus_unpickled = pickle.loads(
+            pickle.dumps(etrago_results_per_bus)
+        )
+        assert set(etrago_results_per_bus_unpickled._data) == set(
+            etrago_results_per_bus
+        )
+
     def test_get_etrago_results_per_bus_empty(self):
 
         bus_id = 11
@@ -178,3 +233,198 @@ class TestSpecs:
             check_names=False,
             atol=1e-4,
         )
+
+    @pytest.mark.parametrize(
+        "pf_post_lopf, max_cos_phi_renewable", [(True, False), (True, 0.9), (False, 0)]
+    )
+    def test_get_etrago_results_for_buses(self, pf_post_lopf, max_cos_phi_renewable):
+
+        bus_ids = [0, 4, 6, 11]
+        etrago_results_for_buses = get_etrago_results_for_buses(
+            bus_ids,
+            ETraGoMinimalData(self.etrago_network),
+            pf_post_lopf,
+            max_cos_phi_renewable,
+        )
+        assert list(etrago_results_for_buses.keys()) == bus_ids
+
+        for bus_id in bus_ids:
+            etrago_results_per_bus = get_etrago_results_per_bus(
+                bus_id,
+                ETraGoMinimalData(self.etrago_network),
+                pf_post_lopf,
+                max_cos_phi_renewable,
+            )
+            assert (
+                etrago_results_for_buses[bus_id].keys() == etrago_results_per_bus.keys()
+            )
+            for key, value in etrago_results_per_bus.items():
+                logger.info(f"Check Result: {key}")
+                result = etrago_results_for_buses[bus_id][key]
+                if isinstance(value, pd.DataFrame):
+                    pd.testing.assert_frame_equal(result, value)
+                elif isinstance(value, pd.Series):
+                    pd.testing.assert_series_equal(result, value)
+                elif isinstance(value, pd.Index):
+                    pd.testing.assert_index_equal(result, value)
+                else:
+                    assert result == value
+
+    @pytest.mark.parametrize(
+        "pf_post_lopf, max_cos_phi_renewable", [(True, False), (True, 0.9), (False, 0)]
+    )
+    def test_get_etrago_results_per_bus_compact(
+        self, pf_post_lopf, max_cos_phi_renewable
+    ):
+
+        etrago_network_compact = ETraGoMinimalData(self.etrago_network, compact=True)
+        assert etrago_network_compact.generators_t["p"].dtypes.eq("float32").all()
+        assert "p_min_pu" not in etrago_network_compact.generators_t
+
+        for bus_id in [0, 4, 6, 11]:
+            etrago_results_per_bus = get_etrago_results_per_bus(
+                bus_id,
+                ETraGoMinimalData(self.etrago_network),
+                pf_post_lopf,
+                max_cos_phi_renewable,
+            )
+            etrago_results_per_bus_compact = get_etrago_results_per_bus(
+                bus_id,
+                etrago_network_compact,
+                pf_post_lopf,
+                max_cos_phi_renewable,
+            )
+            for key, value in etrago_results_per_bus.items():
+                logger.info(f"Check Result: {key}")
+                result = etrago_results_per_bus_compact[key]
+                if isinstance(value, pd.DataFrame):
+                    pd.testing.assert_frame_equal(
+                        result, value, check_dtype=False, rtol=1e-5
+                    )
+                elif isinstance(value, pd.Series):
+                    pd.testing.assert_series_equal(
+                        result, value, check_dtype=False, rtol=1e-5
+                    )
+                elif isinstance(value, pd.Index):
+                    pd.testing.assert_index_equal(result, value)
+                else:
+                    assert result == value
+
+    def test_etrago_minimal_data_to_memmap(self, tmp_path):
+
+        etrago_network = ETraGoMinimalData(self.etrago_network)
+        etrago_network.to_memmap(str(tmp_path))
+        assert os.path.isfile(os.path.join(tmp_path, "generators_p.npy"))
+
+        # time series are not pickled but mapped from the files
+        etrago_network_unpickled = pickle.loads(pickle.dumps(etrago_network))
+        assert isinstance(etrago_network_unpickled.generators_t._blocks["p"], np.memmap)
+        pd.testing.assert_frame_equal(
+            etrago_network_unpickled.generators_t["p"],
+            self.etrago_network.generators_t["p"],
+            check_freq=False,
+        )
+
+        etrago_results_per_bus = get_etrago_results_per_bus(
+            0, ETraGoMinimalData(self.etrago_network), True, 0.9
+        )
+        with mp2.Pool(1) as pool:
+            etrago_results_per_bus_worker = pool.apply(
+                get_etrago_results_per_bus, (0, etrago_network, True, 0.9)
+            )
+        for key, value in etrago_results_per_bus.items():
+            result = etrago_results_per_bus_worker[key]
+            if isinstance(value, pd.DataFrame):
+                pd.testing.assert_frame_equal(result, value)
+            elif isinstance(value, pd.Series):
+                pd.testing.assert_series_equal(result, value)
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_etrago_minimal_data_save_and_load(self, tmp_path, compact):
+
+        csv_folder = os.path.join(tmp_path, "etrago_results")
+        shutil.copytree(pytest.etrago_test_network_1_path, csv_folder)
+        cache_dir = os.path.join(tmp_path, "cache")
+        source_hash = get_csv_folder_hash(csv_folder)
+
+        assert ETraGoMinimalData.load(cache_dir, source_hash, compact) is None
+        etrago_network = ETraGoMinimalData(self.etrago_network, compact=compact)
+        etrago_network.save(cache_dir, source_hash)
+        etrago_network_loaded = ETraGoMinimalData.load(cache_dir, source_hash, compact)
+
+        assert isinstance(etrago_network_loaded.links_t._blocks["p0"], np.memmap)
+        pd.testing.assert_index_equal(
+            etrago_network_loaded.snapshots, etrago_network.snapshots
+        )
+        for component in ["storage_units", "stores", "generators", "links", "loads"]:
+            pd.testing.assert_frame_equal(
+                getattr(etrago_network_loaded, component),
+                getattr(etrago_network, component),
+            )
+            for attribute, df in getattr(etrago_network, component + "_t").items():
+                pd.testing.assert_frame_equal(
+                    getattr(etrago_network_loaded, component + "_t")[attribute], df
+                )
+        pd.testing.assert_frame_equal(
+            etrago_network_loaded.get_components("links", "bus0", "4"),
+            etrago_network.get_components("links", "bus0", "4"),
+        )
+
+        # cache is invalid in case the setting or the eTraGo results changed
+        assert ETraGoMinimalData.load(cache_dir, source_hash, not compact) is None
+        with open(os.path.join(csv_folder, "generators.csv"), "a") as f:
+            f.write("\n")
+        assert get_csv_folder_hash(csv_folder) != source_hash
+        assert (
+            ETraGoMinimalData.load(cache_dir, get_csv_folder_hash(csv_folder), compact)
+            is None
+        )
+
+    def test_get_csv_folder_hash(self, tmp_path):
+
+        csv_folder = os.path.join(tmp_path, "etrago_results")
+        shutil.copytree(pytest.etrago_test_network_1_path, csv_folder)
+        source_hash = get_csv_folder_hash(csv_folder)
+        assert get_csv_folder_hash(csv_folder) == source_hash
+
+        # hash changes with the modification time, even if the content does not
+        path = os.path.join(csv_folder, "generators.csv")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert get_csv_folder_hash(csv_folder) != source_hash
+
+    def test_export_and_import_etrago_specs(self, tmp_path):
+        pytest.importorskip("pyarrow")
+
+        bus_ids = [0, 4, 6, 11]
+        export_etrago_specs(
+            bus_ids,
+            ETraGoMinimalData(self.etrago_network),
+            True,
+            0.9,
+            str(tmp_path),
+            chunk_size=3,
+        )
+        assert sorted(os.listdir(os.path.join(tmp_path, "specs"))) == [
+            f"bus_id={bus_id}" for bus_id in sorted(bus_ids, key=str)
+        ]
+
+        for bus_id in bus_ids:
+            etrago_results_per_bus = get_etrago_results_per_bus(
+                bus_id, ETraGoMinimalData(self.etrago_network), True, 0.9
+            )
+            etrago_specs = import_etrago_specs(bus_id, str(tmp_path))
+            assert etrago_specs.keys() == etrago_results_per_bus.keys()
+            for key, value in etrago_results_per_bus.items():
+                logger.info(f"Check Result: {key}")
+                result = etrago_specs[key]
+                if isinstance(value, (pd.DataFrame, pd.Series)) and value.empty:
+                    assert result.empty
+                elif isinstance(value, pd.DataFrame):
+                    pd.testing.assert_frame_equal(result, value, check_freq=False)
+                elif isinstance(value, pd.Series):
+                    pd.testing.assert_series_equal(result, value, check_freq=False)
+                elif isinstance(value, pd.Index):
+                    pd.testing.assert_index_equal(result, value)
+                else:
+                    assert result == value
@@ -0,0 +1,87 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from ego.tools import profiling
+from ego.tools.profiling import (
+    PROFILE_FILE_NAME,
+    profile_stage,
+    read_profiles,
+    write_profile_report,
+)
+
+
+def test_profile_stage(tmpdir):
+    path = os.path.join(tmpdir, PROFILE_FILE_NAME)
+    with profile_stage(path, "outer"):
+        array = np.ones(2 * 10**7)
+        with profile_stage(path, "inner"):
+            with open(os.path.join(tmpdir, "data"), "wb") as f:
+                f.write(b"0" * 10**6)
+        del array
+    with pytest.raises(ValueError):
+        with profile_stage(path, "failed"):
+            raise ValueError("Stage failed.")
+
+    profiles = read_profiles(os.path.dirname(tmpdir), [os.path.basename(tmpdir)])
+    profiles = profiles.set_index("stage")
+    # inner stage is written first, as it finishes first
+    assert profiles.index.tolist() == ["inner", "outer", "failed"]
+    assert profiles.success.tolist() == [True, True, False]
+    assert profiles.at["outer", "wall_time"] >= profiles.at["inner", "wall_time"]
+    assert profiles.at["outer", "cpu_time"] > 0
+    # bytes written in nested stage are also counted for the outer stage
+    assert profiles.at["inner", "bytes_written"] >= 10**6
+    assert profiles.at["outer", "bytes_written"] >= 10**6
+    # peak RSS of outer stage is kept while the inner stage is profiled
+    assert profiles.at["outer", "peak_rss"] >= 16 * 10**7
+
+
+def test_profile_stage_threads(tmpdir):
+    path = os.path.join(tmpdir, PROFILE_FILE_NAME)
+
+    def run(stage):
+        with profile_stage(path, stage):
+            sum(range(10**5))
+
+    threads = [threading.Thread(target=run, args=(str(i),)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    profiles = read_profiles(os.path.dirname(tmpdir), [os.path.basename(tmpdir)])
+    # profiles of stages running at the same time are all saved
+    assert sorted(profiles.stage) == [str(i) for i in range(8)]
+
+
+def test_write_profile_report(tmpdir):
+    for mv_grid_id in [1, 2]:
+        os.makedirs(os.path.join(tmpdir, str(mv_grid_id)))
+        path = os.path.join(tmpdir, str(mv_grid_id), PROFILE_FILE_NAME)
+        for stage in ["1_setup_grid", "save grid_data"]:
+            with profile_stage(path, stage):
+                pass
+
+    # MV grids without profiles are skipped
+    summary = write_profile_report(tmpdir, [1, 2, 3])
+    assert summary.index.tolist() == ["1_setup_grid", "save grid_data"]
+    assert (summary["count"] == 2).all()
+    assert os.path.isfile(os.path.join(tmpdir, "profile.csv"))
+    assert os.path.isfile(os.path.join(tmpdir, "profile_summary.csv"))
+
+
+def test_profile_stage_without_resource(tmpdir, monkeypatch):
+    # platforms without resource module and proc filesystem, e.g. Windows
+    monkeypatch.setattr(profiling, "resource", None)
+    monkeypatch.setattr(profiling, "_read_proc_value", lambda *args: None)
+    path = os.path.join(tmpdir, PROFILE_FILE_NAME)
+    with profile_stage(path, "stage"):
+        sum(range(10**6))
+
+    profiles = read_profiles(os.path.dirname(tmpdir), [os.path.basename(tmpdir)])
+    assert profiles.success.all()
+    assert profiles.cpu_time[0] > 0
+    assert profiles.peak_rss.isna().all()
+    assert profiles.bytes_written.isna().all()